@@ -4,7 +4,7 @@ import os
 from flask import Flask
 from werkzeug.middleware.proxy_fix import ProxyFix
 from config import config
-from app.extensions import cache
+from app.extensions import cache, analysis_executor, celery_init_app
 
 
 def create_app(config_name='development'):
@@ -28,6 +28,9 @@ def create_app(config_name='development'):
 
     # Initialize extensions
     cache.init_app(app)
+    analysis_executor.init_app(app)
+    if app.config.get('CELERY_BROKER_URL'):
+        celery_init_app(app)
 
     # Configure logging
     logging.basicConfig(
@@ -47,6 +50,38 @@ def create_app(config_name='development'):
         local_db=app.local_db  # Pass local_db for analysis results
     )
 
+    # Batch concurrent per-video metadata lookups (detail pages) and share
+    # every fetched batch through the cache in one round-trip
+    from app.services.metadata_coalescer import MetadataCoalescer
+
+    def warm_video_meta_cache(metadata):
+        with app.app_context():
+            cache.set_many(
+                {f'video_meta_{vid}': meta for vid, meta in metadata.items()},
+                timeout=app.config['VIDEO_META_CACHE_TIMEOUT']
+            )
+
+    app.metadata_coalescer = MetadataCoalescer(app.bigquery, on_fetched=warm_video_meta_cache)
+
+    # Initialize the analysis service once so every background analysis reuses
+    # the same analyzers (and their Anthropic HTTP connection pools)
+    app.analysis_service = None
+    if app.config.get('ANTHROPIC_API_KEY'):
+        from app.services.analysis_service import AnalysisService
+        app.analysis_service = AnalysisService(
+            bigquery_service=app.bigquery,
+            anthropic_api_key=app.config['ANTHROPIC_API_KEY'],
+            recommendation_cache=cache,
+            recommendation_cache_timeout=app.config['RECOMMENDATION_CACHE_TIMEOUT'],
+            max_concurrent_requests=app.config['ANTHROPIC_MAX_CONCURRENT_REQUESTS'],
+            requests_per_minute=app.config['ANTHROPIC_REQUESTS_PER_MINUTE'],
+            input_tokens_per_minute=app.config['ANTHROPIC_INPUT_TOKENS_PER_MINUTE'],
+            max_retries=app.config['ANTHROPIC_MAX_RETRIES'],
+            fetch_cache_timeout=app.config['ANALYSIS_FETCH_CACHE_TIMEOUT'],
+            combine_script_description=app.config['ANALYSIS_COMBINE_SCRIPT_DESCRIPTION'],
+            combine_script_conversion=app.config['ANALYSIS_COMBINE_SCRIPT_CONVERSION']
+        )
+
     # Initialize analytics service
     from app.services.analytics_service import AnalyticsService
     app.activity_logger = AnalyticsService(
@@ -82,6 +117,11 @@ def create_app(config_name='development'):
     except Exception as e:
         logging.warning(f"Could not seed approved brands: {e}")
 
+    # Keep dashboard overview data warm in the cache
+    if app.config.get('DASHBOARD_REFRESH_ENABLED'):
+        from app.jobs.dashboard_refresh import init_dashboard_refresh
+        app.dashboard_scheduler = init_dashboard_refresh(app)
+
     # Initialize OAuth
     from app.blueprints.auth import init_oauth
     init_oauth(app)
@@ -1,8 +1,10 @@
 """Analysis blueprint - trigger and monitor analysis jobs."""
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify, session
+import sqlite3
 import uuid
 from datetime import datetime
 from app.blueprints.auth import login_required
+from app.jobs.analysis import get_analysis_service
 
 bp = Blueprint('analysis', __name__, url_prefix='/analysis')
 
@@ -23,8 +25,6 @@ def trigger_analysis():
     """
     Execute batch analysis based on form input.
     """
-    from app.services.analysis_service import AnalysisService
-
     # Get form data
     video_id = request.form.get('video_id')
     channel_code = request.form.get('channel_code')
@@ -62,11 +62,8 @@ def trigger_analysis():
         else:
             current_app.activity_logger.log_batch_analysis(email, len(video_ids), channel_code)
 
-    # Create analysis service
-    analysis_service = AnalysisService(
-        bigquery_service=current_app.bigquery,
-        anthropic_api_key=current_app.config['ANTHROPIC_API_KEY']
-    )
+    # Shared analysis service (built once at startup)
+    analysis_service = get_analysis_service(current_app)
 
     # Create job
     job_id = str(uuid.uuid4())
@@ -84,16 +81,21 @@ def trigger_analysis():
     }
     jobs[job_id] = job
 
+    def update_job(completed, total, vid):
+        job['current_video'] = vid
+        job['processed_videos'] = completed
+        job['progress'] = int((completed / total) * 100)
+
     # Run analysis in background (simplified - should use Celery/APScheduler)
-    # For now, we'll run synchronously with progress updates
+    # For now, we'll run synchronously, several videos at a time
     try:
-        for idx, vid in enumerate(video_ids):
-            job['current_video'] = vid
-            job['processed_videos'] = idx
-            job['progress'] = int((idx / len(video_ids)) * 100)
-
-            # Run analysis
-            analysis_service.analyze_video(vid, analysis_types)
+        # Only the count is needed, so results are dropped as they arrive
+        succeeded = sum(1 for _ in analysis_service.batch_analyze_iter(
+            video_ids,
+            analysis_types,
+            max_workers=current_app.config['MAX_CONCURRENT_ANALYSES'],
+            progress_callback=update_job
+        ))
 
         # Mark as completed
         job['status'] = 'completed'
@@ -101,7 +103,11 @@ def trigger_analysis():
         job['processed_videos'] = len(video_ids)
         job['completed_at'] = datetime.now()
 
-        flash(f'Analysis completed for {len(video_ids)} videos', 'success')
+        failed = len(video_ids) - succeeded
+        if failed:
+            flash(f'Analysis completed for {succeeded} videos ({failed} failed, see server logs)', 'warning')
+        else:
+            flash(f'Analysis completed for {len(video_ids)} videos', 'success')
 
     except Exception as e:
         job['status'] = 'failed'
@@ -143,7 +149,6 @@ def history():
 
     # Set row factory for SQLite to get dict-like access
     if not current_app.local_db.use_postgres:
-        import sqlite3
         conn.row_factory = sqlite3.Row
 
     cursor = conn.cursor()
@@ -1,7 +1,14 @@
 """API blueprint - JSON endpoints for AJAX requests."""
+import logging
+import os
+import threading
+import traceback
 from flask import Blueprint, jsonify, request, current_app, session
 from app.extensions import cache
 from app.blueprints.auth import login_required
+from app.jobs.analysis import run_tracked_analysis
+
+logger = logging.getLogger(__name__)
 
 bp = Blueprint('api', __name__)
 
@@ -246,8 +253,6 @@ def trigger_analysis():
             'message': 'Analysis is already in progress for this video'
         })
 
-    import threading
-
     cache.set(f'analyzing_{video_id}', True, timeout=600)  # 10 min timeout
     cache.set(f'analysis_progress_{video_id}', {
         'step': 'starting',
@@ -271,63 +276,14 @@ def trigger_analysis():
     analyzing_list.append(video_info)
     cache.set('analyzing_videos_list', analyzing_list, timeout=700)  # Slightly longer than analysis timeout
 
+    # Run on the shared analysis pool; only the app (not the request) is handed over
     app = current_app._get_current_object()
-
-    def run_analysis():
-        def progress_callback(step, progress, message):
-            """Update progress in cache."""
-            with app.app_context():
-                cache.set(f'analysis_progress_{video_id}', {
-                    'step': step,
-                    'progress': progress,
-                    'message': message
-                }, timeout=600)
-
-        try:
-            with app.app_context():
-                from app.services.analysis_service import AnalysisService
-
-                analysis_service = AnalysisService(
-                    bigquery_service=app.bigquery,
-                    anthropic_api_key=app.config['ANTHROPIC_API_KEY']
-                )
-
-                # Calculate progress increments based on selected types
-                total_steps = len(analysis_types)
-                step_progress = 80 // max(total_steps, 1)  # Reserve 20% for start/end
-
-                progress_callback('starting', 5, 'Fetching video data...')
-
-                # Run analysis with progress updates
-                result = analysis_service.analyze_video(
-                    video_id,
-                    analysis_types,
-                    progress_callback=progress_callback
-                )
-
-                if result:
-                    progress_callback('completed', 100, 'Analysis complete!')
-                else:
-                    cache.set(f'analysis_error_{video_id}', 'Analysis failed. Check server logs.', timeout=300)
-
-        except Exception as e:
-            import traceback
-            import logging
-            logger = logging.getLogger(__name__)
-            error_msg = str(e)
-            logger.error(f"Analysis error for {video_id}: {error_msg}")
-            logger.error(traceback.format_exc())
-            with app.app_context():
-                cache.set(f'analysis_error_{video_id}', error_msg, timeout=300)
-        finally:
-            with app.app_context():
-                cache.delete(f'analyzing_{video_id}')
-                cache.delete(f'analysis_progress_{video_id}')
-                cache.delete(f'video_detail_{video_id}')  # Invalidate video cache
-
-    thread = threading.Thread(target=run_analysis)
-    thread.daemon = True
-    thread.start()
+    if app.extensions['analysis_executor'].submit(run_tracked_analysis, app, video_id, analysis_types) is None:
+        cache.delete_many(f'analyzing_{video_id}', f'analysis_progress_{video_id}')
+        return jsonify({
+            'status': 'queue_full',
+            'message': 'Analysis queue is full. Please try again in a few minutes.'
+        }), 503
 
     return jsonify({
         'status': 'started',
@@ -424,10 +380,6 @@ def transcribe_video():
     if not generate_transcript and not analyze_emotions and not analyze_frames and not generate_insights:
         return jsonify({'error': 'At least one option must be selected'}), 400
 
-    import os
-    import logging
-    logger = logging.getLogger(__name__)
-
     # Get existing data
     existing = current_app.local_db.get_transcript(video_id)
 
@@ -477,7 +429,6 @@ def transcribe_video():
             })
         except Exception as e:
             logger.error(f"Error generating insights: {str(e)}")
-            import traceback
             logger.error(traceback.format_exc())
             return jsonify({'error': f'Failed to generate insights: {str(e)}'}), 500
 
@@ -504,7 +455,6 @@ def transcribe_video():
         return jsonify({'error': 'No download method available. Set RAPIDAPI_KEY or install yt-dlp.'}), 500
 
     from app.services.transcription_service import TranscriptionService
-    import threading
 
     # Log transcription start
     email = session.get('user_email')
@@ -593,7 +543,6 @@ def transcribe_video():
                     with app.app_context():
                         cache.set(f'transcribe_error_{video_id}', 'Processing failed. Check server logs.', timeout=300)
         except Exception as e:
-            import traceback
             error_msg = str(e)
             logger.error(f"Transcription error for {video_id}: {error_msg}")
             logger.error(traceback.format_exc())
@@ -603,7 +552,10 @@ def transcribe_video():
             with app.app_context():
                 cache.delete(f'transcribing_{video_id}')
                 cache.delete(f'transcribe_progress_{video_id}')
-                cache.delete(f'video_detail_{video_id}')  # Invalidate video cache
+                cache.delete(f'video_detail_v2_{video_id}')  # Invalidate video cache
+            # The next analysis should see the video's freshly fetched data
+            if app.analysis_service:
+                app.analysis_service.invalidate_video(video_id)
 
     thread = threading.Thread(target=run_transcription)
     thread.daemon = True
@@ -814,8 +766,6 @@ def regenerate_insights(video_id):
     Returns:
         {"status": "success|error", "message": "...", "insights": {...}}
     """
-    import os
-
     # Get existing transcript data
     transcript_data = current_app.local_db.get_transcript(video_id)
     if not transcript_data:
@@ -845,9 +795,6 @@ def regenerate_insights(video_id):
             'message': 'ANTHROPIC_API_KEY not configured.'
         }), 500
 
-    import logging
-    logger = logging.getLogger(__name__)
-
     try:
         from app.services.multimodal_analyzer import MultimodalAnalyzer
 
@@ -910,7 +857,6 @@ def regenerate_insights(video_id):
             }), 500
 
     except Exception as e:
-        import traceback
         logger.error(f"Error regenerating insights for {video_id}: {str(e)}")
         logger.error(traceback.format_exc())
         return jsonify({
@@ -956,8 +902,6 @@ def fetch_comments():
 
     # Run in background thread for batch operations
     if len(video_ids) > 1:
-        import threading
-
         cache.set('fetching_comments', True, timeout=600)
         cache.set('comments_progress', {
             'total': len(video_ids),
@@ -991,8 +935,7 @@ def fetch_comments():
                         'done': True
                     }, timeout=300)
             except Exception as e:
-                import logging
-                logging.getLogger(__name__).error(f"Batch comments error: {e}")
+                logger.error(f"Batch comments error: {e}")
             finally:
                 with app.app_context():
                     cache.delete('fetching_comments')
@@ -1073,8 +1016,6 @@ def score_cta():
     Returns:
         {"status": "started|completed", "scores": {...}}
     """
-    import threading
-
     data = request.get_json()
     videos = data.get('videos', [])
 
@@ -1170,8 +1111,7 @@ def score_cta():
                     'current': None, 'done': True
                 }, timeout=300)
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Batch CTA scoring error: {e}")
+            logger.error(f"Batch CTA scoring error: {e}")
         finally:
             with app.app_context():
                 cache.delete('cta_scoring_active')
@@ -1,13 +1,28 @@
 """Dashboard blueprint - main overview and video list pages."""
-import csv
 import io
+import pandas as pd
 from flask import Blueprint, render_template, request, current_app, redirect, url_for, session, Response, jsonify
 from app.extensions import cache
+from app.models import Video
+from app.utils.cache_codec import fast_cache_get, fast_cache_set
+from app.utils.optimization import compute_optimization_opportunities
 from app.blueprints.auth import login_required
+from app.jobs.dashboard_refresh import (
+    DASHBOARD_STATS_KEY, DASHBOARD_RECENT_VIDEOS_KEY, RECENT_VIDEOS_LIMIT
+)
 
 bp = Blueprint('dashboard', __name__)
 
 
+def _get_dropdown_values():
+    """Get channel and silo dropdown values, cached for 10 minutes under one key."""
+    dropdowns = cache.get('dropdowns_v1')
+    if dropdowns is None:
+        dropdowns = current_app.bigquery.get_dropdown_values()
+        cache.set('dropdowns_v1', dropdowns, timeout=600)
+    return dropdowns
+
+
 @bp.route('/')
 def index():
     """Landing page - redirect to login or dashboard."""
@@ -32,11 +47,19 @@ def overview():
     if email and current_app.activity_logger:
         current_app.activity_logger.log_view_dashboard(email)
 
-    # Get dashboard statistics from BigQuery
-    stats = current_app.bigquery.get_dashboard_stats()
+    # Dashboard statistics and recent videos are refreshed in the background;
+    # fall back to BigQuery if the cache hasn't been warmed yet
+    timeout = current_app.config['DASHBOARD_CACHE_TIMEOUT']
+    stats = cache.get(DASHBOARD_STATS_KEY)
+    if stats is None:
+        stats = current_app.bigquery.get_dashboard_stats()
+        cache.set(DASHBOARD_STATS_KEY, stats, timeout=timeout)
 
     # Get recent videos (top 10)
-    recent_videos = current_app.bigquery.get_videos(limit=10, has_analysis=True)
+    recent_videos = fast_cache_get(DASHBOARD_RECENT_VIDEOS_KEY, Video)
+    if recent_videos is None:
+        recent_videos = current_app.bigquery.get_videos(limit=RECENT_VIDEOS_LIMIT, has_analysis=True)
+        fast_cache_set(DASHBOARD_RECENT_VIDEOS_KEY, recent_videos, timeout=timeout)
 
     return render_template(
         'dashboard/overview.html',
@@ -80,8 +103,8 @@ def videos_list():
     offset = (page - 1) * per_page
 
     # Create cache key for this specific query
-    cache_key = f'videos_list_{page}_{channel_code}_{video_id}_{has_analysis}'
-    cached_videos = cache.get(cache_key)
+    cache_key = f'videos_list_v2_{page}_{channel_code}_{video_id}_{has_analysis}'
+    cached_videos = fast_cache_get(cache_key, Video)
 
     if cached_videos is not None:
         videos = cached_videos
@@ -95,18 +118,23 @@ def videos_list():
             has_analysis=has_analysis
         )
         # Cache for 2 minutes
-        cache.set(cache_key, videos, timeout=120)
+        fast_cache_set(cache_key, videos, timeout=120)
 
-    # Check which videos are currently being analyzed
-    analyzing_videos = {}
-    for video in videos:
-        analyzing_videos[video.video_id] = cache.get(f'analyzing_{video.video_id}') or False
+    # Check which videos are currently being analyzed (one cache round-trip)
+    flags = cache.get_many(*[f'analyzing_{video.video_id}' for video in videos]) if videos else []
+    analyzing_videos = {
+        video.video_id: flag or False for video, flag in zip(videos, flags)
+    }
+
+    # Get stored transcript info for the whole page in one query
+    transcript_summary = {}
+    if current_app.local_db and videos:
+        transcript_summary = current_app.local_db.get_transcripts_summary_batch(
+            [v.video_id for v in videos]
+        )
 
     # Get all available channels for dropdown (cached for 10 minutes)
-    all_channels = cache.get('all_channels')
-    if all_channels is None:
-        all_channels = current_app.bigquery.get_all_channels()
-        cache.set('all_channels', all_channels, timeout=600)
+    all_channels = _get_dropdown_values()['channels']
 
     # Get total count for pagination (simplified)
     has_more = len(videos) == per_page
@@ -120,6 +148,7 @@ def videos_list():
         video_id_filter=video_id,
         has_analysis_filter=has_analysis,
         analyzing_videos=analyzing_videos,
+        transcript_summary=transcript_summary,
         all_channels=all_channels
     )
 
@@ -197,15 +226,9 @@ def conversion_audit():
             row['preferred_brand'] = preferred_brands.get(silo, preferred_brands.get(silo.lower(), ''))
 
     # Get filter dropdowns (cached)
-    all_channels = cache.get('all_channels')
-    if all_channels is None:
-        all_channels = current_app.bigquery.get_all_channels()
-        cache.set('all_channels', all_channels, timeout=600)
-
-    all_silos = cache.get('all_silos')
-    if all_silos is None:
-        all_silos = current_app.bigquery.get_all_silos()
-        cache.set('all_silos', all_silos, timeout=600)
+    dropdowns = _get_dropdown_values()
+    all_channels = dropdowns['channels']
+    all_silos = dropdowns['silos']
 
     has_more = len(audit_data) == per_page
 
@@ -227,6 +250,37 @@ def conversion_audit():
     )
 
 
+# Conversion audit export: row key -> CSV header (in column order)
+CSV_EXPORT_COLUMNS = {
+    'video_id': 'Video ID',
+    'title': 'Title',
+    'channel': 'Channel',
+    'keyword': 'Keyword',
+    'silo': 'Silo',
+    'avg_monthly_revenue': 'Avg Monthly Revenue (90d)',
+    'avg_monthly_views': 'Avg Monthly Views (90d)',
+    'epc_90d': 'EPC (90d)',
+    'conversion_rate': 'Conversion Rate %',
+    'desc_ctr': 'Desc CTR %',
+    'pinned_ctr': 'Pinned CTR %',
+    'thumbnail_ctr': 'Thumbnail CTR %',
+    'rank': 'Rank',
+    'desc_brand': 'Desc Brand',
+    'comment_brand': 'Comment Brand',
+    'brand_revenue': 'Rev by Brand',
+    'description': 'Description',
+}
+
+
+def _format_brand_revenue(brand_revenue):
+    """Format brand revenue as a "Brand: $amount; ..." string (top 5)."""
+    if not isinstance(brand_revenue, list) or not brand_revenue:
+        return ''
+    return '; '.join(
+        f"{br['brand']}: ${br['revenue']:.2f}" for br in brand_revenue[:5]
+    )
+
+
 @bp.route('/dashboard/conversion-audit/export')
 @login_required
 def conversion_audit_export():
@@ -250,42 +304,22 @@ def conversion_audit_export():
         sort_dir=sort_dir
     )
 
-    # Build CSV
+    # Build CSV with pandas (column-wise formatting instead of a per-row loop)
+    df = pd.DataFrame(audit_data, columns=list(CSV_EXPORT_COLUMNS), dtype=object)
+    df['epc_90d'] = df['epc_90d'].fillna(0)
+    for col in ('rank', 'desc_brand', 'comment_brand'):
+        df[col] = df[col].where(df[col].notna() & df[col].astype(bool), '')
+    df['brand_revenue'] = df['brand_revenue'].map(_format_brand_revenue)
+    df['description'] = (
+        df['description'].fillna('').astype(str)
+        .str.slice(0, 500)
+        .str.replace('\n', ' ', regex=False)
+        .str.replace('\r', '', regex=False)
+    )
+    df = df.rename(columns=CSV_EXPORT_COLUMNS)
+
     output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        'Video ID', 'Title', 'Channel', 'Keyword', 'Silo',
-        'Avg Monthly Revenue (90d)', 'Avg Monthly Views (90d)',
-        'EPC (90d)', 'Conversion Rate %', 'Desc CTR %', 'Pinned CTR %',
-        'Thumbnail CTR %', 'Rank', 'Desc Brand', 'Comment Brand',
-        'Rev by Brand', 'Description'
-    ])
-    for row in audit_data:
-        # Format brand revenue as "Brand: $amount" list
-        brand_rev_str = ''
-        if row.get('brand_revenue'):
-            brand_rev_str = '; '.join(
-                f"{br['brand']}: ${br['revenue']:.2f}" for br in row['brand_revenue'][:5]
-            )
-        writer.writerow([
-            row['video_id'],
-            row['title'],
-            row['channel'],
-            row['keyword'],
-            row['silo'],
-            row['avg_monthly_revenue'],
-            row['avg_monthly_views'],
-            row.get('epc_90d', 0),
-            row['conversion_rate'],
-            row['desc_ctr'],
-            row['pinned_ctr'],
-            row['thumbnail_ctr'],
-            row.get('rank') or '',
-            row.get('desc_brand') or '',
-            row.get('comment_brand') or '',
-            brand_rev_str,
-            row['description'][:500].replace('\n', ' ').replace('\r', '') if row['description'] else ''
-        ])
+    df.to_csv(output, index=False, lineterminator='\r\n')
 
     csv_content = output.getvalue()
     output.close()
@@ -300,12 +334,6 @@ def conversion_audit_export():
     )
 
 
-def compute_optimization_opportunity(revenue_potential, current_revenue, quality_score):
-    """(Revenue Potential - Current Revenue) x (100 - Quality Score) / 100"""
-    gap = max((revenue_potential or 0) - (current_revenue or 0), 0)
-    return round(gap * (100 - (quality_score or 0)) / 100, 2)
-
-
 @bp.route('/dashboard/script-scores')
 @login_required
 def script_scores_library():
@@ -343,33 +371,31 @@ def script_scores_library():
         metadata = current_app.bigquery.get_video_metadata_batch(video_ids)
         cache.set(cache_key, metadata, timeout=600)
 
-    # 3. Merge and compute optimization opportunity
+    # 3. Merge and compute optimization opportunity (vectorized over all rows)
+    metas = [metadata.get(s['video_id'], {}) for s in all_scores]
+    opportunities = compute_optimization_opportunities(
+        [meta.get('revenue_potential', 0) for meta in metas],
+        [meta.get('avg_monthly_revenue', 0) for meta in metas],
+        [s.get('quality_score_total') for s in all_scores]
+    )
     merged = []
-    channels_set = set()
-    silos_set = set()
-    for s in all_scores:
-        vid = s['video_id']
-        meta = metadata.get(vid, {})
+    for s, meta, opportunity in zip(all_scores, metas, opportunities):
         row = {**s, **meta}
-        # Compute optimization opportunity
-        row['optimization_opportunity'] = compute_optimization_opportunity(
-            meta.get('revenue_potential', 0),
-            meta.get('avg_monthly_revenue', 0),
-            s.get('quality_score_total')
-        )
+        row['optimization_opportunity'] = opportunity
         row['revenue_potential'] = meta.get('revenue_potential', 0)
         row['avg_monthly_revenue'] = meta.get('avg_monthly_revenue', 0)
         # Get top fix action item
         items = s.get('action_items', [])
         row['top_fix'] = items[0].get('action', '') if items else ''
 
-        if meta.get('channel'):
-            channels_set.add(meta['channel'])
-        if meta.get('silo'):
-            silos_set.add(meta['silo'])
-
         merged.append(row)
 
+    # Filter dropdowns from the scored videos' metadata
+    dropdowns = {
+        'channels': sorted({m['channel'] for m in metadata.values() if m.get('channel')}),
+        'silos': sorted({m['silo'] for m in metadata.values() if m.get('silo')}),
+    }
+
     # 4. Apply filters
     if channel_filter:
         merged = [r for r in merged if r.get('channel') == channel_filter]
@@ -414,8 +440,8 @@ def script_scores_library():
         gates_filter=gates_filter,
         sort_by=sort_by,
         sort_dir=sort_dir,
-        all_channels=sorted(channels_set),
-        all_silos=sorted(silos_set)
+        all_channels=dropdowns['channels'],
+        all_silos=dropdowns['silos']
     )
 
 
@@ -1,15 +1,17 @@
 """Videos blueprint - individual video detail pages."""
-from flask import Blueprint, render_template, redirect, url_for, flash, current_app, request, session
+import logging
+from flask import Blueprint, render_template, redirect, url_for, flash, current_app, request, session, make_response
+from google.cloud.exceptions import GoogleCloudError
 from app.extensions import cache
+from app.models import AnalysisResults
+from app.utils.cache_codec import decode_cached, fast_cache_set
+from app.utils.optimization import compute_optimization_opportunity
 from app.blueprints.auth import login_required
+from app.jobs.analysis import enqueue_video_analysis, enqueue_detail_refresh
 
-bp = Blueprint('videos', __name__, url_prefix='/videos')
-
+logger = logging.getLogger(__name__)
 
-def compute_optimization_opportunity(revenue_potential, current_revenue, quality_score):
-    """Compute optimization opportunity: (Revenue Potential - Current Revenue) x (100 - Quality Score) / 100"""
-    gap = max((revenue_potential or 0) - (current_revenue or 0), 0)
-    return round(gap * (100 - (quality_score or 0)) / 100, 2)
+bp = Blueprint('videos', __name__, url_prefix='/videos')
 
 
 @bp.route('/<video_id>')
@@ -21,34 +23,48 @@ def detail(video_id):
     Args:
         video_id: YouTube video ID
     """
-    # Check if analysis is in progress
-    is_analyzing = cache.get(f'analyzing_{video_id}') or False
-    is_transcribing = cache.get(f'transcribing_{video_id}') or False
+    # Cache key for this video's analysis data (JSON payload, see cache_codec)
+    cache_key = f'video_detail_v2_{video_id}'
 
-    # Cache key for this video's analysis data
-    cache_key = f'video_detail_{video_id}'
-
-    # Allow force refresh with ?refresh=1
+    # Allow force refresh with ?refresh=1 (the cached analysis isn't read, and
+    # the fresh fetch below overwrites it)
     force_refresh = request.args.get('refresh') == '1'
-    if force_refresh:
-        cache.delete(cache_key)
+
+    # Progress flags and cached analysis in one cache round-trip
+    keys = [f'analyzing_{video_id}', f'transcribing_{video_id}']
+    if not force_refresh:
+        keys.append(cache_key)
+    values = cache.get_many(*keys)
+    is_analyzing = values[0] or False
+    is_transcribing = values[1] or False
+    cached_payload = None if force_refresh else values[2]
+
+    # Unreadable payloads (e.g. left by an older release) count as a miss
+    cached_analysis = decode_cached(cached_payload, AnalysisResults, cache_key)
+
+    is_stale = False
 
     # Only use cache if no operation is in progress and not forcing refresh
     if not is_analyzing and not is_transcribing and not force_refresh:
-        cached_analysis = cache.get(cache_key)
         if cached_analysis:
             analysis = cached_analysis
         else:
             analysis = current_app.bigquery.get_latest_analysis(video_id)
             if analysis and analysis.video:
                 # Cache for 2 minutes (reduced from 5)
-                cache.set(cache_key, analysis, timeout=120)
+                fast_cache_set(cache_key, analysis, timeout=120)
+    elif cached_analysis:
+        # Operation in progress - serve the last cached result right away and
+        # refresh it in the background instead of blocking every poll on BigQuery
+        analysis = cached_analysis
+        is_stale = True
+        enqueue_detail_refresh(current_app._get_current_object(), video_id)
     else:
         # Operation in progress or force refresh - always fetch fresh data
         analysis = current_app.bigquery.get_latest_analysis(video_id)
         # Update cache with fresh data
         if analysis and analysis.video and not is_analyzing and not is_transcribing:
-            cache.set(cache_key, analysis, timeout=120)
+            fast_cache_set(cache_key, analysis, timeout=120)
 
     if not analysis or not analysis.video:
         flash(f'Video not found: {video_id}', 'error')
@@ -70,48 +86,50 @@ def detail(video_id):
     if current_app.local_db:
         script_score = current_app.local_db.get_script_score(video_id)
 
-    # Compute optimization opportunity if script score exists
+    # Compute optimization opportunity if script score exists; unscored videos
+    # skip the metadata lookup entirely
     optimization_opportunity = None
     opt_opp_details = None
-    if script_score and script_score.get('quality_score_total') is not None:
-        try:
-            meta = current_app.bigquery.get_video_metadata_batch([video_id])
-            if video_id in meta:
-                m = meta[video_id]
-                rev_potential = m['revenue_potential']
-                current_rev = m['avg_monthly_revenue']
-                quality = script_score['quality_score_total']
-                optimization_opportunity = compute_optimization_opportunity(
-                    rev_potential, current_rev, quality
-                )
-                opt_opp_details = {
-                    'revenue_potential': rev_potential,
-                    'current_revenue': current_rev,
-                    'quality_score': quality,
-                    'best_video_id': m.get('best_video_id', ''),
-                    'keyword': m.get('main_keyword', ''),
-                }
-        except Exception:
-            pass
-
-    return render_template(
+    quality = script_score.get('quality_score_total') if script_score else None
+    if quality is not None:
+        # Metadata is cached per video; the coalescer warms the cache on a miss
+        m = cache.get(f'video_meta_{video_id}')
+        if m is None:
+            try:
+                m = current_app.metadata_coalescer.get(video_id)
+            except GoogleCloudError as e:
+                logger.warning(f"Metadata lookup failed for {video_id}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Unexpected error looking up metadata for {video_id}: {str(e)}")
+        if m:
+            rev_potential = m.get('revenue_potential', 0)
+            current_rev = m.get('avg_monthly_revenue', 0)
+            optimization_opportunity = compute_optimization_opportunity(
+                rev_potential, current_rev, quality
+            )
+            opt_opp_details = {
+                'revenue_potential': rev_potential,
+                'current_revenue': current_rev,
+                'quality_score': quality,
+                'best_video_id': m.get('best_video_id', ''),
+                'keyword': m.get('main_keyword', ''),
+            }
+
+    # The template reads each section straight off the AnalysisResults object
+    response = make_response(render_template(
         'videos/detail.html',
         analysis=analysis,
-        video=analysis.video,
-        revenue_metrics=analysis.revenue_metrics,
-        script_analysis=analysis.script_analysis,
-        affiliate_recs=analysis.affiliate_recommendations,
-        description_analysis=analysis.description_analysis,
-        conversion_analysis=analysis.conversion_analysis,
-        affiliate_performance=analysis.affiliate_performance,
-        existing_links=analysis.existing_links_analysis,
         transcript_data=transcript_data,
         script_score=script_score,
         optimization_opportunity=optimization_opportunity,
         opt_opp_details=opt_opp_details,
-        is_analyzing=is_analyzing,
-        is_transcribing=is_transcribing
-    )
+        status={'analyzing': is_analyzing, 'transcribing': is_transcribing},
+        refresh_pending=is_stale
+    ))
+    if is_stale:
+        # Lets clients decide whether to re-request with ?refresh=1
+        response.headers['X-Analysis-Stale'] = 'true'
+    return response
 
 
 @bp.route('/<video_id>/analyze', methods=['POST'])
@@ -123,47 +141,9 @@ def analyze_single(video_id):
     Args:
         video_id: YouTube video ID
     """
-    # Import here to avoid circular dependency
-    from app.services.analysis_service import AnalysisService
-    import threading
-
-    # CRITICAL: Get app reference BEFORE defining thread function
-    # Must be done while still in request context
+    # Get app reference while still in request context
     app = current_app._get_current_object()
 
-    def run_analysis():
-        """Run analysis in background thread."""
-        import logging
-        logger = logging.getLogger(__name__)
-
-        try:
-            with app.app_context():
-                # Create analysis service INSIDE the app context
-                analysis_service = AnalysisService(
-                    bigquery_service=app.bigquery,
-                    anthropic_api_key=app.config['ANTHROPIC_API_KEY']
-                )
-
-                # Run analysis
-                result = analysis_service.analyze_video(
-                    video_id=video_id,
-                    analysis_types=['script', 'description', 'affiliate', 'conversion']
-                )
-                # Invalidate cache for this video
-                cache.delete(f'video_detail_{video_id}')
-                # Clear analyzing flag
-                cache.delete(f'analyzing_{video_id}')
-                logger.info(f'Background analysis completed for {video_id}')
-        except Exception as e:
-            logger.error(f'Background analysis failed for {video_id}: {str(e)}')
-            # Clear analyzing flag even on error
-            try:
-                with app.app_context():
-                    cache.delete(f'analyzing_{video_id}')
-            except:
-                # If clearing flag fails, it will expire after 10 minutes anyway
-                pass
-
     # Log analysis start
     email = session.get('user_email')
     if email and current_app.activity_logger:
@@ -174,10 +154,11 @@ def analyze_single(video_id):
     # Set analyzing flag in cache (expires in 10 minutes)
     cache.set(f'analyzing_{video_id}', True, timeout=600)
 
-    # Start analysis in background thread
-    thread = threading.Thread(target=run_analysis)
-    thread.daemon = True
-    thread.start()
+    # Queue analysis on the Celery worker or the shared background pool
+    if not enqueue_video_analysis(app, video_id):
+        cache.delete(f'analyzing_{video_id}')
+        flash('Analysis queue is full. Please try again in a few minutes.', 'warning')
+        return redirect(url_for('videos.detail', video_id=video_id))
 
     # Redirect immediately with message
     flash(f'Analysis started! This takes 2-3 minutes. Refresh this page to see results.', 'info')
@@ -1,5 +1,85 @@
 """Flask extensions."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from celery import Celery, Task
 from flask_caching import Cache
 
+
+class AnalysisExecutor:
+    """Shared thread pool for background video analyses.
+
+    Reuses worker threads across requests and caps how many analyses can be
+    running or waiting at once, so a burst of "Analyze" clicks can't spawn an
+    unbounded number of Claude/BigQuery calls.
+    """
+
+    def __init__(self, app=None):
+        self._executor = None
+        self._slots = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Create the pool from app config and register it on the app."""
+        max_workers = app.config['MAX_CONCURRENT_ANALYSES']
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='analysis'
+        )
+        self._slots = threading.BoundedSemaphore(
+            max_workers + app.config['ANALYSIS_QUEUE_SIZE']
+        )
+        app.extensions['analysis_executor'] = self
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Submit a job to the pool.
+
+        Returns:
+            Future for the job, or None if the pool and its queue are full
+        """
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+def celery_init_app(app):
+    """
+    Create a Celery app bound to the Flask app.
+
+    Every task runs inside a Flask app context, so tasks can use
+    current_app, the cache and the app's services like request handlers do.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Configured Celery application
+    """
+    class FlaskTask(Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+
+    celery_app = Celery(app.name, task_cls=FlaskTask)
+    celery_app.conf.update(
+        broker_url=app.config['CELERY_BROKER_URL'],
+        task_ignore_result=True,
+        task_acks_late=True,  # Re-deliver analyses interrupted by a worker restart
+        worker_prefetch_multiplier=1,
+    )
+    celery_app.set_default()
+    app.extensions['celery'] = celery_app
+    return celery_app
+
+
 # Initialize extensions
 cache = Cache()
+analysis_executor = AnalysisExecutor()
@@ -0,0 +1,163 @@
+"""Background video analysis jobs.
+
+Analyses run either on a Celery worker (when CELERY_BROKER_URL is set) or on
+the in-process analysis thread pool.
+"""
+import logging
+import traceback
+from functools import partial
+
+from celery import shared_task
+from flask import current_app
+
+from app.extensions import cache
+from app.utils.cache_codec import fast_cache_set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANALYSIS_TYPES = ['script', 'description', 'affiliate', 'conversion']
+
+# Detail-page cache lifetime for refreshed analyses (seconds)
+DETAIL_CACHE_TIMEOUT = 120
+
+
+def get_analysis_service(app):
+    """
+    Get the app's shared AnalysisService.
+
+    Raises:
+        Exception if ANTHROPIC_API_KEY is not configured
+    """
+    if app.analysis_service is None:
+        raise Exception('ANTHROPIC_API_KEY not configured')
+    return app.analysis_service
+
+
+def _clear_analysis_keys(video_id, *extra_keys):
+    """Drop a video's cached detail/metadata, its analyzing flag and any extra keys in one call."""
+    cache.delete_many(
+        f'video_detail_v2_{video_id}',
+        f'video_meta_{video_id}',
+        f'analyzing_{video_id}',
+        *extra_keys
+    )
+
+
+def run_video_analysis(app, video_id):
+    """Run a full analysis for one video and clear its cache entries."""
+    try:
+        with app.app_context():
+            # Run analysis
+            # A user asked for this re-analysis, so don't serve cached Claude output
+            get_analysis_service(app).analyze_video(
+                video_id=video_id,
+                analysis_types=DEFAULT_ANALYSIS_TYPES,
+                use_cache=False
+            )
+            # Invalidate cache for this video and clear the analyzing flag
+            _clear_analysis_keys(video_id)
+            logger.info(f'Background analysis completed for {video_id}')
+    except Exception as e:
+        logger.error(f'Background analysis failed for {video_id}: {str(e)}')
+        # Clear analyzing flag even on error (some results may have been stored)
+        try:
+            with app.app_context():
+                _clear_analysis_keys(video_id)
+        except:
+            # If clearing flag fails, it will expire after 10 minutes anyway
+            pass
+
+
+def _report_progress(video_id, step, progress, message):
+    """Store analysis progress for status polling (caller holds an app context)."""
+    cache.set(f'analysis_progress_{video_id}', {
+        'step': step,
+        'progress': progress,
+        'message': message
+    }, timeout=600)
+
+
+def run_tracked_analysis(app, video_id, analysis_types):
+    """
+    Run an analysis with progress reporting for the JSON status endpoints.
+
+    Args:
+        app: Flask application instance
+        video_id: YouTube video ID
+        analysis_types: Analysis types to run
+    """
+    with app.app_context():
+        try:
+            progress_callback = partial(_report_progress, video_id)
+            progress_callback('starting', 5, 'Fetching video data...')
+
+            # Run analysis with progress updates
+            # User-triggered, so every step makes a fresh Claude request
+            result = get_analysis_service(app).analyze_video(
+                video_id,
+                analysis_types,
+                progress_callback=progress_callback,
+                use_cache=False
+            )
+
+            if result:
+                progress_callback('completed', 100, 'Analysis complete!')
+            else:
+                cache.set(f'analysis_error_{video_id}', 'Analysis failed. Check server logs.', timeout=300)
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Analysis error for {video_id}: {error_msg}")
+            logger.error(traceback.format_exc())
+            cache.set(f'analysis_error_{video_id}', error_msg, timeout=300)
+        finally:
+            _clear_analysis_keys(video_id, f'analysis_progress_{video_id}')
+
+
+@shared_task(name='analyze_video', ignore_result=True)
+def analyze_video_task(video_id):
+    """Celery task wrapper around run_video_analysis (runs in an app context)."""
+    run_video_analysis(current_app._get_current_object(), video_id)
+
+
+def enqueue_video_analysis(app, video_id) -> bool:
+    """
+    Queue a video analysis on Celery if configured, else on the thread pool.
+
+    Returns:
+        False if the in-process pool is full, True otherwise
+    """
+    if 'celery' in app.extensions:
+        analyze_video_task.delay(video_id)
+        return True
+    return app.extensions['analysis_executor'].submit(run_video_analysis, app, video_id) is not None
+
+
+def refresh_cached_analysis(app, video_id):
+    """Re-read a video's latest analysis from BigQuery into the detail cache."""
+    with app.app_context():
+        try:
+            analysis = app.bigquery.get_latest_analysis(video_id)
+            # If the operation finished meanwhile, its own invalidation wins
+            still_running = any(cache.get_many(f'analyzing_{video_id}', f'transcribing_{video_id}'))
+            if analysis and analysis.video and still_running:
+                fast_cache_set(f'video_detail_v2_{video_id}', analysis, timeout=DETAIL_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.error(f'Detail cache refresh failed for {video_id}: {str(e)}')
+        finally:
+            cache.delete(f'refreshing_{video_id}')
+
+
+def enqueue_detail_refresh(app, video_id) -> bool:
+    """
+    Refresh a video's cached analysis in the background, at most once at a time.
+
+    Returns:
+        True if a refresh is queued or already running, False if the pool is full
+    """
+    if not cache.add(f'refreshing_{video_id}', True, timeout=60):
+        return True
+    if app.extensions['analysis_executor'].submit(refresh_cached_analysis, app, video_id) is None:
+        cache.delete(f'refreshing_{video_id}')
+        return False
+    return True
@@ -0,0 +1,101 @@
+"""Scheduled refresh of dashboard overview data.
+
+Keeps the dashboard KPI stats and recent-videos list warm in the cache so
+the /dashboard page doesn't wait on BigQuery.
+"""
+import logging
+import os
+import tempfile
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, every process refreshes
+    fcntl = None
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.extensions import cache
+from app.utils.cache_codec import fast_cache_set
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_STATS_KEY = 'dashboard_stats'
+DASHBOARD_RECENT_VIDEOS_KEY = 'dashboard_recent_videos_v2'
+RECENT_VIDEOS_LIMIT = 10
+
+# Held open for the life of the process that owns the scheduler
+_lock_file = None
+
+
+def refresh_dashboard_cache(app):
+    """Recompute dashboard stats and recent videos and store them in the cache."""
+    timeout = app.config['DASHBOARD_CACHE_TIMEOUT']
+    with app.app_context():
+        try:
+            stats = app.bigquery.get_dashboard_stats()
+            cache.set(DASHBOARD_STATS_KEY, stats, timeout=timeout)
+
+            recent_videos = app.bigquery.get_videos(limit=RECENT_VIDEOS_LIMIT, has_analysis=True)
+            fast_cache_set(DASHBOARD_RECENT_VIDEOS_KEY, recent_videos, timeout=timeout)
+
+            logger.info("Refreshed dashboard cache")
+        except Exception as e:
+            logger.error(f"Dashboard cache refresh failed: {str(e)}")
+
+
+def _acquire_refresh_lock(path: str) -> bool:
+    """
+    Take a non-blocking exclusive lock on path for the rest of the process.
+
+    Every gunicorn worker runs create_app, so the lock lets only one of them
+    run the scheduler. The OS releases it when that process exits.
+    """
+    global _lock_file
+    if fcntl is None:
+        return True
+
+    lock_file = open(path, 'a')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _lock_file = lock_file
+    return True
+
+
+def init_dashboard_refresh(app):
+    """
+    Start a background scheduler that refreshes the dashboard cache.
+
+    Only one process per host runs it: the first to take the refresh lock.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        The started scheduler, or None if another process already runs it
+    """
+    lock_path = app.config.get('DASHBOARD_REFRESH_LOCK_FILE') or os.path.join(
+        tempfile.gettempdir(), 'analytics-dashboard-refresh.lock'
+    )
+    if not _acquire_refresh_lock(lock_path):
+        logger.info(f"Dashboard refresh already runs in another process (lock {lock_path})")
+        return None
+
+    minutes = app.config['DASHBOARD_REFRESH_MINUTES']
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(
+        refresh_dashboard_cache,
+        'interval',
+        minutes=minutes,
+        args=[app],
+        id='dashboard_refresh',
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now()  # Warm the cache right away
+    )
+    scheduler.start()
+    logger.info(f"Dashboard refresh scheduled every {minutes} minutes")
+    return scheduler
@@ -1,10 +1,57 @@
-"""Data models for YouTube analytics dashboard."""
-from dataclasses import dataclass, field
-from datetime import datetime, date
-from typing import Dict, List, Optional
-
+"""Data models for YouTube analytics dashboard.
 
-@dataclass
+All models use slotted dataclasses (no per-instance __dict__). Pure value
+types that are never modified after construction are also frozen.
+"""
+import sys
+from dataclasses import dataclass, field, fields, is_dataclass, asdict
+from datetime import datetime, date
+from functools import lru_cache
+from typing import Dict, List, Optional, Union, get_args, get_origin
+
+
+@lru_cache(maxsize=None)
+def _field_decoders(cls) -> tuple:
+    """Work out, once per class, which fields need converting back from to_dict() output."""
+    decoders = []
+    for f in fields(cls):
+        hint = f.type
+        if get_origin(hint) is Union:
+            hint = next(a for a in get_args(hint) if a is not type(None))
+        if hint in (datetime, date):
+            decoders.append((f.name, _decode_temporal))
+        elif is_dataclass(hint):
+            decoders.append((f.name, lambda v, c=hint: _from_dict(c, v)))
+        elif get_origin(hint) in (list, List) and get_args(hint) and is_dataclass(get_args(hint)[0]):
+            item_cls = get_args(hint)[0]
+            decoders.append((f.name, lambda v, c=item_cls: [_from_dict(c, i) for i in v]))
+    return tuple(decoders)
+
+
+def _decode_temporal(value):
+    """Parse an ISO date/datetime string back into a date or datetime."""
+    if isinstance(value, str):
+        return date.fromisoformat(value) if len(value) == 10 else datetime.fromisoformat(value)
+    return value
+
+
+def _intern(value):
+    """Intern a low-cardinality string so equal values share one object."""
+    return sys.intern(value) if type(value) is str and value else value
+
+
+def _from_dict(cls, data):
+    """Rebuild a (possibly nested) dataclass from a plain dict."""
+    if data is None:
+        return None
+    data = dict(data)
+    for name, decode in _field_decoders(cls):
+        if data.get(name) is not None:
+            data[name] = decode(data[name])
+    return cls(**data)
+
+
+@dataclass(slots=True)
 class Video:
     """Video metadata and basic information."""
     video_id: str
@@ -17,8 +64,20 @@ class Video:
     has_analysis: bool = False
     latest_analysis_date: Optional[datetime] = None
 
+    def __post_init__(self):
+        self.channel_code = _intern(self.channel_code)
+
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict (dates stay as date/datetime objects)."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Video':
+        """Build from to_dict() output, parsing ISO date strings if serialized."""
+        return _from_dict(cls, data)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RevenueMetrics:
     """Revenue and performance metrics for a video."""
     video_id: str
@@ -34,7 +93,7 @@ class RevenueMetrics:
     impression_ctr: float = 0.0  # CTR from YT Analytics (already in %)
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoTranscript:
     """Video transcript information."""
     video_id: str
@@ -42,7 +101,7 @@ class VideoTranscript:
     language: str = 'en'
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScriptAnalysis:
     """AI analysis results for video script quality."""
     video_id: str
@@ -64,8 +123,11 @@ class ScriptAnalysis:
     problem_solution_structure: bool = False
     readability_score: float = 0.0
 
+    def __post_init__(self):
+        object.__setattr__(self, 'channel_code', _intern(self.channel_code))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AffiliateRecommendation:
     """AI-generated affiliate product recommendation."""
     video_id: str
@@ -82,7 +144,7 @@ class AffiliateRecommendation:
     price_range: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DescriptionAnalysis:
     """AI analysis results for video description CTR."""
     video_id: str
@@ -105,8 +167,12 @@ class DescriptionAnalysis:
     main_keyword: str = ""
     silo: str = ""
 
+    def __post_init__(self):
+        object.__setattr__(self, 'main_keyword', _intern(self.main_keyword))
+        object.__setattr__(self, 'silo', _intern(self.silo))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversionAnalysis:
     """AI analysis of conversion rate drivers."""
     video_id: str
@@ -124,7 +190,7 @@ class ConversionAnalysis:
     recommendations: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AffiliatePerformance:
     """Real affiliate performance data from BigQuery Revenue_Metrics table."""
     video_id: str
@@ -138,8 +204,13 @@ class AffiliatePerformance:
     conversion_rate: float = 0.0
     revenue_per_click: float = 0.0
 
+    def __post_init__(self):
+        # Frozen, so assign through object.__setattr__
+        for name in ('tracking_id', 'platform', 'affiliate', 'link_placement'):
+            object.__setattr__(self, name, _intern(getattr(self, name)))
 
-@dataclass
+
+@dataclass(slots=True)
 class GateCheckResult:
     """Single gate check result (pass/fail)."""
     gate_name: str
@@ -147,7 +218,7 @@ class GateCheckResult:
     failure_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptScore:
     """Comprehensive script scoring results (gates + quality + context multiplier)."""
     video_id: str
@@ -186,7 +257,7 @@ class ScriptScore:
     rizz_details: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApprovedBrand:
     """Approved brand for a silo."""
     silo: str
@@ -195,7 +266,7 @@ class ApprovedBrand:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Partner:
     """Revenue partner brand."""
     brand_name: str
@@ -204,7 +275,7 @@ class Partner:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResults:
     """Combined analysis results for a video."""
     video: Video
@@ -217,8 +288,33 @@ class AnalysisResults:
     existing_links_analysis: Optional[Dict] = None
     script_score: Optional[ScriptScore] = None
 
-
-@dataclass
+    def to_dict(self) -> Dict:
+        """Convert to a plain nested dict (dates stay as date/datetime objects)."""
+        return asdict(self)
+
+    def affiliate_totals(self) -> Dict:
+        """
+        Sum revenue, clicks and sales across all affiliate tracking IDs.
+
+        Returns:
+            Dictionary with 'revenue', 'clicks' and 'sales' totals
+        """
+        revenue = 0.0
+        clicks = 0
+        sales = 0
+        for perf in self.affiliate_performance:
+            revenue += perf.total_revenue
+            clicks += perf.total_clicks
+            sales += perf.total_sales
+        return {'revenue': revenue, 'clicks': clicks, 'sales': sales}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AnalysisResults':
+        """Build from to_dict() output, rebuilding nested models and dates."""
+        return _from_dict(cls, data)
+
+
+@dataclass(slots=True)
 class DashboardStats:
     """Dashboard overview statistics."""
     total_videos: int
@@ -232,7 +328,7 @@ class DashboardStats:
     avg_revenue_per_video: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisJob:
     """Background analysis job tracking."""
     job_id: str
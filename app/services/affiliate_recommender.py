@@ -4,14 +4,303 @@ Recommends relevant Tech/Software products based on video content.
 """
 
 from anthropic import Anthropic
+import hashlib
 import json
 import re
+from contextlib import nullcontext
+from functools import lru_cache
+from string import Template
 from typing import List, Dict, Optional
+from urllib.parse import urlsplit
 import logging
 
+from app.utils.ttl_cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib decoder
+    orjson = None
+
+try:
+    from json_repair import repair_json
+except ImportError:  # Fall back to closing unbalanced brackets
+    repair_json = None
+
+try:
+    import re2
+except ImportError:  # Fall back to the stdlib regex engine
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(text: str):
+    """Decode JSON text with orjson when available (raises json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# ```json ... ``` fenced block in a model response
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*\n(.*?)```', re.DOTALL)
+
+# Static prompt scaffolds, parsed once at import. Only the per-video pieces
+# are substituted in _prompt_fields().
+_PERF_SECTION_TEMPLATE = Template("""
+
+**REAL AFFILIATE PERFORMANCE DATA (from actual tracking):**
+$perf_lines
+
+**MANDATORY RULES WHEN REAL DATA EXISTS:**
+1. Your FIRST recommendations MUST be these existing products (they are PROVEN to work): $unique_products
+   - Set mentioned_in_video=true for each
+   - Use their REAL conversion rates for conversion_probability
+   - Analyze their performance in recommendation_reasoning
+2. You have $remaining_slots remaining slot(s) for NEW product suggestions
+3. NEW suggestions must be DIRECT COMPETITORS in the exact same product category
+   - Same type of product, same use case, different brand
+   - NOT adjacent categories (VPNs are NOT data broker removal, password managers are NOT code editors)
+4. If you cannot find $remaining_slots direct competitors, return fewer products. DO NOT pad with unrelated products.
+""")
+
+# Instruction blocks of the recommendation prompt
+_STEP_1 = (
+    '**STEP 1:** What EXACT product type/category is this video about? Be very specific '
+    '(e.g., "data broker removal services" NOT "privacy tools", "React frameworks" NOT "web development").'
+)
+
+_HARD_RULES = """**HARD RULES:**
+- Every product must be the SAME product type as the video's topic
+- VPNs, antivirus, password managers, courses are DIFFERENT product types from data broker removal
+- Hosting providers are DIFFERENT product types from frontend frameworks
+- A "related" product in a different category is NOT acceptable
+- If the video compares Product A vs Product B vs Product C, then A, B, C should be your recommendations"""
+
+# Structured output: Claude is forced to answer through a tool whose input
+# schema is the recommendation format, so responses arrive as parsed JSON
+_PRODUCT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "product_name": {"type": "string", "description": "Specific product name"},
+        "product_category": {"type": "string", "description": "The EXACT product type from Step 1"},
+        "relevance_score": {"type": "number", "description": "1-10"},
+        "conversion_probability": {"type": "number", "description": "0-100"},
+        "recommendation_reasoning": {
+            "type": "string", "description": "2-3 sentences. Reference real data if available."
+        },
+        "where_to_mention": {"type": "string", "description": "Specific part of video or description"},
+        "mentioned_in_video": {"type": "boolean"},
+        "amazon_asin": {"type": ["string", "null"], "description": "ASIN if applicable, otherwise null"},
+        "typical_commission_rate": {"type": "string", "description": "Estimated commission %"},
+        "price_range": {"type": "string", "enum": ["low", "medium", "high"]},
+        "target_audience_match": {"type": "string", "description": "Why this audience needs this exact product"}
+    },
+    "required": [
+        "product_name", "product_category", "relevance_score", "conversion_probability",
+        "recommendation_reasoning", "mentioned_in_video"
+    ]
+}
+
+_RECOMMENDATIONS_TOOL = {
+    "name": "emit_recommendations",
+    "description": "Return the affiliate product recommendations for the video.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"products": {"type": "array", "items": _PRODUCT_SCHEMA}},
+        "required": ["products"]
+    }
+}
+
+_RELEVANCE_RUBRIC = (
+    '**relevance_score:** 9-10 = same product type discussed in video, '
+    '7-8 = direct competitor, below 7 = do not include.'
+)
+
+# Static instructions go first, as their own content block, so the prompt
+# prefix is identical on every call. Everything per-video follows in a
+# second block. (The instructions are well under the minimum length for
+# Anthropic prompt caching, so no cache breakpoint is set.)
+_RECOMMENDATION_INSTRUCTIONS = """
+Analyze the YouTube video that follows and recommend affiliate products.
+
+""" + _STEP_1 + """
+
+**STEP 2:** Follow the STEP 2 given with the video.
+
+""" + _HARD_RULES + """
+
+Return the products with the emit_recommendations tool.
+
+""" + _RELEVANCE_RUBRIC + """
+**conversion_probability:** Follow the guidance given with the video.
+"""
+
+# Per-video part of the prompt
+_VIDEO_TEMPLATE = Template("""**TITLE:** $title
+
+**DESCRIPTION:** $description
+
+**TRANSCRIPT:** $transcript
+$perf_section
+**STEP 2:** $step_2
+$existing_rule
+**conversion_probability:** $conversion_guidance""")
+
+# Rough chars-per-token ratio for English transcripts, used to size the
+# transcript budget without a token-counting round-trip
+_CHARS_PER_TOKEN = 4
+
+_SENTENCE_END_RE = re.compile(r'[.!?]\s|\n\n')
+
+
+def _truncate_transcript(transcript: str, max_chars: int, tail_share: float = 0.25) -> str:
+    """
+    Shorten a transcript to about max_chars, keeping its opening and its ending.
+
+    Product mentions cluster in intros and outros, so the head gets most of the
+    budget and the tail the rest. Both cuts land on sentence boundaries, or on
+    word boundaries for unpunctuated (auto-generated) transcripts.
+
+    Args:
+        transcript: Full transcript text
+        max_chars: Character budget
+        tail_share: Fraction of the budget kept from the end
+
+    Returns:
+        The transcript unchanged if it fits, else head + marker + tail
+    """
+    if len(transcript) <= max_chars:
+        return transcript
+
+    tail_chars = int(max_chars * tail_share)
+    head_chars = max_chars - tail_chars
+
+    # Head: end at the last sentence boundary, unless that discards over half of it
+    cut = max(transcript.rfind(end, 0, head_chars) for end in ('. ', '? ', '! ', '\n\n'))
+    if cut < head_chars // 2:
+        cut = transcript.rfind(' ', 0, head_chars)
+    head = transcript[:cut + 1] if cut > 0 else transcript[:head_chars]
+
+    # Tail: start after the first sentence boundary in the first half of its window
+    tail_start = len(transcript) - tail_chars
+    boundary = _SENTENCE_END_RE.search(transcript, tail_start, tail_start + tail_chars // 2)
+    if boundary:
+        tail_start = boundary.end()
+    else:
+        space = transcript.find(' ', tail_start)
+        if space != -1:
+            tail_start = space + 1
+    tail = transcript[tail_start:]
+
+    return f"{head.rstrip()}\n... [truncated] ...\n{tail.lstrip()}"
+
+
+def _prompt_blocks(instructions: str, body_parts: List[str]) -> List[Dict]:
+    """
+    User message content: static instructions, then the per-video body.
+
+    The body is assembled from its parts with a single join, so the
+    transcript-sized pieces are copied once rather than per concatenation.
+    """
+    return [
+        {"type": "text", "text": instructions},
+        {"type": "text", "text": ''.join(body_parts)},
+    ]
+
+# Link detection patterns, compiled once. All are case-insensitive so URLs
+# don't need to be lowercased before scanning. URL extraction stays on the
+# stdlib engine, which is faster than RE2 at yielding many small matches.
+_AFFILIATE_INDICATORS = (
+    'amzn.to',
+    '/ref=',
+    '?tag=',
+    'affiliate',
+    'aff=',
+    'referral',
+    '/go/',
+    'geni.us',
+    'click.linksynergy.com',
+    'shareasale.com',
+    'cj.com',
+    'avantlink.com',
+    'pxf.io',
+    'dpbolvw.net',
+    'impact.com',
+    'sjv.io',
+    'tkqlhce.com',
+    'jdoqocy.com',
+    'kqzyfj.com',
+)
+
+# URL shorteners in YT descriptions are almost always affiliate/tracking links
+_SHORTENER_DOMAINS = (
+    'bit.ly/', 'tinyurl.com/', 'ow.ly/', 'buff.ly/',
+    'rebrand.ly/', 'shorturl.at/', 'cutt.ly/',
+)
+
+# Shortener hosts whose path usually starts with the product name
+_PLATFORM_SHORTENER_HOSTS = frozenset(('bit.ly', 'tinyurl.com', 'ow.ly', 'rebrand.ly', 'cutt.ly'))
+
+_DISCLOSURE_KEYWORDS = (
+    'affiliate',
+    'commission',
+    'compensated',
+    'sponsored',
+    'partner link',
+    'disclosure',
+)
+
+# Deal/offer subdomains (e.g., deal.incogni.io, try.aura.com)
+_DEAL_SUBDOMAINS = frozenset(('deal', 'offer', 'try', 'get', 'go', 'promo'))
+_DEAL_SUBDOMAIN_PATTERN = r'https?://(?:' + '|'.join(sorted(_DEAL_SUBDOMAINS)) + r')\.'
+
+# Networks recognized by a label of the URL's host (checked in priority order)
+_PLATFORM_HOST_LABELS = (
+    (frozenset(('amazon', 'amzn')), 'Amazon'),
+    (frozenset(('youtube', 'youtu')), 'YouTube'),
+    (frozenset(('shareasale',)), 'ShareASale'),
+    (frozenset(('cj', 'linksynergy')), 'CJ Affiliate'),
+)
+
+
+def _literal_alternation(literals) -> str:
+    """Regex alternation matching any of the given literal substrings."""
+    return '|'.join(re.escape(literal) for literal in literals)
+
+
+def _compile_keyword_set(pattern: str):
+    """
+    Compile a case-insensitive many-keyword pattern, with RE2 when installed.
+
+    RE2 runs the whole alternation as one automaton pass, while the stdlib
+    engine retries every alternative at each position (several times slower
+    for these sets). Only use this for patterns checked with search().
+    """
+    if re2 is not None:
+        return re2.compile('(?i)' + pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+_AFFILIATE_LINK_RE = _compile_keyword_set(
+    '|'.join([
+        _literal_alternation(_AFFILIATE_INDICATORS),
+        _literal_alternation(_SHORTENER_DOMAINS),
+        _DEAL_SUBDOMAIN_PATTERN,
+    ])
+)
+# Leading letters of a shortener path (e.g. "Optery" in bit.ly/Optery_hWeD1)
+_LEADING_LETTERS_RE = re.compile(r'[A-Za-z]*')
+_DISCLOSURE_RE = _compile_keyword_set(_literal_alternation(_DISCLOSURE_KEYWORDS))
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+
+@lru_cache(maxsize=128)
+def _compile_known_affiliates(names: frozenset):
+    """Build the alternation for a set of lowercase names (cached per set)."""
+    # Longest first so e.g. "deleteme" wins over "delete" at the same position
+    return re.compile(_literal_alternation(sorted(names, key=len, reverse=True)), re.IGNORECASE)
+
+
 class AffiliateRecommender:
     """
     AI-powered affiliate product recommendation system.
@@ -24,17 +313,41 @@ class AffiliateRecommender:
     - Productivity and business software
     """
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
+    # Small prompts (short transcript + description, little performance data)
+    # are plain JSON extraction and go to the fast model
+    FAST_MODEL_MAX_CONTENT_CHARS = 4000
+    FAST_MODEL_MAX_PERFORMANCE_ROWS = 10
+
+    # Approximate transcript budget per video in a prompt
+    TRANSCRIPT_MAX_TOKENS = 2500
+
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514",
+                 fast_model: Optional[str] = "claude-haiku-4-5",
+                 result_cache=None, result_cache_timeout: int = 86400,
+                 client: Optional[Anthropic] = None, request_gate=None):
         """
         Initialize affiliate recommender.
 
         Args:
             api_key: Anthropic API key
-            model: Claude model to use
+            model: Claude model for larger prompts (and retries)
+            fast_model: Smaller Claude model for short prompts (None to always use model)
+            result_cache: Cache with get/set(key, value, timeout=...) for results
+                          keyed by prompt content (e.g. the Flask-Caching cache);
+                          defaults to an in-process LRU
+            result_cache_timeout: Seconds to reuse cached recommendations
+            client: Shared Anthropic client to reuse instead of creating one
+            request_gate: Context manager factory entered around each Claude
+                          request with the prompt texts (e.g. a rate limiter);
+                          cache hits never enter it
         """
-        self.client = Anthropic(api_key=api_key)
+        self.client = client or Anthropic(api_key=api_key)
+        self.request_gate = request_gate or (lambda *texts: nullcontext())
         self.model = model
-        logger.info(f"Affiliate recommender initialized with model: {model}")
+        self.fast_model = fast_model
+        self.result_cache = result_cache if result_cache is not None else TTLCache()
+        self.result_cache_timeout = result_cache_timeout
+        logger.info(f"Affiliate recommender initialized with model: {model} (fast model: {fast_model})")
 
     def recommend_products(
         self,
@@ -42,7 +355,8 @@ class AffiliateRecommender:
         title: str,
         description: str,
         top_n: int = 5,
-        affiliate_performance: list = None
+        affiliate_performance: list = None,
+        use_cache: bool = True
     ) -> Optional[List[Dict]]:
         """
         Recommend affiliate products based on video content and real performance data.
@@ -53,6 +367,8 @@ class AffiliateRecommender:
             description: Video description
             top_n: Number of products to recommend (default: 5)
             affiliate_performance: Real BigQuery performance data (list of AffiliatePerformance)
+            use_cache: Reuse a cached result for unchanged content (False
+                       still caches the fresh result)
 
         Returns:
             List of product recommendations with scores and reasoning
@@ -61,77 +377,253 @@ class AffiliateRecommender:
             transcript, title, description, top_n, affiliate_performance
         )
 
-        try:
-            logger.info(f"Generating {top_n} affiliate product recommendations...")
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                temperature=0.5,  # Slightly higher temperature for creative recommendations
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            # Parse JSON response
-            response_text = message.content[0].text
-
-            # Extract JSON from response - handle text/markdown before/after JSON
-            response_text = response_text.strip()
+        # Unchanged content (title, description, transcript, performance data
+        # and top_n all feed the prompt) reuses the previous result
+        cache_key = self._result_cache_key(prompt)
+        cached = self._get_cached_products(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info(f"Using cached affiliate recommendations ({len(cached)} products)")
+            return cached
 
-            # Try to extract JSON from ```json ... ``` code blocks first
-            import re
-            json_block = re.search(r'```(?:json)?\s*\n(.*?)```', response_text, re.DOTALL)
-            if json_block:
-                response_text = json_block.group(1).strip()
-            else:
-                # Fallback: find the first { and last } to extract JSON object
-                first_brace = response_text.find('{')
-                last_brace = response_text.rfind('}')
-                if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-                    response_text = response_text[first_brace:last_brace + 1]
+        model = self._select_model(transcript, description, affiliate_performance)
 
+        try:
+            logger.info(f"Generating {top_n} affiliate product recommendations with {model}...")
             try:
-                data = json.loads(response_text)
+                products = self._generate_products(prompt, model)
             except json.JSONDecodeError:
-                # Try to repair truncated JSON by closing open brackets
-                repaired = response_text.rstrip().rstrip(',')
-                # Count open vs close braces/brackets
-                open_braces = repaired.count('{') - repaired.count('}')
-                open_brackets = repaired.count('[') - repaired.count(']')
-                repaired += '}' * max(open_braces, 0) + ']' * max(open_brackets, 0)
-                # Try one more pattern: close any unclosed "products" array
-                if '"products"' in repaired and open_brackets > 0:
-                    repaired = repaired.rstrip('}').rstrip() .rstrip(',') + ']}'
-                data = json.loads(repaired)
-                logger.info("Successfully repaired truncated JSON response")
-
-            # Extract products list from the JSON response
-            if isinstance(data, dict) and 'products' in data:
-                products = data['products']
-            elif isinstance(data, list):
-                products = data
-            else:
-                logger.error(f"Unexpected response format: {type(data)}")
-                return []
-
-            # Normalize scores (convert 1-10 to 0-1 for relevance, percentage to 0-1 for conversion)
-            for p in products:
-                # Normalize relevance score from 1-10 to 0-1
-                if 'relevance_score' in p and p['relevance_score'] > 1:
-                    p['relevance_score'] = p['relevance_score'] / 10.0
-                # Normalize conversion probability from 0-100 to 0-1
-                if 'conversion_probability' in p and p['conversion_probability'] > 1:
-                    p['conversion_probability'] = p['conversion_probability'] / 100.0
+                if model == self.model:
+                    raise
+                # The fast model's output couldn't be parsed even after repair
+                logger.warning(f"Retrying recommendations with {self.model}")
+                products = self._generate_products(prompt, self.model)
 
             logger.info(f"Generated {len(products)} product recommendations")
+            self._cache_products(cache_key, products)
             return products
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Claude response as JSON: {e}")
-            logger.error(f"Response text (first 500 chars): {response_text[:500]}")
             return []
         except Exception as e:
             logger.error(f"Error generating recommendations: {e}")
             return []
 
+    @staticmethod
+    def _result_cache_key(prompt: List[Dict]) -> str:
+        """Content-addressed cache key for recommendation prompt blocks."""
+        digest = hashlib.blake2b(digest_size=16)
+        for block in prompt:
+            digest.update(block['text'].encode('utf-8'))
+        return 'affiliate_recs_' + digest.hexdigest()
+
+    def _get_cached_products(self, cache_key: str) -> Optional[List[Dict]]:
+        """Return a copy of cached recommendations, or None on a miss or cache error."""
+        try:
+            cached = self.result_cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Recommendation cache read failed: {str(e)}")
+            return None
+        if cached is None:
+            return None
+        # Callers annotate the product dicts, so never hand out the cached ones
+        return [dict(p) for p in cached]
+
+    def _cache_products(self, cache_key: str, products: List[Dict]):
+        """Store recommendations for reuse (empty results are never cached)."""
+        if not products:
+            return
+        try:
+            self.result_cache.set(
+                cache_key, [dict(p) for p in products], timeout=self.result_cache_timeout
+            )
+        except Exception as e:
+            logger.warning(f"Recommendation cache write failed: {str(e)}")
+
+    def _select_model(self, transcript: str, description: str, affiliate_performance: list = None) -> str:
+        """Pick the fast model for short prompts, otherwise the default model."""
+        if not self.fast_model:
+            return self.model
+        content_chars = len(transcript or '') + len(description or '')
+        if (content_chars < self.FAST_MODEL_MAX_CONTENT_CHARS
+                and len(affiliate_performance or []) < self.FAST_MODEL_MAX_PERFORMANCE_ROWS):
+            return self.fast_model
+        return self.model
+
+    def _generate_products(self, prompt: List[Dict], model: str) -> List[Dict]:
+        """
+        Run one recommendation request and parse the products it returns.
+
+        Args:
+            prompt: Recommendation prompt content blocks
+            model: Claude model to use
+
+        Returns:
+            List of normalized product dicts (empty if the format is unexpected)
+
+        Raises:
+            json.JSONDecodeError if the response can't be parsed, even after repair
+        """
+        data = self._request_json(prompt, model, _RECOMMENDATIONS_TOOL)
+
+        # Extract products list from the JSON response
+        if isinstance(data, dict) and 'products' in data:
+            products = data['products']
+        elif isinstance(data, list):
+            products = data
+        else:
+            logger.error(f"Unexpected response format: {type(data)}")
+            return []
+
+        return self._normalize_products(products)
+
+    def _request_json(self, prompt: List[Dict], model: str, tool: Dict, max_tokens: int = 4000):
+        """
+        Send a prompt and return the structured data Claude responds with.
+
+        Claude is forced to call `tool`, so the answer is normally the tool
+        input, already parsed by the SDK. If the response has no tool call,
+        its text is parsed (and repaired if needed) with _parse_json_text().
+
+        Args:
+            prompt: User message content blocks
+            model: Claude model to use
+            tool: Tool definition whose input_schema is the response format
+            max_tokens: Output token limit
+
+        Returns:
+            Decoded JSON (partial if the response was truncated)
+
+        Raises:
+            json.JSONDecodeError if a text-only response can't be parsed, even after repair
+        """
+        # Stream the request so a long max_tokens generation doesn't hit the
+        # SDK's HTTP timeout; get_final_message() still returns it whole
+        with self.request_gate(*(block['text'] for block in prompt)), self.client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=0.5,  # Slightly higher temperature for creative recommendations
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]},
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            final_message = stream.get_final_message()
+
+        truncated = final_message.stop_reason == 'max_tokens'
+        logger.info(
+            f"Recommendation response: {final_message.usage.output_tokens} output tokens, "
+            f"stop_reason={final_message.stop_reason}"
+        )
+
+        for block in final_message.content:
+            if block.type == 'tool_use' and block.name == tool['name']:
+                if truncated:
+                    # The SDK parses streamed tool input incrementally, so a
+                    # cut-off response still yields every complete item
+                    logger.warning("Recommendation response hit max_tokens; using partial tool input")
+                return block.input
+
+        # No tool call (not expected with a forced tool_choice): fall back to
+        # parsing JSON out of the text
+        response_text = ''.join(block.text for block in final_message.content if block.type == 'text')
+        return self._parse_json_text(response_text, truncated)
+
+    def _parse_json_text(self, response_text: str, truncated: bool):
+        """
+        Parse a JSON object out of free-form response text.
+
+        Args:
+            response_text: Model response text
+            truncated: Whether the response was cut off at max_tokens
+
+        Returns:
+            Decoded JSON (repaired if the response was malformed or truncated)
+
+        Raises:
+            json.JSONDecodeError if the response can't be parsed, even after repair
+        """
+        response_text = response_text.strip()
+
+        # Bare JSON is the common case; only go looking for it when that fails
+        if not truncated:
+            try:
+                return _json_loads(response_text)
+            except json.JSONDecodeError:
+                pass
+
+        # Extract JSON from response - handle text/markdown before/after JSON
+        # Try to extract JSON from ```json ... ``` code blocks first
+        json_block = _JSON_FENCE_RE.search(response_text)
+        if json_block:
+            response_text = json_block.group(1).strip()
+        else:
+            # Fallback: find the first { and last } to extract JSON object
+            first_brace = response_text.find('{')
+            last_brace = response_text.rfind('}')
+            if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
+                response_text = response_text[first_brace:last_brace + 1]
+
+        try:
+            if truncated:
+                # Output was cut off at max_tokens, so a strict parse can't succeed
+                logger.warning("Recommendation response hit max_tokens; repairing truncated JSON")
+                data = _json_loads(self._repair_json(response_text))
+            else:
+                try:
+                    data = _json_loads(response_text)
+                except json.JSONDecodeError:
+                    data = _json_loads(self._repair_json(response_text))
+        except json.JSONDecodeError:
+            logger.error(f"Response text (first 500 chars): {response_text[:500]}")
+            raise
+
+        return data
+
+    @staticmethod
+    def _normalize_products(products: List[Dict]) -> List[Dict]:
+        """Normalize scores (convert 1-10 to 0-1 for relevance, percentage to 0-1 for conversion)."""
+        for p in products:
+            # Normalize relevance score from 1-10 to 0-1
+            relevance = p.get('relevance_score')
+            if relevance is not None and relevance > 1:
+                p['relevance_score'] = relevance / 10.0
+            # Normalize conversion probability from 0-100 to 0-1
+            conversion = p.get('conversion_probability')
+            if conversion is not None and conversion > 1:
+                p['conversion_probability'] = conversion / 100.0
+
+        return products
+
+    @classmethod
+    def _repair_json(cls, text: str) -> str:
+        """
+        Repair malformed or truncated JSON from a model response.
+
+        Uses json_repair when installed (handles unterminated strings, stray
+        commas and nesting); otherwise closes unbalanced brackets.
+        """
+        if repair_json is not None:
+            repaired = repair_json(text)
+        else:
+            repaired = cls._repair_truncated_json(text)
+        if repaired != text:
+            logger.info(f"Repaired JSON response ({len(text)} -> {len(repaired)} chars)")
+        return repaired
+
+    @staticmethod
+    def _repair_truncated_json(text: str) -> str:
+        """Try to repair truncated JSON by closing open brackets."""
+        repaired = text.rstrip().rstrip(',')
+        # Count open vs close braces/brackets (str.count is a C-level scan;
+        # four of them beat a single Counter or Python loop over the text)
+        open_braces = repaired.count('{') - repaired.count('}')
+        open_brackets = repaired.count('[') - repaired.count(']')
+        closers = '}' * max(open_braces, 0) + ']' * max(open_brackets, 0)
+        # Try one more pattern: close any unclosed "products" array
+        if open_brackets > 0 and '"products"' in repaired:
+            closers += ']}'
+        return repaired + closers
+
     def _build_recommendation_prompt(
         self,
         transcript: str,
@@ -139,93 +631,72 @@ class AffiliateRecommender:
         description: str,
         top_n: int,
         affiliate_performance: list = None
-    ) -> str:
-        """Build prompt for affiliate recommendations."""
-        # Truncate transcript if too long
-        transcript = transcript or ''
-        max_transcript_length = 10000
-        if len(transcript) > max_transcript_length:
-            transcript = transcript[:max_transcript_length] + "... [truncated]"
-
-        # Build real performance data section
-        perf_section = ""
-        existing_products = []
-        if affiliate_performance:
-            perf_lines = []
-            for p in affiliate_performance:
-                existing_products.append(p.affiliate)
-                perf_lines.append(
-                    f"  - {p.affiliate} ({p.platform}) | Placement: {p.link_placement} | "
-                    f"Revenue: ${p.total_revenue:.2f} | Clicks: {p.total_clicks} | "
-                    f"Sales: {p.total_sales} | Conv: {p.conversion_rate:.1f}% | "
-                    f"Rev/Click: ${p.revenue_per_click:.2f}"
-                )
-            # Deduplicate product names
-            unique_products = list(dict.fromkeys(existing_products))
-            remaining_slots = max(0, top_n - len(unique_products))
-
-            perf_section = f"""
+    ) -> List[Dict]:
+        """Build prompt content blocks for affiliate recommendations."""
+        return _prompt_blocks(_RECOMMENDATION_INSTRUCTIONS, [_VIDEO_TEMPLATE.substitute(
+            self._prompt_fields(transcript, title, description, top_n, affiliate_performance)
+        )])
 
-**REAL AFFILIATE PERFORMANCE DATA (from actual tracking):**
-{chr(10).join(perf_lines)}
-
-**MANDATORY RULES WHEN REAL DATA EXISTS:**
-1. Your FIRST recommendations MUST be these existing products (they are PROVEN to work): {', '.join(unique_products)}
-   - Set mentioned_in_video=true for each
-   - Use their REAL conversion rates for conversion_probability
-   - Analyze their performance in recommendation_reasoning
-2. You have {remaining_slots} remaining slot(s) for NEW product suggestions
-3. NEW suggestions must be DIRECT COMPETITORS in the exact same product category
-   - Same type of product, same use case, different brand
-   - NOT adjacent categories (VPNs are NOT data broker removal, password managers are NOT code editors)
-4. If you cannot find {remaining_slots} direct competitors, return fewer products. DO NOT pad with unrelated products.
-"""
-
-        return f"""
-Analyze this YouTube video and recommend affiliate products.
-
-**TITLE:** {title}
-
-**DESCRIPTION:** {description}
+    @staticmethod
+    def _prompt_fields(
+        transcript: str,
+        title: str,
+        description: str,
+        top_n: int,
+        affiliate_performance: list = None
+    ) -> Dict[str, str]:
+        """Per-video substitutions for the recommendation prompt."""
+        # Truncate transcript if too long, keeping its opening and ending
+        transcript = _truncate_transcript(
+            transcript or '', AffiliateRecommender.TRANSCRIPT_MAX_TOKENS * _CHARS_PER_TOKEN
+        )
 
-**TRANSCRIPT:** {transcript}
-{perf_section}
-**STEP 1:** What EXACT product type/category is this video about? Be very specific (e.g., "data broker removal services" NOT "privacy tools", "React frameworks" NOT "web development").
+        if not affiliate_performance:
+            return {
+                'title': title,
+                'description': description,
+                'transcript': transcript,
+                'perf_section': '',
+                'step_2': f"Recommend up to {top_n} products that are the SAME type of product discussed in the video.",
+                'existing_rule': '',
+                'conversion_guidance': "Be realistic, 20-60% for most."
+            }
+
+        # Build real performance data section in one pass over the rows: one
+        # line per affiliate, keeping its highest-revenue row (first seen wins
+        # ties); the dict's keys double as the ordered, deduplicated names
+        best = {}
+        for p in affiliate_performance:
+            current = best.get(p.affiliate)
+            if current is None or p.total_revenue > current.total_revenue:
+                best[p.affiliate] = p
+        existing_products = list(best)
+
+        perf_lines = [
+            f"  - {p.affiliate} ({p.platform}) | Placement: {p.link_placement} | "
+            f"Revenue: ${p.total_revenue:.2f} | Clicks: {p.total_clicks} | "
+            f"Sales: {p.total_sales} | Conv: {p.conversion_rate:.1f}% | "
+            f"Rev/Click: ${p.revenue_per_click:.2f}"
+            for p in best.values()
+        ]
 
-**STEP 2:** {"Include the existing tracked products listed above as your top recommendations, then fill remaining slots with direct competitors ONLY." if affiliate_performance else f"Recommend up to {top_n} products that are the SAME type of product discussed in the video."}
+        perf_section = _PERF_SECTION_TEMPLATE.substitute(
+            perf_lines='\n'.join(perf_lines),
+            unique_products=', '.join(existing_products),
+            remaining_slots=max(0, top_n - len(existing_products))
+        )
 
-**HARD RULES:**
-- Every product must be the SAME product type as the video's topic
-- VPNs, antivirus, password managers, courses are DIFFERENT product types from data broker removal
-- Hosting providers are DIFFERENT product types from frontend frameworks
-- A "related" product in a different category is NOT acceptable
-- If the video compares Product A vs Product B vs Product C, then A, B, C should be your recommendations
-{"- The existing tracked products (" + ', '.join(existing_products[:5]) + ") MUST appear first in your list" if existing_products else ""}
-
-Return JSON:
-{{
-  "products": [
-    {{
-      "product_name": "<specific product name>",
-      "product_category": "<the EXACT product type from Step 1>",
-      "relevance_score": <float 1-10>,
-      "conversion_probability": <float 0-100>,
-      "recommendation_reasoning": "<2-3 sentences. Reference real data if available.>",
-      "where_to_mention": "<specific part of video or description>",
-      "mentioned_in_video": <boolean>,
-      "amazon_asin": "<ASIN if applicable, otherwise null>",
-      "typical_commission_rate": "<estimated commission %>",
-      "price_range": "<low/medium/high>",
-      "target_audience_match": "<why this audience needs this exact product>"
-    }}
-  ]
-}}
-
-**relevance_score:** 9-10 = same product type discussed in video, 7-8 = direct competitor, below 7 = do not include.
-**conversion_probability:** {"Base on REAL conversion rates from tracked data above." if affiliate_performance else "Be realistic, 20-60% for most."}
-
-Return ONLY valid JSON, no other text.
-"""
+        return {
+            'title': title,
+            'description': description,
+            'transcript': transcript,
+            'perf_section': perf_section,
+            'step_2': ("Include the existing tracked products listed above as your top "
+                       "recommendations, then fill remaining slots with direct competitors ONLY."),
+            'existing_rule': (f"- The existing tracked products ({', '.join(existing_products[:5])}) "
+                              f"MUST appear first in your list"),
+            'conversion_guidance': "Base on REAL conversion rates from tracked data above."
+        }
 
     @staticmethod
     def analyze_existing_links(
@@ -242,178 +713,78 @@ Return ONLY valid JSON, no other text.
         Returns:
             Dictionary with link analysis
         """
-        # Extract all URLs from description
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, description)
-
-        # Build set of known affiliate names (lowercased) from BigQuery data
-        known_names = set()
-        if known_affiliates:
-            for name in known_affiliates:
-                known_names.add(name.lower())
-
-        # Analyze each URL
-        link_analysis = []
-        for url in urls:
-            platform = AffiliateRecommender._detect_platform(url, known_names)
-            is_affiliate = AffiliateRecommender._detect_affiliate_link(url, known_names)
-            link_analysis.append({
-                'url': url,
-                'is_affiliate': is_affiliate,
-                'platform': platform
-            })
+        links, has_disclosure = AffiliateRecommender._analyze_cached(
+            description, frozenset(name.lower() for name in known_affiliates or () if name)
+        )
 
-        affiliate_count = sum(1 for link in link_analysis if link['is_affiliate'])
+        link_analysis = [
+            {'url': url, 'is_affiliate': is_affiliate, 'platform': platform}
+            for url, is_affiliate, platform in links
+        ]
         total_links = len(link_analysis)
+        affiliate_count = sum(1 for link in link_analysis if link['is_affiliate'])
 
         return {
             'total_links': total_links,
             'affiliate_links': affiliate_count,
             'non_affiliate_links': total_links - affiliate_count,
             'links': link_analysis,
-            'has_affiliate_disclosure': AffiliateRecommender._check_disclosure(description)
+            'has_affiliate_disclosure': has_disclosure
         }
 
     @staticmethod
-    def _detect_affiliate_link(url: str, known_affiliates: set = None) -> bool:
+    @lru_cache(maxsize=1024)
+    def _analyze_cached(description: str, known_affiliates: frozenset):
         """
-        Detect if URL is likely an affiliate link.
+        Scan a description's links (memoized by description and affiliate set).
+
+        Returns immutable results so cached entries can't be mutated by callers.
 
         Args:
-            url: URL to analyze
-            known_affiliates: Set of lowercase affiliate names from BigQuery
+            description: Video description text
+            known_affiliates: Lowercase affiliate names from BigQuery
 
         Returns:
-            True if likely affiliate link
+            Tuple of ((url, is_affiliate, platform), ...) and the disclosure flag
         """
-        url_lower = url.lower()
-
-        # If a known affiliate name appears in the URL, it's definitely affiliate
-        if known_affiliates:
-            for name in known_affiliates:
-                if name in url_lower:
-                    return True
-
-        # Common affiliate network / tracking patterns
-        affiliate_indicators = [
-            'amzn.to',
-            '/ref=',
-            '?tag=',
-            'affiliate',
-            'aff=',
-            'referral',
-            '/go/',
-            'geni.us',
-            'click.linksynergy.com',
-            'shareasale.com',
-            'cj.com',
-            'avantlink.com',
-            'pxf.io',
-            'dpbolvw.net',
-            'impact.com',
-            'sjv.io',
-            'tkqlhce.com',
-            'jdoqocy.com',
-            'kqzyfj.com',
-        ]
-
-        if any(indicator in url_lower for indicator in affiliate_indicators):
-            return True
-
-        # URL shorteners in YT descriptions are almost always affiliate/tracking links
-        shortener_domains = [
-            'bit.ly/', 'tinyurl.com/', 'ow.ly/', 'buff.ly/',
-            'rebrand.ly/', 'shorturl.at/', 'cutt.ly/',
-        ]
-        if any(domain in url_lower for domain in shortener_domains):
-            return True
-
-        # Deal/offer subdomains (e.g., deal.incogni.io, try.aura.com)
-        if re.search(r'https?://(deal|offer|try|get|go|promo)\.',  url_lower):
-            return True
-
-        return False
-
-    @staticmethod
-    def _detect_platform(url: str, known_affiliates: set = None) -> str:
-        """
-        Detect platform/product from URL using BigQuery affiliate names.
-
-        Args:
-            url: URL to analyze
-            known_affiliates: Set of lowercase affiliate names from BigQuery
-        """
-        url_lower = url.lower()
-
-        # First check against known affiliate names from BigQuery
-        if known_affiliates:
-            for name in known_affiliates:
-                if name in url_lower:
-                    # Return properly capitalized version
-                    return name.title()
-
-        # Common affiliate networks
-        if 'amazon' in url_lower or 'amzn' in url_lower:
-            return 'Amazon'
-        elif 'youtu.be' in url_lower or 'youtube.com' in url_lower:
-            return 'YouTube'
-        elif 'shareasale' in url_lower:
-            return 'ShareASale'
-        elif 'cj.com' in url_lower or 'linksynergy' in url_lower:
-            return 'CJ Affiliate'
-
-        # Try to extract product name from shortener path (e.g., bit.ly/Optery_hWeD1)
-        shorteners = ['bit.ly/', 'tinyurl.com/', 'ow.ly/', 'rebrand.ly/', 'cutt.ly/']
-        for shortener in shorteners:
-            if shortener in url_lower:
-                path = url.split(shortener, 1)[-1].split('?')[0]
-                match = re.match(r'([A-Za-z]+)', path)
-                if match and len(match.group(1)) > 2:
-                    extracted = match.group(1)
-                    # Check if it matches a known affiliate
-                    if known_affiliates and extracted.lower() in known_affiliates:
-                        return extracted.title()
-                    return extracted
-                break
-
-        # Try to extract from deal/offer subdomains (e.g., deal.incogni.io)
-        deal_match = re.search(r'https?://(?:deal|offer|try|get|go|promo)\.([^./]+)', url_lower)
-        if deal_match:
-            return deal_match.group(1).title()
-
-        return 'Other'
-
-    @staticmethod
-    def _check_disclosure(description: str) -> bool:
-        """Check if description contains affiliate disclosure."""
-        disclosure_keywords = [
-            'affiliate',
-            'commission',
-            'compensated',
-            'sponsored',
-            'partner link',
-            'disclosure'
-        ]
+        # Known affiliate names from BigQuery, matched in one case-insensitive
+        # scan (names are already lowercased by analyze_existing_links)
+        known_re = _compile_known_affiliates(known_affiliates) if known_affiliates else None
+
+        # Single pass over the URLs in the description
+        links = tuple(
+            (url, *AffiliateRecommender._classify_url(url, known_re))
+            for url in (match.group(0) for match in _URL_RE.finditer(description))
+        )
 
-        description_lower = description.lower()
-        return any(keyword in description_lower for keyword in disclosure_keywords)
+        # Only prose counts as a disclosure; skip scanning the URLs themselves
+        has_disclosure = AffiliateRecommender._check_disclosure(_URL_RE.sub(' ', description))
+        return links, has_disclosure
 
     def compare_recommendations_to_existing(
         self,
         recommendations: List[Dict],
-        description: str
+        description: str,
+        known_affiliates: list = None
     ) -> Dict:
         """
         Compare AI recommendations to existing links in description.
 
+        The link scan is shared with analyze_existing_links() through the
+        memoized _analyze_cached(), so a description that was already analyzed
+        isn't scanned again.
+
         Args:
             recommendations: List of recommended products
             description: Video description
+            known_affiliates: List of affiliate names from BigQuery
 
         Returns:
             Comparison analysis
         """
-        existing = AffiliateRecommender.analyze_existing_links(description)
+        links, has_disclosure = AffiliateRecommender._analyze_cached(
+            description, frozenset(name.lower() for name in known_affiliates or () if name)
+        )
 
         # Check if recommended products are already mentioned
         description_lower = description.lower()
@@ -424,10 +795,71 @@ Return ONLY valid JSON, no other text.
         new_opportunities = [r for r in recommendations if not r.get('already_mentioned', False)]
 
         return {
-            'existing_affiliate_links': existing['affiliate_links'],
+            'existing_affiliate_links': sum(1 for _, is_affiliate, _ in links if is_affiliate),
             'recommended_products': len(recommendations),
             'already_implemented': len(recommendations) - len(new_opportunities),
             'new_opportunities': len(new_opportunities),
             'new_opportunity_products': new_opportunities,
-            'has_disclosure': existing['has_affiliate_disclosure']
+            'has_disclosure': has_disclosure
         }
+
+    @staticmethod
+    def _classify_url(url: str, known_re=None):
+        """
+        Decide affiliate status and platform for one URL together.
+
+        Args:
+            url: URL to analyze
+            known_re: Compiled known-affiliate pattern (see _compile_known_affiliates)
+
+        Returns:
+            Tuple of (is_affiliate, platform)
+        """
+        known = known_re.search(url) if known_re else None
+        if known:
+            # A known affiliate name in the URL decides platform and status
+            return True, known.group(0).lower().title()
+        return (
+            _AFFILIATE_LINK_RE.search(url) is not None,
+            AffiliateRecommender._platform_from_url(url)
+        )
+
+    @staticmethod
+    def _platform_from_url(url: str) -> str:
+        """
+        Detect the platform from the URL's host and path.
+
+        Known affiliate names are matched by _classify_url() before this runs.
+        """
+        # Everything here only depends on the host and path, so parse once
+        try:
+            parts = urlsplit(url)
+            host = parts.hostname or ''
+        except ValueError:
+            return 'Other'
+        if host.startswith('www.'):
+            host = host[4:]
+        labels = host.split('.')
+
+        # Common affiliate networks (checked in priority order)
+        label_set = set(labels)
+        for network_labels, platform in _PLATFORM_HOST_LABELS:
+            if not label_set.isdisjoint(network_labels):
+                return platform
+
+        # Try to extract product name from shortener path (e.g., bit.ly/Optery_hWeD1)
+        if host in _PLATFORM_SHORTENER_HOSTS:
+            extracted = _LEADING_LETTERS_RE.match(parts.path, 1).group(0)
+            if len(extracted) > 2:
+                return extracted
+
+        # Try to extract from deal/offer subdomains (e.g., deal.incogni.io)
+        if len(labels) > 2 and labels[0] in _DEAL_SUBDOMAINS:
+            return labels[1].title()
+
+        return 'Other'
+
+    @staticmethod
+    def _check_disclosure(description: str) -> bool:
+        """Check if description contains affiliate disclosure."""
+        return _DISCLOSURE_RE.search(description) is not None
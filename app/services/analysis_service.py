@@ -1,65 +1,435 @@
 """Analysis service for orchestrating AI analysis workflows."""
+import contextvars
+import copy
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import List, Optional
-import time
-
-# Import analyzers from local services
-from app.services.content_analyzer import ContentAnalyzer
-from app.services.description_analyzer import DescriptionAnalyzer
-from app.services.affiliate_recommender import AffiliateRecommender
-from app.services.conversion_analyzer import ConversionAnalyzer
-from app.services.script_scoring_service import ScriptScoringService
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional
 
+# Analyzers (and the Anthropic SDK) are imported where they're first built,
+# so importing this module doesn't pay for analyzers that never run
+from app.utils.rate_limiter import TokenBucket
+from app.utils.ttl_cache import TTLCache
 from app.models import (
-    ScriptAnalysis, AffiliateRecommendation, DescriptionAnalysis,
-    ConversionAnalysis, AnalysisResults
+    Video, RevenueMetrics, ScriptAnalysis, AffiliateRecommendation,
+    DescriptionAnalysis, ConversionAnalysis, AnalysisResults
 )
 
 logger = logging.getLogger(__name__)
 
+# Analyzer result fields copied onto each model. Required model fields get
+# the defaults below; the rest fall back to the model's own field defaults.
+_SCRIPT_FIELDS = frozenset((
+    'script_quality_score', 'hook_effectiveness_score', 'call_to_action_score',
+    'persuasion_effectiveness_score', 'user_intent_match_score',
+    'persuasion_techniques', 'key_strengths', 'improvement_areas',
+    'target_audience', 'content_value_score', 'identified_intent',
+    'has_clear_intro', 'has_clear_cta', 'problem_solution_structure',
+    'readability_score'
+))
+_SCRIPT_DEFAULTS = {
+    'script_quality_score': 0.0,
+    'hook_effectiveness_score': 0.0,
+    'call_to_action_score': 0.0,
+    'persuasion_effectiveness_score': 0.0,
+    'user_intent_match_score': 0.0
+}
+
+_DESCRIPTION_FIELDS = frozenset((
+    'cta_effectiveness_score', 'description_quality_score', 'seo_score',
+    'total_links', 'affiliate_links', 'link_positioning_score', 'has_clear_cta',
+    'optimization_suggestions', 'missing_elements', 'strengths'
+))
+_DESCRIPTION_DEFAULTS = {
+    'cta_effectiveness_score': 0.0,
+    'description_quality_score': 0.0,
+    'seo_score': 0.0
+}
+
+_RECOMMENDATION_FIELDS = frozenset((
+    'product_name', 'product_category', 'relevance_score',
+    'conversion_probability', 'recommendation_reasoning', 'where_to_mention',
+    'mentioned_in_video', 'amazon_asin', 'price_range'
+))
+_RECOMMENDATION_DEFAULTS = {
+    'product_name': '',
+    'product_category': '',
+    'relevance_score': 0.0,
+    'conversion_probability': 0.0,
+    'recommendation_reasoning': '',
+    'where_to_mention': ''
+}
+
+
+# Conversion model fields taken from the AI analysis (all have model defaults)
+_CONVERSION_FIELDS = frozenset(('conversion_drivers', 'underperformance_reasons', 'recommendations'))
+
+# Prompt-size estimate for the tokens-per-minute limit: analyzers truncate
+# inputs to at most the script prompt's 15k-char excerpt, and their
+# instructions add roughly a fixed number of tokens
+_MAX_PROMPT_INPUT_CHARS = 15000
+_PROMPT_INSTRUCTION_TOKENS = 1500
+
+# Characters of text normalized at a time by _text_fingerprint()
+_FINGERPRINT_WINDOW_CHARS = 64 * 1024
+
+# Fingerprints computed during one analyze_video call, as id(text) ->
+# (text, fingerprint). Set only in the contexts of that video's steps, so the
+# texts are released when the video finishes.
+_video_fingerprints: contextvars.ContextVar[Optional[Dict[int, tuple]]] = contextvars.ContextVar(
+    '_video_fingerprints', default=None
+)
+
+# False while analyze_video(use_cache=False) runs a video's steps: cached Claude
+# results aren't read, but fresh ones still replace them
+_read_result_cache: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    '_read_result_cache', default=True
+)
+
+# Transcripts shorter than this (blank, or a caption stub) are treated as
+# missing, so the transcript-based analyses don't spend a Claude call on them
+_MIN_TRANSCRIPT_CHARS = 200
+
+
+def _noop_progress(*args, **kwargs):
+    """Progress reporter used when analyze_video has no progress callback."""
+
+
+def _text_fingerprint(text: str) -> str:
+    """
+    Whitespace-insensitive digest of an analyzer input.
+
+    The script, description and conversion steps all key their cached results
+    on the same transcript and description, so within analyze_video each text
+    is normalized and hashed once per video instead of once per step.
+
+    Long transcripts are normalized and hashed a window at a time, so a
+    multi-megabyte transcript is never split into one big word list. The
+    digest is the same as hashing ' '.join(text.split()) in one go.
+    """
+    memo = _video_fingerprints.get()
+    if memo is not None:
+        hit = memo.get(id(text))
+        if hit is not None and hit[0] is text:
+            return hit[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    carry = ''  # Word cut off at the end of the previous window
+    separator = ''
+    for start in range(0, len(text), _FINGERPRINT_WINDOW_CHARS):
+        window = carry + text[start:start + _FINGERPRINT_WINDOW_CHARS]
+        words = window.split()
+        carry = words.pop() if words and not window[-1].isspace() else ''
+        if words:
+            digest.update((separator + ' '.join(words)).encode('utf-8'))
+            separator = ' '
+    if carry:
+        digest.update((separator + carry).encode('utf-8'))
+    fingerprint = digest.hexdigest()
+    if memo is not None:
+        # Keeping the text alive keeps its id() from being reused
+        memo[id(text)] = (text, fingerprint)
+    return fingerprint
+
+
+def _estimate_input_tokens(texts) -> int:
+    """Rough prompt-token estimate (about four characters per token) for the tokens-per-minute limit."""
+    chars = sum(min(len(text), _MAX_PROMPT_INPUT_CHARS) for text in texts if isinstance(text, str))
+    return _PROMPT_INSTRUCTION_TOKENS + chars // 4
+
+
+def _usable_transcript(transcript: Optional[str]) -> Optional[str]:
+    """The transcript, or None if it's too short to be worth analyzing."""
+    if transcript and len(transcript.strip()) >= _MIN_TRANSCRIPT_CHARS:
+        return transcript
+    return None
+
+
+def _model_kwargs(result: Dict, field_names: frozenset, defaults: Dict) -> Dict:
+    """Pick the known fields from an analyzer result, filling in required defaults."""
+    return {**defaults, **{k: v for k, v in result.items() if k in field_names}}
+
+
+def _revenue_kwargs(revenue_metrics: RevenueMetrics) -> Dict:
+    """ConversionAnalysis fields taken from the video's revenue metrics."""
+    return {
+        'metrics_date': revenue_metrics.metrics_date,
+        'revenue': revenue_metrics.revenue,
+        'clicks': revenue_metrics.clicks,
+        'sales': revenue_metrics.sales,
+        'views': revenue_metrics.organic_views,
+        'conversion_rate': revenue_metrics.conversion_rate,
+        'revenue_per_click': revenue_metrics.revenue_per_click,
+        'revenue_per_1k_views': revenue_metrics.revenue_per_1k_views,
+    }
+
+
+@dataclass(slots=True, frozen=True)
+class PrefetchedVideoData:
+    """BigQuery inputs for one video, fetched in bulk by batch_analyze."""
+    video: Optional[Video]
+    transcript: Optional[str]
+    revenue_metrics: Optional[RevenueMetrics]
+    yt_analytics: Optional[Dict]
+
+
+class AnalysisWriteBuffer:
+    """
+    Collect analysis results from many analyses and store them in bulk.
+
+    batch_analyze passes one of these to each analyze_video call so the
+    results of the whole batch are written with a few executemany calls in
+    one transaction instead of one connection per result. A standalone
+    analyze_video call uses its own buffer for the same reason.
+
+    If a bulk write fails, its rows are stored again one at a time with the
+    single-result store methods, so one bad row doesn't lose the rest. Rows
+    that still can't be stored are logged and kept in failed.
+    """
+
+    KINDS = ('script_analyses', 'description_analyses',
+             'conversion_analyses', 'affiliate_recommendations')
+
+    # Single-result BigQueryService store methods used when a bulk write fails
+    # (affiliate recommendations are stored per video)
+    _SINGLE_STORES = {
+        'script_analyses': 'store_script_analysis',
+        'description_analyses': 'store_description_analysis',
+        'conversion_analyses': 'store_conversion_analysis',
+        'affiliate_recommendations': 'store_affiliate_recommendations',
+    }
+
+    def __init__(self, bigquery_service, autoflush_rows: int = 500):
+        """
+        Args:
+            bigquery_service: BigQueryService whose store_analysis_batch() is used
+            autoflush_rows: Store pending rows once this many have been added
+        """
+        self.bigquery = bigquery_service
+        self.autoflush_rows = autoflush_rows
+        self._lock = threading.Lock()
+        self._pending = {kind: [] for kind in self.KINDS}
+        self._rows = 0
+        # (kind, video_id) of every row that couldn't be stored
+        self.failed = []
+
+    def add(self, kind: str, rows: list):
+        """Queue result rows of one kind (see KINDS) for storage."""
+        with self._lock:
+            self._pending[kind].extend(rows)
+            self._rows += len(rows)
+            batch = self._take() if self._rows >= self.autoflush_rows else None
+        if batch:
+            self._store(batch)
+
+    def flush(self) -> bool:
+        """
+        Store everything still pending.
+
+        Returns:
+            False if any of the pending rows couldn't be stored
+        """
+        with self._lock:
+            batch = self._take()
+        return not (batch and self._store(batch))
+
+    def _take(self) -> Optional[Dict[str, list]]:
+        """Swap out the pending rows (caller holds the lock)."""
+        if not self._rows:
+            return None
+        batch = self._pending
+        self._pending = {kind: [] for kind in self.KINDS}
+        self._rows = 0
+        return batch
+
+    def _store(self, batch: Dict[str, list]) -> list:
+        """
+        Store a batch in one write, falling back to per-row writes if it fails.
+
+        Returns:
+            (kind, video_id) of the rows that couldn't be stored
+        """
+        if self.bigquery.store_analysis_batch(**batch):
+            return []
+
+        logger.warning(f"Bulk store of {sum(map(len, batch.values()))} analysis rows failed, "
+                       f"storing them one at a time")
+        failed = []
+        for kind, rows in batch.items():
+            store = getattr(self.bigquery, self._SINGLE_STORES[kind])
+            if kind == 'affiliate_recommendations':
+                # Each video's recommendations replace its previous set together
+                by_video = {}
+                for rec in rows:
+                    by_video.setdefault(rec.video_id, []).append(rec)
+                items = [(video_id, recs) for video_id, recs in by_video.items()]
+            else:
+                items = [(row.video_id, row) for row in rows]
+
+            for video_id, item in items:
+                try:
+                    stored = store(item)
+                except Exception as e:
+                    logger.warning(f"Error storing {kind} for video {video_id}: {e}")
+                    stored = False
+                if not stored:
+                    logger.error(f"Failed to store {kind} for video {video_id}")
+                    failed.append((kind, video_id))
+
+        if failed:
+            with self._lock:
+                self.failed.extend(failed)
+        return failed
+
 
 class AnalysisService:
     """Service for orchestrating AI analysis of YouTube videos."""
 
-    def __init__(self, bigquery_service, anthropic_api_key: str):
+    def __init__(self, bigquery_service, anthropic_api_key: str,
+                 recommendation_cache=None, recommendation_cache_timeout: int = 86400,
+                 max_concurrent_requests: int = 4, requests_per_minute: int = 50,
+                 input_tokens_per_minute: int = 0, max_retries: int = 4,
+                 fetch_cache_timeout: int = 300,
+                 combine_script_description: bool = False,
+                 combine_script_conversion: bool = False):
         """
         Initialize analysis service.
 
         Args:
             bigquery_service: BigQueryService instance
             anthropic_api_key: Anthropic API key for Claude
+            recommendation_cache: Shared cache for affiliate recommendation and
+                                  analyzer results (defaults to an in-process LRU)
+            recommendation_cache_timeout: Seconds to reuse cached AI results
+            max_concurrent_requests: Max Claude requests in flight across all
+                                     analyses sharing this service
+            requests_per_minute: Claude analyzer calls allowed per minute across
+                                 all analyses sharing this service
+            input_tokens_per_minute: Estimated prompt tokens allowed per minute
+                                     across all analyses (0 to disable)
+            max_retries: Retries, with exponential backoff, for rate-limited
+                         or failed Claude requests
+            fetch_cache_timeout: Seconds to reuse per-video BigQuery fetches
+                                 across re-runs
+            combine_script_description: Score the script and the description
+                                        in one Claude request when both are
+                                        requested
+            combine_script_conversion: Run the script and the conversion
+                                       analyses in one Claude request when
+                                       both are requested (and the script
+                                       isn't combined with the description)
         """
         self.bigquery = bigquery_service
         self.anthropic_api_key = anthropic_api_key
 
-        # Initialize analyzers
-        self.content_analyzer = ContentAnalyzer(anthropic_api_key)
-        self.description_analyzer = DescriptionAnalyzer(anthropic_api_key)
-        self.affiliate_recommender = AffiliateRecommender(anthropic_api_key)
-        self.conversion_analyzer = ConversionAnalyzer(anthropic_api_key)
-        self.script_scoring_service = ScriptScoringService(
-            api_key=anthropic_api_key,
-            local_db=bigquery_service.local_db,
-            bigquery_service=bigquery_service
+        # Shared limits on Claude requests: a cap on requests in flight and a
+        # token bucket for the per-minute rate (a call only waits when the
+        # bucket is empty)
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
+        self._request_limiter = TokenBucket(requests_per_minute)
+        self._input_token_limiter = TokenBucket(input_tokens_per_minute) if input_tokens_per_minute else None
+        self.max_retries = max_retries
+
+        # Analyzer results reused while their inputs are unchanged
+        self.result_cache = recommendation_cache if recommendation_cache is not None else TTLCache()
+        self.result_cache_timeout = recommendation_cache_timeout
+
+        # Per-video BigQuery reads reused when a video is re-analyzed
+        self.fetch_cache_timeout = fetch_cache_timeout
+        self._fetch_cache = TTLCache(maxsize=512)
+
+        self.combine_script_description = combine_script_description
+        self.combine_script_conversion = combine_script_conversion
+
+        # Analyzers (and their API clients) are built on first use; see the
+        # properties below
+        self._recommendation_cache = recommendation_cache
+
+        logger.info("AnalysisService initialized")
+
+    @cached_property
+    def anthropic_client(self):
+        from anthropic import Anthropic
+
+        # One client (and HTTP connection pool) shared by every analyzer, so
+        # calls reuse warm TLS connections; the client is thread-safe
+        return Anthropic(api_key=self.anthropic_api_key, max_retries=self.max_retries)
+
+    @cached_property
+    def content_analyzer(self):
+        from app.services.content_analyzer import ContentAnalyzer
+        return ContentAnalyzer(self.anthropic_api_key, client=self.anthropic_client)
+
+    @cached_property
+    def description_analyzer(self):
+        from app.services.description_analyzer import DescriptionAnalyzer
+        if not self.anthropic_api_key:
+            return DescriptionAnalyzer(None)
+        return DescriptionAnalyzer(self.anthropic_api_key, client=self.anthropic_client)
+
+    @cached_property
+    def affiliate_recommender(self):
+        from app.services.affiliate_recommender import AffiliateRecommender
+        return AffiliateRecommender(
+            self.anthropic_api_key,
+            result_cache=self._recommendation_cache,
+            result_cache_timeout=self.result_cache_timeout,
+            client=self.anthropic_client,
+            request_gate=self._claude_request
         )
 
-        logger.info("AnalysisService initialized with all analyzers")
+    @cached_property
+    def conversion_analyzer(self):
+        from app.services.conversion_analyzer import ConversionAnalyzer
+        return ConversionAnalyzer(self.anthropic_api_key, client=self.anthropic_client)
+
+    @cached_property
+    def script_scoring_service(self):
+        from app.services.script_scoring_service import ScriptScoringService
+        return ScriptScoringService(
+            api_key=self.anthropic_api_key,
+            local_db=self.bigquery.local_db,
+            bigquery_service=self.bigquery,
+            client=self.anthropic_client,
+            request_gate=self._claude_request
+        )
 
     def analyze_video(
         self,
         video_id: str,
         analysis_types: List[str],
-        progress_callback: callable = None
+        progress_callback: callable = None,
+        prefetched: Optional[PrefetchedVideoData] = None,
+        write_buffer: Optional[AnalysisWriteBuffer] = None,
+        use_cache: bool = True
     ) -> AnalysisResults:
         """
         Run AI analysis on a single video.
 
+        The requested analyses only share read-only inputs and write to
+        separate tables, so they run concurrently on a small thread pool.
+        Conversion analysis waits for the script analysis when both are
+        requested, since it uses the script scores.
+
         Args:
             video_id: YouTube video ID
             analysis_types: List of analysis types to run
                           ['script', 'description', 'affiliate', 'conversion']
             progress_callback: Optional callback(step, progress, message) for progress updates
+            prefetched: BigQuery inputs already fetched by batch_analyze; skips
+                        the per-video BigQuery reads when given
+            write_buffer: Buffer that collects results for a bulk write; when
+                          None, this video's results are stored together in
+                          one transaction once every step has finished
+            use_cache: Reuse cached Claude results for unchanged inputs; pass
+                       False for user-requested re-analyses so every step
+                       makes a fresh request
 
         Returns:
             AnalysisResults object
@@ -67,247 +437,575 @@ class AnalysisService:
         Raises:
             Exception if video not found or analysis fails
         """
-        def update_progress(step: str, progress: int, message: str = ""):
-            """Update progress via callback if provided."""
-            if progress_callback:
+        if progress_callback is None:
+            # Nothing to report to: skip the lock and bookkeeping entirely
+            update_progress = step_progress = _noop_progress
+        else:
+            progress_lock = threading.Lock()
+            current_progress = [10]
+
+            def update_progress(step: str, progress: int, message: str = ""):
+                """Update progress via the callback."""
                 try:
                     progress_callback(step, progress, message)
                 except Exception as e:
                     logger.warning(f"Progress callback error: {e}")
 
+            def step_progress(step: str, message: str = "", completed: bool = False):
+                """Report progress from a step; completed steps advance the bar."""
+                with progress_lock:
+                    if completed:
+                        current_progress[0] += step_share
+                    update_progress(step, current_progress[0], message)
+
         logger.info(f"Starting analysis for video: {video_id}")
-        logger.info(f"Analysis types: {analysis_types}")
+        logger.debug(f"Analysis types: {analysis_types}")
+        # Resolve once for O(1) membership checks (a no-op copy for frozensets)
+        requested = frozenset(analysis_types)
 
-        # Fetch video data from BigQuery
-        video = self.bigquery.get_video_by_id(video_id)
-        if not video:
-            raise Exception(f"Video not found: {video_id}")
+        # Fetch video, local transcript and revenue metrics in parallel
+        local_db = self.bigquery.local_db
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix=f'fetch-{video_id}') as pool:
+            # Local transcripts change on re-transcription, so they're never cached
+            local_future = pool.submit(local_db.get_transcript, video_id) if local_db else None
+            if prefetched is None:
+                video_future = pool.submit(self._fetch_cached, 'video', video_id, self.bigquery.get_video_by_id)
+                revenue_future = pool.submit(self._fetch_cached, 'revenue', video_id, self.bigquery.get_revenue_metrics)
 
-        # Fetch transcript - check local DB first, then BigQuery
-        transcript = None
-        local_transcript = None
+            # Fetch transcript - check local DB first, then BigQuery
+            local_transcript = local_future.result() if local_future else None
+            transcript = _usable_transcript(local_transcript.get('transcript')) if local_transcript else None
 
-        # Check local DB for transcript (from our transcription service)
-        if self.bigquery.local_db:
-            local_transcript = self.bigquery.local_db.get_transcript(video_id)
-            if local_transcript:
-                transcript = local_transcript.get('transcript')
-                logger.info(f"Using local transcript for {video_id} ({local_transcript.get('word_count')} words)")
+            # Start the BigQuery fallback as soon as the local lookup misses,
+            # so it overlaps the video fetch instead of following it
+            transcript_future = None
+            if not transcript and prefetched is None:
+                transcript_future = pool.submit(self._fetch_cached, 'transcript', video_id, self.bigquery.get_transcript)
 
-                # Also get description from local transcript if video doesn't have one
-                if (not video.description or not video.description.strip()) and local_transcript.get('description'):
-                    video.description = local_transcript.get('description')
-                    logger.info(f"Using description from local transcript for {video_id}")
+            video = video_future.result() if prefetched is None else prefetched.video
+            if not video:
+                raise Exception(f"Video not found: {video_id}")
+            # The cached video is shared; this run may fill in its description
+            video = copy.copy(video)
 
-        # Fallback to BigQuery transcript
-        if not transcript:
-            transcript = self.bigquery.get_transcript(video_id)
+            # Check local DB for transcript (from our transcription service)
+            if transcript:
+                logger.debug(f"Using local transcript for {video_id} ({local_transcript.get('word_count')} words)")
 
-        if not transcript and 'script' in analysis_types:
-            logger.warning(f"No transcript found for video: {video_id}")
-            # Continue anyway - some analyses might not need transcript
+            # Also get description from local transcript if video doesn't have one
+            local_description = self._local_description(video, local_transcript)
+            if local_description:
+                video.description = local_description
+                logger.debug(f"Using description from local transcript for {video_id}")
+
+            # Fallback to BigQuery transcript
+            if not transcript:
+                transcript = _usable_transcript(
+                    transcript_future.result() if transcript_future else prefetched.transcript
+                )
 
-        # Fetch revenue metrics
-        revenue_metrics = self.bigquery.get_revenue_metrics(video_id)
+            revenue_metrics = revenue_future.result() if prefetched is None else prefetched.revenue_metrics
 
-        # Initialize results
-        script_analysis = None
-        description_analysis = None
-        affiliate_recommendations = []
-        conversion_analysis = None
+        if not transcript and 'script' in requested:
+            logger.warning(f"No transcript found for video: {video_id}")
+            # Continue anyway - some analyses might not need transcript
 
         # Run analyses based on requested types
         timestamp = datetime.now()
         update_progress('fetching', 10, 'Video data loaded, starting analysis...')
 
-        # 1. Script Quality Analysis
-        if 'script' in analysis_types and transcript:
-            update_progress('script', 15, 'Analyzing script quality...')
+        steps = []
+        if 'script' in requested and transcript:
+            steps.append('script')
+        if 'description' in requested:
+            steps.append('description')
+        if 'affiliate' in requested and (transcript or video.title or video.description):
+            steps.append('affiliate')
+        if 'conversion' in requested:
+            steps.append('conversion')
+        if 'script_score' in requested and transcript:
+            steps.append('script_score')
+
+        step_share = 85 // len(steps) if steps else 0
+        futures = {}
+        # Without a batch buffer, collect this video's rows and store them
+        # in a single multi-table write rather than one per step
+        own_buffer = write_buffer is None
+        if own_buffer:
+            write_buffer = AnalysisWriteBuffer(self.bigquery)
+        # Resolved as soon as the script scores exist, so conversion's Claude
+        # call overlaps the script step's database write
+        script_scores = Future() if 'script' in steps else None
+        # One Claude request for both script and description scores
+        combine = (self.combine_script_description and 'script' in steps and 'description' in steps
+                   and bool(video.description and video.description.strip()))
+        # ...or for script and conversion scores, when conversion will call Claude
+        combine_conversion = (not combine and self.combine_script_conversion
+                              and 'script' in steps and 'conversion' in steps
+                              and bool(revenue_metrics and revenue_metrics.clicks > 0))
+        combined = None
+
+        if steps:
+            # Shared by this video's steps only, and dropped with them
+            fingerprints = {}
+            with ThreadPoolExecutor(max_workers=len(steps) + (combine or combine_conversion),
+                                    thread_name_prefix=f'analyze-{video_id}') as pool:
+                def run_in_context(fn, *args):
+                    # Each task runs in a copy of the caller's context so
+                    # app-context-bound callbacks and caches keep working
+                    context = contextvars.copy_context()
+                    context.run(_video_fingerprints.set, fingerprints)
+                    context.run(_read_result_cache.set, use_cache)
+                    return pool.submit(context.run, fn, *args)
+
+                def submit(step, fn, *args):
+                    futures[step] = run_in_context(fn, *args)
+
+                if combine:
+                    combined = run_in_context(self._run_combined_analysis,
+                                              video_id, video, transcript,
+                                              prefetched.yt_analytics if prefetched else None)
+                elif combine_conversion:
+                    combined = run_in_context(self._run_combined_conversion_analysis,
+                                              video_id, video, transcript, revenue_metrics)
+
+                # Script is submitted first so conversion can wait on it
+                if 'script' in steps:
+                    submit('script', self._run_script_analysis,
+                           video_id, video, transcript, timestamp, combined, script_scores,
+                           write_buffer, step_progress)
+                if 'description' in steps:
+                    submit('description', self._run_description_analysis,
+                           video_id, video, timestamp,
+                           prefetched.yt_analytics if prefetched else None,
+                           combined if combine else None, write_buffer, step_progress)
+                if 'affiliate' in steps:
+                    submit('affiliate', self._run_affiliate_recommendations,
+                           video_id, video, transcript, timestamp, write_buffer, step_progress)
+                if 'conversion' in steps:
+                    submit('conversion', self._run_conversion_analysis,
+                           video_id, video, transcript, revenue_metrics, timestamp,
+                           script_scores, combined if combine_conversion else None,
+                           write_buffer, step_progress)
+                if 'script_score' in steps:
+                    submit('script_score', self._run_script_scoring,
+                           video_id, video, transcript, local_transcript, step_progress)
+
+        # Each step handles its own errors, so results are always available
+        results = {step: future.result() for step, future in futures.items()}
+
+        update_progress('saving', 98, 'Finalizing results...')
+        # flush() already retried failed rows one at a time; whatever is
+        # still unsaved means the run didn't complete
+        if own_buffer and not write_buffer.flush():
+            raise Exception(f"Failed to store analysis results for {video_id}: "
+                            + ', '.join(kind for kind, _ in write_buffer.failed))
+        # Return combined results
+        return AnalysisResults(
+            video=video,
+            revenue_metrics=revenue_metrics,
+            script_analysis=results.get('script'),
+            affiliate_recommendations=results.get('affiliate') or [],
+            description_analysis=results.get('description'),
+            conversion_analysis=results.get('conversion'),
+            script_score=results.get('script_score')
+        )
+
+    def _fetch_cached(self, kind: str, video_id: str, fetch):
+        """
+        Fetch per-video data through the in-process cache.
+
+        Empty results and error summaries are not cached, so data that shows
+        up later (or a query that failed) is fetched again on the next run.
+
+        Args:
+            kind: Cache namespace for the fetch
+            video_id: YouTube video ID
+            fetch: Callable taking the video ID
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        key = f'{kind}_{video_id}'
+        value = self._fetch_cache.get(key)
+        if value is None:
+            value = fetch(video_id)
+            if value and not (isinstance(value, dict) and value.get('error')):
+                self._fetch_cache.set(key, value, timeout=self.fetch_cache_timeout)
+        return value
+
+    def invalidate_video(self, video_id: str):
+        """
+        Drop a video's cached BigQuery fetches so the next run re-reads them.
+
+        Args:
+            video_id: YouTube video ID
+        """
+        for kind in ('video', 'transcript', 'revenue', 'yt_analytics'):
+            self._fetch_cache.delete(f'{kind}_{video_id}')
+
+    @contextmanager
+    def _claude_request(self, *texts: Optional[str]):
+        """
+        Wait for rate-limit budget, then hold a request slot for one analyzer call.
+
+        Args:
+            *texts: Prompt inputs, used to estimate the request's input tokens
+                    for the tokens-per-minute limit
+        """
+        self._request_limiter.acquire()
+        if self._input_token_limiter:
+            self._input_token_limiter.acquire(_estimate_input_tokens(texts))
+        with self._request_slots:
+            yield
+
+    def _run_analyzer(self, kind: str, analyze, model: str, is_complete, **inputs) -> Optional[Dict]:
+        """
+        Call an analyzer through the result cache and the shared request slots.
+
+        Inputs that only differ in whitespace share a cache entry, so
+        re-analyzing an unchanged video (or a reformatted description) skips
+        the Claude request, unless analyze_video was told not to use the cache.
+
+        Args:
+            kind: Analysis kind, used in the cache key
+            analyze: Analyzer method to call with the inputs
+            model: Model the analyzer uses (part of the cache key)
+            is_complete: Predicate telling whether a result is worth caching
+            **inputs: Keyword arguments for the analyzer
+
+        Returns:
+            Analyzer result (a private copy when served from the cache)
+        """
+        cache_key = self._result_cache_key(kind, model, inputs)
+        cached = None
+        if _read_result_cache.get():
+            try:
+                cached = self.result_cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Analysis cache read failed: {e}")
+        if cached is not None:
+            logger.debug(f"Using cached {kind} analysis")
+            return copy.deepcopy(cached)
+
+        with self._claude_request(*inputs.values()):
+            result = analyze(**inputs)
+
+        if result is not None and is_complete(result):
             try:
-                logger.info(f"Running script analysis for {video_id}")
-                result = self.content_analyzer.analyze_script_quality(
+                self.result_cache.set(cache_key, copy.deepcopy(result), timeout=self.result_cache_timeout)
+            except Exception as e:
+                logger.warning(f"Analysis cache write failed: {e}")
+        return result
+
+    @staticmethod
+    def _result_cache_key(kind: str, model: str, inputs: Dict) -> str:
+        """Content-addressed cache key for analyzer inputs, ignoring whitespace differences."""
+        normalized = {
+            name: _text_fingerprint(value) if isinstance(value, str) else value
+            for name, value in inputs.items()
+        }
+        payload = json.dumps([kind, model, normalized], sort_keys=True, default=str)
+        return f'analysis_{kind}_' + hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _run_script_analysis(self, video_id: str, video, transcript: str, timestamp: datetime,
+                             combined: Optional[Future], scores_ready: Optional[Future],
+                             write_buffer: AnalysisWriteBuffer,
+                             step_progress) -> Optional[ScriptAnalysis]:
+        """
+        Run and store the script quality analysis.
+
+        Args:
+            combined: Pending combined script + description (or script +
+                      conversion) request, or None to use the focused analyzer
+            scores_ready: Future resolved with the ScriptAnalysis (or None on
+                          failure) before it is stored
+        """
+        step_progress('script', 'Analyzing script quality...')
+        try:
+            logger.debug(f"Running script analysis for {video_id}")
+            result = combined.result()[0] if combined else None
+            if result is None:
+                result = self._run_analyzer(
+                    'script', self.content_analyzer.analyze_script_quality,
+                    self.content_analyzer.model, lambda r: True,
                     transcript=transcript,
                     title=video.title,
                     description=video.description
                 )
 
-                # Convert to ScriptAnalysis model
-                script_analysis = ScriptAnalysis(
-                    video_id=video_id,
-                    channel_code=video.channel_code,
-                    analysis_timestamp=timestamp,
-                    script_quality_score=result.get('script_quality_score', 0.0),
-                    hook_effectiveness_score=result.get('hook_effectiveness_score', 0.0),
-                    call_to_action_score=result.get('call_to_action_score', 0.0),
-                    persuasion_effectiveness_score=result.get('persuasion_effectiveness_score', 0.0),
-                    user_intent_match_score=result.get('user_intent_match_score', 0.0),
-                    persuasion_techniques=result.get('persuasion_techniques', []),
-                    key_strengths=result.get('key_strengths', []),
-                    improvement_areas=result.get('improvement_areas', []),
-                    target_audience=result.get('target_audience', ''),
-                    content_value_score=result.get('content_value_score', 0.0),
-                    identified_intent=result.get('identified_intent', ''),
-                    has_clear_intro=result.get('has_clear_intro', False),
-                    has_clear_cta=result.get('has_clear_cta', False),
-                    problem_solution_structure=result.get('problem_solution_structure', False),
-                    readability_score=result.get('readability_score', 0.0)
-                )
+            # Convert to ScriptAnalysis model
+            script_analysis = ScriptAnalysis(
+                video_id=video_id,
+                channel_code=video.channel_code,
+                analysis_timestamp=timestamp,
+                **_model_kwargs(result, _SCRIPT_FIELDS, _SCRIPT_DEFAULTS)
+            )
+            if scores_ready:
+                scores_ready.set_result(script_analysis)
 
-                # Store to BigQuery
-                self.bigquery.store_script_analysis(script_analysis)
-                logger.info(f"Script analysis completed and stored for {video_id}")
-                update_progress('script', 35, 'Script analysis complete')
+            # Queue for the video's (or batch's) multi-table write
+            write_buffer.add('script_analyses', [script_analysis])
+            logger.debug(f"Script analysis completed for {video_id}")
+            step_progress('script', 'Script analysis complete', completed=True)
+            return script_analysis
 
-            except Exception as e:
-                logger.error(f"Error in script analysis: {str(e)}")
+        except Exception as e:
+            logger.exception(f"Error in script analysis: {e}")
+            return None
 
-            # Rate limiting
-            time.sleep(2)
+        finally:
+            # Never leave conversion waiting on a failed analysis
+            if scores_ready and not scores_ready.done():
+                scores_ready.set_result(None)
 
-        # 2. Description Analysis
-        if 'description' in analysis_types:
-            update_progress('description', 40, 'Analyzing description...')
-            try:
+    def _run_description_analysis(self, video_id: str, video, timestamp: datetime,
+                                  yt_analytics_summary: Optional[Dict],
+                                  combined: Optional[Future],
+                                  write_buffer: AnalysisWriteBuffer,
+                                  step_progress) -> Optional[DescriptionAnalysis]:
+        """
+        Run and store the description analysis, including YT Analytics data.
+
+        Args:
+            yt_analytics_summary: Prefetched YT Analytics summary, or None to
+                                  fetch it here
+            combined: Pending combined script + description request, or None
+                      to use the focused analyzer
+        """
+        step_progress('description', 'Analyzing description...')
+        try:
+            ai_scores = None
+            if combined:
+                _, ai_scores, yt_analytics_summary = combined.result()
+            if yt_analytics_summary is None:
                 # Fetch YT Analytics data from BigQuery (last 90 days) - always try this
-                update_progress('description', 42, 'Fetching YT Analytics data...')
-                yt_analytics_summary = self.bigquery.get_yt_analytics_summary(video_id, days=90)
-                logger.info(f"YT Analytics for {video_id}: {yt_analytics_summary.get('total_views', 0)} views, {len(yt_analytics_summary.get('by_traffic_source', []))} traffic sources")
+                step_progress('description', 'Fetching YT Analytics data...')
+                yt_analytics_summary = self._fetch_cached('yt_analytics', video_id, self.bigquery.get_yt_analytics_summary)
+            yt = yt_analytics_summary.get
+            yt_by_traffic_source = yt('by_traffic_source', [])
+            logger.debug(f"YT Analytics for {video_id}: {yt('total_views', 0)} views, "
+                         f"{len(yt_by_traffic_source)} traffic sources")
 
-                # Check if we have a description to analyze
-                if video.description and video.description.strip():
-                    logger.info(f"Running description analysis for {video_id} (description length: {len(video.description)})")
+            # Check if we have a description to analyze
+            if video.description and video.description.strip():
+                logger.debug(f"Running description analysis for {video_id} "
+                             f"(description length: {len(video.description)})")
 
-                    # Run AI description analysis
-                    update_progress('description', 45, 'Running AI description analysis...')
+                # Run AI description analysis
+                step_progress('description', 'Running AI description analysis...')
+                if ai_scores:
+                    # Scored by the combined request; only the rule-based part runs here
                     result = self.description_analyzer.analyze(
+                        video.description, video.title, yt_analytics_summary, ai_analysis=ai_scores
+                    )
+                else:
+                    # Results without the AI scores (failed AI call) aren't cached
+                    result = self._run_analyzer(
+                        'description', self.description_analyzer.analyze,
+                        self.description_analyzer.model,
+                        lambda r: 'description_quality_score' in r,
                         description=video.description,
                         title=video.title,
                         yt_analytics=yt_analytics_summary  # Pass YT Analytics data
                     )
-                else:
-                    logger.warning(f"No description available for {video_id}, storing YT Analytics data only")
-                    # Create minimal result with just YT Analytics data
-                    result = {
-                        'cta_effectiveness_score': 0.0,
-                        'description_quality_score': 0.0,
-                        'seo_score': 0.0,
-                        'total_links': 0,
-                        'affiliate_links': 0,
-                        'link_positioning_score': 0.0,
-                        'has_clear_cta': False,
-                        'optimization_suggestions': ['No description available - run Transcribe & Analyze to fetch from YouTube'],
-                        'missing_elements': ['Video description not available'],
-                        'strengths': []
-                    }
-
-                # Convert to DescriptionAnalysis model with YT Analytics data
-                description_analysis = DescriptionAnalysis(
-                    video_id=video_id,
-                    analysis_timestamp=timestamp,
-                    cta_effectiveness_score=result.get('cta_effectiveness_score', 0.0),
-                    description_quality_score=result.get('description_quality_score', 0.0),
-                    seo_score=result.get('seo_score', 0.0),
-                    total_links=result.get('total_links', 0),
-                    affiliate_links=result.get('affiliate_links', 0),
-                    link_positioning_score=result.get('link_positioning_score', 0.0),
-                    has_clear_cta=result.get('has_clear_cta', False),
-                    optimization_suggestions=result.get('optimization_suggestions', []),
-                    missing_elements=result.get('missing_elements', []),
-                    strengths=result.get('strengths', []),
-                    # YT Analytics data from BigQuery
-                    yt_total_views=yt_analytics_summary.get('total_views', 0),
-                    yt_total_impressions=yt_analytics_summary.get('total_impressions', 0),
-                    yt_overall_ctr=yt_analytics_summary.get('overall_ctr', 0.0),
-                    yt_by_traffic_source=yt_analytics_summary.get('by_traffic_source', []),
-                    main_keyword=yt_analytics_summary.get('main_keyword', ''),
-                    silo=yt_analytics_summary.get('silo', '')
-                )
+            else:
+                logger.warning(f"No description available for {video_id}, storing YT Analytics data only")
+                # Create minimal result with just YT Analytics data
+                result = {
+                    'cta_effectiveness_score': 0.0,
+                    'description_quality_score': 0.0,
+                    'seo_score': 0.0,
+                    'total_links': 0,
+                    'affiliate_links': 0,
+                    'link_positioning_score': 0.0,
+                    'has_clear_cta': False,
+                    'optimization_suggestions': ['No description available - run Transcribe & Analyze to fetch from YouTube'],
+                    'missing_elements': ['Video description not available'],
+                    'strengths': []
+                }
 
-                # Store to local database
-                self.bigquery.store_description_analysis(description_analysis)
-                logger.info(f"Description analysis completed and stored for {video_id}")
-                update_progress('description', 55, 'Description analysis complete')
+            # Convert to DescriptionAnalysis model with YT Analytics data
+            description_analysis = DescriptionAnalysis(
+                video_id=video_id,
+                analysis_timestamp=timestamp,
+                **_model_kwargs(result, _DESCRIPTION_FIELDS, _DESCRIPTION_DEFAULTS),
+                # YT Analytics data from BigQuery
+                yt_total_views=yt('total_views', 0),
+                yt_total_impressions=yt('total_impressions', 0),
+                yt_overall_ctr=yt('overall_ctr', 0.0),
+                yt_by_traffic_source=yt_by_traffic_source,
+                main_keyword=yt('main_keyword', ''),
+                silo=yt('silo', '')
+            )
 
-            except Exception as e:
-                logger.error(f"Error in description analysis: {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
+            # Queue for the video's (or batch's) multi-table write
+            write_buffer.add('description_analyses', [description_analysis])
+            logger.debug(f"Description analysis completed for {video_id}")
+            step_progress('description', 'Description analysis complete', completed=True)
+            return description_analysis
 
-            # Rate limiting
-            time.sleep(2)
+        except Exception as e:
+            logger.exception(f"Error in description analysis: {e}")
+            return None
 
-        # 3. Affiliate Product Recommendations
-        if 'affiliate' in analysis_types and (transcript or video.title or video.description):
-            update_progress('affiliate', 60, 'Generating affiliate recommendations...')
-            try:
-                # Fetch real performance data to inform AI recommendations
-                real_performance = self.bigquery.get_affiliate_performance(video_id)
-                if real_performance:
-                    logger.info(f"Found {len(real_performance)} real tracking IDs to inform recommendations")
+    def _run_combined_analysis(self, video_id: str, video, transcript: str,
+                               yt_analytics_summary: Optional[Dict]):
+        """
+        Score the script and the description with one Claude request.
 
-                logger.info(f"Running affiliate recommendations for {video_id}")
-                results = self.affiliate_recommender.recommend_products(
-                    transcript=transcript,
-                    title=video.title,
-                    description=video.description,
-                    top_n=5,
-                    affiliate_performance=real_performance
-                )
+        Args:
+            yt_analytics_summary: Prefetched YT Analytics summary, or None to
+                                  fetch it here
 
-                # Convert to AffiliateRecommendation models
-                for idx, rec in enumerate(results, 1):
-                    affiliate_recommendations.append(AffiliateRecommendation(
-                        video_id=video_id,
-                        recommendation_timestamp=timestamp,
-                        product_rank=idx,
-                        product_name=rec.get('product_name', ''),
-                        product_category=rec.get('product_category', ''),
-                        relevance_score=rec.get('relevance_score', 0.0),
-                        conversion_probability=rec.get('conversion_probability', 0.0),
-                        recommendation_reasoning=rec.get('recommendation_reasoning', ''),
-                        where_to_mention=rec.get('where_to_mention', ''),
-                        mentioned_in_video=rec.get('mentioned_in_video', False),
-                        amazon_asin=rec.get('amazon_asin'),
-                        price_range=rec.get('price_range')
-                    ))
-
-                # Store to BigQuery
-                if affiliate_recommendations:
-                    self.bigquery.store_affiliate_recommendations(affiliate_recommendations)
-                    logger.info(f"Affiliate recommendations completed and stored for {video_id}")
-
-                    # Compare AI recommendations to existing links in description
-                    if video.description:
-                        try:
-                            from app.services.affiliate_recommender import AffiliateRecommender
-                            comparison = self.affiliate_recommender.compare_recommendations_to_existing(
-                                results, video.description
-                            )
-                            logger.info(
-                                f"Affiliate comparison for {video_id}: "
-                                f"{comparison['already_implemented']} already in description, "
-                                f"{comparison['new_opportunities']} new opportunities"
-                            )
-                        except Exception as e:
-                            logger.warning(f"Affiliate comparison failed: {e}")
-
-                    update_progress('affiliate', 75, 'Affiliate recommendations complete')
+        Returns:
+            (script result, description AI scores, YT Analytics summary); the
+            results are None when the request failed, so the steps fall back
+            to their focused analyzers
+        """
+        result = None
+        try:
+            if yt_analytics_summary is None:
+                yt_analytics_summary = self._fetch_cached('yt_analytics', video_id, self.bigquery.get_yt_analytics_summary)
 
-            except Exception as e:
-                logger.error(f"Error in affiliate recommendations: {str(e)}")
+            logger.debug(f"Running combined script/description analysis for {video_id}")
+            result = self._run_analyzer(
+                'script_description', self.content_analyzer.analyze_script_and_description,
+                self.content_analyzer.model, lambda r: True,
+                transcript=transcript,
+                title=video.title,
+                description=video.description,
+                yt_analytics=yt_analytics_summary
+            )
+        except Exception as e:
+            logger.exception(f"Error in combined script/description analysis: {e}")
 
-            # Rate limiting
-            time.sleep(2)
+        if not result:
+            return None, None, yt_analytics_summary
+        return result['script'], result['description'], yt_analytics_summary
 
-        # 4. Conversion Analysis (AI-powered with Claude)
-        if 'conversion' in analysis_types:
-            update_progress('conversion', 80, 'Analyzing conversion metrics...')
-            try:
-                logger.info(f"Running AI-powered conversion analysis for {video_id}")
+    def _run_combined_conversion_analysis(self, video_id: str, video, transcript: str, revenue_metrics):
+        """
+        Run the script and conversion analyses with one Claude request.
+
+        Returns:
+            (script result, conversion result); both are None when the request
+            failed, so the steps fall back to their focused analyzers
+        """
+        result = None
+        try:
+            logger.debug(f"Running combined script/conversion analysis for {video_id}")
+            result = self._run_analyzer(
+                'script_conversion', self.content_analyzer.analyze_script_and_conversion,
+                self.content_analyzer.model,
+                lambda r: r['conversion'].get('performance_assessment') != 'unknown',
+                transcript=transcript,
+                title=video.title,
+                description=video.description or "",
+                revenue=revenue_metrics.revenue,
+                clicks=revenue_metrics.clicks,
+                sales=revenue_metrics.sales,
+                views=revenue_metrics.organic_views
+            )
+        except Exception as e:
+            logger.exception(f"Error in combined script/conversion analysis: {e}")
+
+        if not result:
+            return None, None
+        return result['script'], result['conversion']
+
+    def _run_affiliate_recommendations(self, video_id: str, video, transcript: Optional[str],
+                                       timestamp: datetime,
+                                       write_buffer: AnalysisWriteBuffer,
+                                       step_progress) -> List[AffiliateRecommendation]:
+        """Generate, store and compare affiliate product recommendations."""
+        step_progress('affiliate', 'Generating affiliate recommendations...')
+        affiliate_recommendations = []
+        try:
+            # Fetch real performance data to inform AI recommendations
+            real_performance = self.bigquery.get_affiliate_performance(video_id)
+            if real_performance:
+                logger.debug(f"Found {len(real_performance)} real tracking IDs to inform recommendations")
+
+            logger.debug(f"Running affiliate recommendations for {video_id}")
+            # The recommender takes a request slot per Claude call, not for
+            # cache hits (see request_gate)
+            results = self.affiliate_recommender.recommend_products(
+                transcript=transcript,
+                title=video.title,
+                description=video.description,
+                top_n=5,
+                affiliate_performance=real_performance,
+                use_cache=_read_result_cache.get()
+            )
+
+            # Convert to AffiliateRecommendation models
+            for idx, rec in enumerate(results, 1):
+                affiliate_recommendations.append(AffiliateRecommendation(
+                    video_id=video_id,
+                    recommendation_timestamp=timestamp,
+                    product_rank=idx,
+                    **_model_kwargs(rec, _RECOMMENDATION_FIELDS, _RECOMMENDATION_DEFAULTS)
+                ))
+
+            # Queue for the video's (or batch's) multi-table write
+            if affiliate_recommendations:
+                write_buffer.add('affiliate_recommendations', affiliate_recommendations)
+                logger.debug(f"Affiliate recommendations completed for {video_id}")
+
+                # Compare AI recommendations to existing links in description
+                if video.description:
+                    try:
+                        comparison = self.affiliate_recommender.compare_recommendations_to_existing(
+                            results, video.description
+                        )
+                        logger.debug(
+                            f"Affiliate comparison for {video_id}: {comparison['already_implemented']} "
+                            f"already in description, {comparison['new_opportunities']} new opportunities"
+                        )
+                    except Exception as e:
+                        logger.warning(f"Affiliate comparison failed: {e}")
+
+                step_progress('affiliate', 'Affiliate recommendations complete', completed=True)
 
-                if revenue_metrics and revenue_metrics.clicks > 0:
-                    # Use AI to analyze conversion drivers (works with or without transcript)
-                    ai_analysis = self.conversion_analyzer.analyze_conversion_drivers(
+        except Exception as e:
+            logger.exception(f"Error in affiliate recommendations: {e}")
+
+        return affiliate_recommendations
+
+    def _run_conversion_analysis(self, video_id: str, video, transcript: Optional[str],
+                                 revenue_metrics, timestamp: datetime,
+                                 script_scores: Optional[Future],
+                                 combined: Optional[Future],
+                                 write_buffer: AnalysisWriteBuffer,
+                                 step_progress) -> Optional[ConversionAnalysis]:
+        """
+        Run and store the conversion analysis.
+
+        Args:
+            script_scores: Future resolved with the script analysis whose
+                           scores inform the conversion prompt, or None if
+                           not requested
+            combined: Pending combined script + conversion request, or None
+                      to use the focused analyzer
+        """
+        # Wait for the script scores before taking a request slot
+        script_analysis = script_scores.result() if script_scores else None
+
+        step_progress('conversion', 'Analyzing conversion metrics...')
+        try:
+            logger.debug(f"Running AI-powered conversion analysis for {video_id}")
+
+            if revenue_metrics and revenue_metrics.clicks > 0:
+                # Use AI to analyze conversion drivers (works with or without transcript),
+                # unless the combined script + conversion request already did
+                ai_analysis = combined.result()[1] if combined else None
+                if ai_analysis is None:
+                    # The analyzer reports failures with an "unknown" assessment
+                    ai_analysis = self._run_analyzer(
+                        'conversion', self.conversion_analyzer.analyze_conversion_drivers,
+                        self.conversion_analyzer.model,
+                        lambda r: r.get('performance_assessment') != 'unknown',
                         transcript=transcript or "",
                         title=video.title,
                         description=video.description or "",
@@ -319,143 +1017,252 @@ class AnalysisService:
                         cta_score=script_analysis.call_to_action_score if script_analysis else None
                     )
 
-                    conversion_analysis = ConversionAnalysis(
-                        video_id=video_id,
-                        analysis_timestamp=timestamp,
-                        metrics_date=revenue_metrics.metrics_date,
-                        revenue=revenue_metrics.revenue,
-                        clicks=revenue_metrics.clicks,
-                        sales=revenue_metrics.sales,
-                        views=revenue_metrics.organic_views,
-                        conversion_rate=revenue_metrics.conversion_rate,
-                        revenue_per_click=revenue_metrics.revenue_per_click,
-                        revenue_per_1k_views=revenue_metrics.revenue_per_1k_views,
-                        conversion_drivers=ai_analysis.get('conversion_drivers', []),
-                        underperformance_reasons=ai_analysis.get('underperformance_reasons', []),
-                        recommendations=ai_analysis.get('recommendations', [])
-                    )
-                    logger.info(f"Conversion analysis complete: {len(ai_analysis.get('conversion_drivers', []))} drivers identified")
-                else:
-                    # Create basic conversion analysis when no revenue data
-                    from datetime import date
-                    if revenue_metrics:
-                        # Has revenue but no clicks
-                        conversion_analysis = ConversionAnalysis(
-                            video_id=video_id,
-                            analysis_timestamp=timestamp,
-                            metrics_date=revenue_metrics.metrics_date,
-                            revenue=revenue_metrics.revenue,
-                            clicks=revenue_metrics.clicks,
-                            sales=revenue_metrics.sales,
-                            views=revenue_metrics.organic_views,
-                            conversion_rate=revenue_metrics.conversion_rate,
-                            revenue_per_click=revenue_metrics.revenue_per_click,
-                            revenue_per_1k_views=revenue_metrics.revenue_per_1k_views,
-                            conversion_drivers=["No affiliate clicks yet - analysis requires click data"],
-                            underperformance_reasons=[],
-                            recommendations=["Ensure affiliate links are properly placed in description"]
-                        )
-                    else:
-                        # No revenue data at all
-                        conversion_analysis = ConversionAnalysis(
-                            video_id=video_id,
-                            analysis_timestamp=timestamp,
-                            metrics_date=date.today(),
-                            revenue=0.0,
-                            clicks=0,
-                            sales=0,
-                            views=0,
-                            conversion_rate=0.0,
-                            revenue_per_click=0.0,
-                            revenue_per_1k_views=0.0,
-                            conversion_drivers=["No revenue data available yet"],
-                            underperformance_reasons=["Video has not generated revenue data or data not synced to BigQuery"],
-                            recommendations=["Check back after video generates affiliate clicks/revenue"]
-                        )
-
-                # Store to local database
-                self.bigquery.store_conversion_analysis(conversion_analysis)
-                logger.info(f"Conversion analysis completed and stored for {video_id}")
-                update_progress('conversion', 95, 'Conversion analysis complete')
+                conversion_analysis = ConversionAnalysis(
+                    video_id=video_id,
+                    analysis_timestamp=timestamp,
+                    **_revenue_kwargs(revenue_metrics),
+                    **_model_kwargs(ai_analysis, _CONVERSION_FIELDS, {})
+                )
+                logger.debug(f"Conversion analysis complete: "
+                             f"{len(conversion_analysis.conversion_drivers)} drivers identified")
+            elif revenue_metrics:
+                # Has revenue but no clicks
+                conversion_analysis = ConversionAnalysis(
+                    video_id=video_id,
+                    analysis_timestamp=timestamp,
+                    **_revenue_kwargs(revenue_metrics),
+                    conversion_drivers=["No affiliate clicks yet - analysis requires click data"],
+                    underperformance_reasons=[],
+                    recommendations=["Ensure affiliate links are properly placed in description"]
+                )
+            else:
+                # No revenue data at all
+                conversion_analysis = ConversionAnalysis(
+                    video_id=video_id,
+                    analysis_timestamp=timestamp,
+                    metrics_date=date.today(),
+                    revenue=0.0,
+                    clicks=0,
+                    sales=0,
+                    views=0,
+                    conversion_rate=0.0,
+                    revenue_per_click=0.0,
+                    revenue_per_1k_views=0.0,
+                    conversion_drivers=["No revenue data available yet"],
+                    underperformance_reasons=["Video has not generated revenue data or data not synced to BigQuery"],
+                    recommendations=["Check back after video generates affiliate clicks/revenue"]
+                )
 
-            except Exception as e:
-                logger.error(f"Error in conversion analysis: {str(e)}")
+            # Queue for the video's (or batch's) multi-table write
+            write_buffer.add('conversion_analyses', [conversion_analysis])
+            logger.debug(f"Conversion analysis completed for {video_id}")
+            step_progress('conversion', 'Conversion analysis complete', completed=True)
+            return conversion_analysis
 
-        # 5. Script Score (Gates + Quality + Context Multiplier)
-        script_score = None
-        if 'script_score' in analysis_types and transcript:
-            update_progress('script_score', 85, 'Running script scoring (gates + quality)...')
-            try:
-                logger.info(f"Running script scoring for {video_id}")
+        except Exception as e:
+            logger.exception(f"Error in conversion analysis: {e}")
+            return None
 
-                # Get duration from local transcript if available
-                duration = 0
-                if local_transcript:
-                    duration = local_transcript.get('duration_seconds', 0) or 0
+    def _run_script_scoring(self, video_id: str, video, transcript: str,
+                            local_transcript: Optional[dict], step_progress):
+        """Run and store the script score (gates + quality + context multiplier)."""
+        step_progress('script_score', 'Running script scoring (gates + quality)...')
+        try:
+            logger.debug(f"Running script scoring for {video_id}")
 
-                script_score = self.script_scoring_service.score_video(
-                    video_id=video_id,
-                    transcript=transcript,
-                    title=video.title,
-                    description=video.description or "",
-                    duration_seconds=duration,
-                    progress_callback=lambda msg: update_progress('script_score', 90, msg)
-                )
+            # Get duration from local transcript if available
+            duration = 0
+            if local_transcript:
+                duration = local_transcript.get('duration_seconds', 0) or 0
 
-                # Store to local database
-                if self.bigquery.local_db:
-                    self.bigquery.local_db.store_script_score(script_score)
-                    logger.info(f"Script score stored for {video_id}: "
-                               f"quality={script_score.quality_score_total}, "
-                               f"gates={'PASS' if script_score.all_gates_passed else 'FAIL'}")
+            # Each of the scorer's Claude calls takes its own slot (see request_gate)
+            script_score = self.script_scoring_service.score_video(
+                video_id=video_id,
+                transcript=transcript,
+                title=video.title,
+                description=video.description or "",
+                duration_seconds=duration,
+                progress_callback=lambda msg: step_progress('script_score', msg)
+            )
 
-                update_progress('script_score', 95, 'Script scoring complete')
+            # Store to local database
+            if self.bigquery.local_db:
+                self.bigquery.local_db.store_script_score(script_score)
+                logger.debug(f"Script score stored for {video_id}: "
+                             f"quality={script_score.quality_score_total}, "
+                             f"gates={'PASS' if script_score.all_gates_passed else 'FAIL'}")
 
-            except Exception as e:
-                logger.error(f"Error in script scoring: {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
+            step_progress('script_score', 'Script scoring complete', completed=True)
+            return script_score
 
-        update_progress('saving', 98, 'Finalizing results...')
-        # Return combined results
-        return AnalysisResults(
-            video=video,
-            revenue_metrics=revenue_metrics,
-            script_analysis=script_analysis,
-            affiliate_recommendations=affiliate_recommendations,
-            description_analysis=description_analysis,
-            conversion_analysis=conversion_analysis,
-            script_score=script_score
-        )
+        except Exception as e:
+            logger.exception(f"Error in script scoring: {e}")
+            return None
 
 
     def batch_analyze(
         self,
         video_ids: List[str],
         analysis_types: List[str],
-        rate_limit_seconds: int = 2
+        max_workers: int = 4,
+        progress_callback: callable = None
     ) -> List[AnalysisResults]:
         """
-        Run analysis on multiple videos.
+        Run analysis on multiple videos concurrently.
+
+        Claude request concurrency is still capped by the service-wide request
+        slots, so max_workers only bounds how many videos are in progress.
 
         Args:
             video_ids: List of YouTube video IDs
             analysis_types: List of analysis types to run
-            rate_limit_seconds: Seconds to wait between analyses
+            max_workers: Max videos analyzed at once
+            progress_callback: Optional callback(completed, total, video_id)
+                               called as each video finishes
+
+        Results are stored with one bulk write per flush of a shared
+        AnalysisWriteBuffer rather than one write per result.
 
         Returns:
-            List of AnalysisResults
+            List of AnalysisResults for the videos that succeeded, in input order
         """
-        results = []
+        return self._in_input_order(
+            video_ids, self.batch_analyze_iter(video_ids, analysis_types, max_workers, progress_callback)
+        )
 
-        for video_id in video_ids:
-            try:
-                result = self.analyze_video(video_id, analysis_types)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to analyze video {video_id}: {str(e)}")
+    def batch_analyze_iter(
+        self,
+        video_ids: List[str],
+        analysis_types: List[str],
+        max_workers: int = 4,
+        progress_callback: callable = None
+    ) -> Iterator[AnalysisResults]:
+        """
+        Like batch_analyze(), but yield each video's results as it finishes.
+
+        Callers that only need to consume each result (or count them) can
+        drop it before the next one arrives, so a large batch doesn't hold
+        every video's results in memory at once. Closing the iterator early
+        cancels the videos that haven't started.
+
+        Args:
+            video_ids: List of YouTube video IDs
+            analysis_types: List of analysis types to run
+            max_workers: Max videos analyzed at once
+            progress_callback: Optional callback(completed, total, video_id)
+                               called as each video finishes
+
+        Yields:
+            AnalysisResults for the videos that succeeded, in completion order
+        """
+        if not video_ids:
+            return
+
+        video_ids = list(dict.fromkeys(video_ids))
+        # Resolved once and shared by every video's analyze_video call
+        analysis_types = frozenset(analysis_types)
+        prefetched = self._prefetch_video_data(video_ids, analysis_types)
+        yield from self._analyze_prefetched(video_ids, analysis_types, prefetched, max_workers, progress_callback)
+
+    @staticmethod
+    def _in_input_order(video_ids: List[str], results: Iterable[AnalysisResults]) -> List[AnalysisResults]:
+        """Collect batch results into a list ordered like video_ids."""
+        by_id = {result.video.video_id: result for result in results}
+        return [by_id[video_id] for video_id in dict.fromkeys(video_ids) if video_id in by_id]
+
+    def _analyze_prefetched(self, video_ids: List[str], analysis_types: frozenset,
+                            prefetched: Dict[str, PrefetchedVideoData], max_workers: int,
+                            progress_callback) -> Iterator[AnalysisResults]:
+        """
+        Analyze deduplicated videos concurrently with one shared write buffer
+        (see batch_analyze_iter), yielding results in completion order.
+        """
+        write_buffer = AnalysisWriteBuffer(self.bigquery)
+
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(video_ids)),
+                                  thread_name_prefix='batch-analyze')
+        try:
+            futures = {
+                pool.submit(contextvars.copy_context().run,
+                            self.analyze_video, video_id, analysis_types,
+                            None, prefetched.get(video_id), write_buffer): video_id
+                for video_id in video_ids
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                # Drop our reference so the result is freed once the caller is done with it
+                video_id = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to analyze video {video_id}: {e}")
+                    result = None
+
+                if progress_callback:
+                    try:
+                        progress_callback(completed, len(video_ids), video_id)
+                    except Exception as e:
+                        logger.warning(f"Progress callback error: {e}")
+
+                if result is not None:
+                    yield result
+        finally:
+            # Skip videos that haven't started if the caller stopped early,
+            # then persist whatever finished
+            pool.shutdown(cancel_futures=True)
+            write_buffer.flush()
+            if write_buffer.failed:
+                unsaved = ', '.join(f'{kind}/{video_id}' for kind, video_id in write_buffer.failed)
+                logger.error(f"Batch analysis results not stored for {len(write_buffer.failed)} rows: {unsaved}")
+
+    @staticmethod
+    def _local_description(video, local_transcript: Optional[Dict]) -> Optional[str]:
+        """Description from the local transcript, when the video has none of its own."""
+        if local_transcript and (not video.description or not video.description.strip()):
+            return local_transcript.get('description')
+        return None
+
+    def _prefetch_video_data(self, video_ids: List[str],
+                             analysis_types: frozenset) -> Dict[str, PrefetchedVideoData]:
+        """
+        Fetch the BigQuery inputs for a batch with one query per table.
+
+        Args:
+            video_ids: YouTube video IDs in the batch
+            analysis_types: Analysis types being run (YT Analytics is only
+                            fetched for description analysis)
+
+        Returns:
+            Dict mapping video_id -> PrefetchedVideoData, or an empty dict if
+            any bulk query failed (videos then fetch their own data)
+        """
+        if len(video_ids) < 2:
+            return {}
+
+        unique_ids = list(dict.fromkeys(video_ids))
+        try:
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix='batch-prefetch') as pool:
+                videos_future = pool.submit(self.bigquery.get_videos_by_ids, unique_ids)
+                transcripts_future = pool.submit(self.bigquery.get_transcripts_bulk, unique_ids)
+                revenue_future = pool.submit(self.bigquery.get_revenue_metrics_bulk, unique_ids)
+                yt_future = (pool.submit(self.bigquery.get_yt_analytics_summary_bulk, unique_ids)
+                             if 'description' in analysis_types else None)
 
-            # Rate limiting between videos
-            time.sleep(rate_limit_seconds)
+                videos = videos_future.result()
+                transcripts = transcripts_future.result()
+                revenue = revenue_future.result()
+                yt_analytics = yt_future.result() if yt_future else {}
+        except Exception as e:
+            logger.error(f"Batch prefetch failed, fetching per video: {e}")
+            return {}
 
-        return results
+        logger.info(f"Prefetched BigQuery data for {len(videos)}/{len(unique_ids)} videos")
+        return {
+            video_id: PrefetchedVideoData(
+                video=videos.get(video_id),
+                transcript=transcripts.get(video_id),
+                revenue_metrics=revenue.get(video_id),
+                yt_analytics=yt_analytics.get(video_id)
+            )
+            for video_id in unique_ids
+        }
@@ -1,10 +1,15 @@
 """Analytics service for tracking user activity."""
+import atexit
 import logging
 import os
 import json
+import queue
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -12,7 +17,72 @@ from googleapiclient.errors import HttpError
 logger = logging.getLogger(__name__)
 
 # Philippine timezone
-PH_TZ = pytz.timezone('Asia/Manila')
+PH_TZ = ZoneInfo('Asia/Manila')
+# Slices of datetime.isoformat(sep=' ', timespec='seconds') for the
+# 'Date' (YYYY-MM-DD) and 'Time (PH)' (HH:MM:SS) columns
+_DATE_SLICE = slice(0, 10)
+_TIME_SLICE = slice(11, 19)
+
+# Background writer settings
+QUEUE_MAX_SIZE = 10000
+FLUSH_BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 2.0
+# Max seconds to wait for queued rows to be written on shutdown
+CLOSE_TIMEOUT_SECONDS = 10.0
+
+# A verified header row is remembered on disk so worker restarts skip the check
+HEADER_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'analytics')
+HEADER_CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# Queued by close() to stop the background writer
+_STOP = object()
+
+SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+
+# Details reported for a videos list view, in order. has_analysis is
+# reported whenever it is set; the others only when non-empty.
+_FILTER_KEYS = ('channel', 'video_id', 'has_analysis', 'page')
+# Transcription options reported when enabled, in order
+_TRANSCRIPTION_OPTIONS = ('transcript', 'emotions', 'frames', 'insights')
+
+
+def _format_filters(filters: dict) -> Optional[str]:
+    """Format videos list filters as 'key=value, ...', or None if none are set."""
+    parts = []
+    for key in _FILTER_KEYS:
+        value = filters.get(key)
+        if value or (value is not None and key == 'has_analysis'):
+            parts.append(f"{key}={value}")
+    return ', '.join(parts) or None
+
+
+@lru_cache(maxsize=4)
+def _load_credentials(credentials_json: Optional[str], credentials_path: Optional[str]):
+    """
+    Load service account credentials, once per process for each source.
+
+    App reloads and extra app instances (e.g. the Celery worker's) reuse the
+    parsed credentials, and their cached access token, instead of parsing
+    the key again.
+
+    Args:
+        credentials_json: Contents of GOOGLE_CREDENTIALS_JSON, preferred when set
+        credentials_path: Path to a service account JSON file
+
+    Returns:
+        Credentials, or None if neither source is available
+    """
+    if credentials_json:
+        logger.info("Loading credentials from GOOGLE_CREDENTIALS_JSON")
+        return service_account.Credentials.from_service_account_info(
+            json.loads(credentials_json), scopes=SHEETS_SCOPES
+        )
+    if credentials_path and os.path.exists(credentials_path):
+        logger.info(f"Loading credentials from file: {credentials_path}")
+        return service_account.Credentials.from_service_account_file(
+            credentials_path, scopes=SHEETS_SCOPES
+        )
+    return None
 
 
 class AnalyticsService:
@@ -32,47 +102,75 @@ class AnalyticsService:
         )
         self.sheet_name = 'logs'
         self.service = None
+        self._queue = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+        self._writer = None
 
         try:
             # Try to load credentials from environment variable first (for cloud deployment)
-            credentials_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
-
-            if credentials_json:
-                logger.info("Loading credentials from GOOGLE_CREDENTIALS_JSON")
-                credentials_info = json.loads(credentials_json)
-                credentials = service_account.Credentials.from_service_account_info(
-                    credentials_info,
-                    scopes=[
-                        "https://www.googleapis.com/auth/spreadsheets"
-                    ],
-                )
-            elif credentials_path and os.path.exists(credentials_path):
-                logger.info(f"Loading credentials from file: {credentials_path}")
-                credentials = service_account.Credentials.from_service_account_file(
-                    credentials_path,
-                    scopes=[
-                        "https://www.googleapis.com/auth/spreadsheets"
-                    ],
-                )
-            else:
+            credentials = _load_credentials(os.getenv('GOOGLE_CREDENTIALS_JSON'), credentials_path)
+            if credentials is None:
                 logger.warning("No credentials available for analytics service")
                 return
 
-            self.service = build('sheets', 'v4', credentials=credentials)
-            logger.info(f"Analytics service initialized")
-
-            # Ensure header row exists
-            self._ensure_header()
+            # Use the discovery document bundled with the client library rather
+            # than fetching (and trying to file-cache) it on every start. The
+            # client's single httplib2 connection is kept alive between the
+            # writer thread's batched appends.
+            self.service = build('sheets', 'v4', credentials=credentials,
+                                 cache_discovery=False, static_discovery=True)
+            logger.info("Analytics service initialized")
+
+            # The header check and row appends run on a background thread so
+            # neither app startup nor request handlers wait on the Sheets API
+            self._writer = threading.Thread(
+                target=self._drain_queue, name='analytics-writer', daemon=True
+            )
+            self._writer.start()
+            # Write out rows still queued when the process exits
+            atexit.register(self.close)
 
         except Exception as e:
-            logger.error(f"Failed to initialize analytics service: {str(e)}")
+            logger.error(f"Failed to initialize analytics service: {e}")
             self.service = None
 
+    @property
+    def _header_sentinel(self) -> str:
+        """Path of the file recording that this sheet's header was verified."""
+        return os.path.join(HEADER_CACHE_DIR, f'header_ok_{self.spreadsheet_id}')
+
+    def _header_cached(self) -> bool:
+        """Whether the header was verified within HEADER_CACHE_MAX_AGE_SECONDS."""
+        try:
+            age = time.time() - os.path.getmtime(self._header_sentinel)
+        except OSError:
+            return False
+        return age < HEADER_CACHE_MAX_AGE_SECONDS
+
+    def _cache_header(self):
+        """Record a verified header row (best effort)."""
+        try:
+            os.makedirs(HEADER_CACHE_DIR, exist_ok=True)
+            with open(self._header_sentinel, 'w'):
+                pass
+        except OSError as e:
+            logger.debug(f"Could not cache header check: {e}")
+
+    def _forget_header(self):
+        """Drop the cached header check so the next start verifies it again."""
+        try:
+            os.remove(self._header_sentinel)
+        except OSError:
+            pass
+
     def _ensure_header(self):
         """Ensure the header row exists in the sheet."""
         if not self.service:
             return
 
+        if self._header_cached():
+            logger.debug("Header row verified recently, skipping check")
+            return
+
         try:
             # Check if header exists
             result = self.service.spreadsheets().values().get(
@@ -94,18 +192,27 @@ class AnalyticsService:
                 ).execute()
                 logger.info("Created header row")
 
+            self._cache_header()
+
         except HttpError as e:
             if e.resp.status == 404:
                 logger.warning(f"Sheet '{self.sheet_name}' not found. Please create it manually.")
             else:
-                logger.error(f"Error checking header: {str(e)}")
+                logger.error(f"Error checking header: {e}")
         except Exception as e:
-            logger.error(f"Error ensuring header: {str(e)}")
+            logger.error(f"Error ensuring header: {e}")
+
+    def _recording(self) -> bool:
+        """Whether log_action() does anything with a row (writes it, or debug-logs it when disabled)."""
+        return self.service is not None or logger.isEnabledFor(logging.DEBUG)
 
     def log_action(self, email: str, action: str, details: str = None):
         """
         Log a user action.
 
+        The row is queued and written to the sheet by the background writer,
+        so this returns immediately.
+
         Args:
             email: User's email address
             action: Action performed (e.g., "Login", "View Video", "Run Analysis")
@@ -115,32 +222,79 @@ class AnalyticsService:
             logger.debug(f"Analytics disabled. Would log: {email} - {action}")
             return
 
+        # Current time in Philippine timezone, formatted once and split
+        now = datetime.now(PH_TZ).isoformat(sep=' ', timespec='seconds')
+
+        # Prepare row data
+        row = [now[_DATE_SLICE], now[_TIME_SLICE], email or 'Unknown', action, details or '']
+
         try:
-            # Get current time in Philippine timezone
-            now = datetime.now(PH_TZ)
-            date_str = now.strftime('%Y-%m-%d')
-            time_str = now.strftime('%H:%M:%S')
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning(f"Analytics queue full, dropping action: {email} - {action}")
+
+    def close(self):
+        """Stop the background writer after it has written the queued rows."""
+        if not self._writer or not self._writer.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=CLOSE_TIMEOUT_SECONDS)
+        except queue.Full:
+            logger.warning("Analytics queue full at shutdown, some actions may not be logged")
+            return
+        self._writer.join(timeout=CLOSE_TIMEOUT_SECONDS)
 
-            # Prepare row data
-            row = [date_str, time_str, email or 'Unknown', action, details or '']
+    def _drain_queue(self):
+        """Background loop: append queued rows in batches until close() is called."""
+        # Ensure header row exists (rows queued meanwhile wait for it)
+        self._ensure_header()
 
-            # Append to sheet
+        while True:
+            row = self._queue.get()
+            if row is _STOP:
+                return
+            rows = [row]
+            stopping = False
+            # Collect whatever else arrives within the flush window
+            deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+            try:
+                while len(rows) < FLUSH_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    row = self._queue.get(timeout=remaining)
+                    if row is _STOP:
+                        stopping = True
+                        break
+                    rows.append(row)
+            except queue.Empty:
+                pass
+            self._append_rows(rows)
+            if stopping:
+                return
+
+    def _append_rows(self, rows: list):
+        """Append a batch of rows to the sheet in a single API call."""
+        try:
             self.service.spreadsheets().values().append(
                 spreadsheetId=self.spreadsheet_id,
                 range=f'{self.sheet_name}!A:E',
                 valueInputOption='RAW',
                 insertDataOption='INSERT_ROWS',
                 body={
-                    'values': [row]
+                    'values': rows
                 }
             ).execute()
 
-            logger.debug(f"Logged action: {email} - {action}")
+            logger.debug(f"Logged {len(rows)} actions")
 
         except HttpError as e:
-            logger.error(f"Failed to log action: {str(e)}")
+            logger.error(f"Failed to log actions: {e}")
+            # The sheet or range may be gone; re-check the header on next start
+            if e.resp.status in (400, 404):
+                self._forget_header()
         except Exception as e:
-            logger.error(f"Error logging action: {str(e)}")
+            logger.error(f"Error logging actions: {e}")
 
     # Convenience methods for common actions
     def log_login(self, email: str):
@@ -157,19 +311,9 @@ class AnalyticsService:
 
     def log_view_videos_list(self, email: str, filters: dict = None):
         """Log videos list view."""
-        details = None
-        if filters:
-            filter_parts = []
-            if filters.get('channel'):
-                filter_parts.append(f"channel={filters['channel']}")
-            if filters.get('video_id'):
-                filter_parts.append(f"video_id={filters['video_id']}")
-            if filters.get('has_analysis') is not None:
-                filter_parts.append(f"has_analysis={filters['has_analysis']}")
-            if filters.get('page'):
-                filter_parts.append(f"page={filters['page']}")
-            if filter_parts:
-                details = ', '.join(filter_parts)
+        if not self._recording():
+            return
+        details = _format_filters(filters) if filters else None
         self.log_action(email, 'View Videos List', details)
 
     def log_view_video_detail(self, email: str, video_id: str, video_title: str = None):
@@ -188,19 +332,13 @@ class AnalyticsService:
 
     def log_start_transcription(self, email: str, video_id: str, options: dict = None):
         """Log transcription start."""
+        if not self._recording():
+            return
         details = f"video_id={video_id}"
         if options:
-            opts = []
-            if options.get('transcript'):
-                opts.append('transcript')
-            if options.get('emotions'):
-                opts.append('emotions')
-            if options.get('frames'):
-                opts.append('frames')
-            if options.get('insights'):
-                opts.append('insights')
+            opts = ','.join(name for name in _TRANSCRIPTION_OPTIONS if options.get(name))
             if opts:
-                details += f", options={','.join(opts)}"
+                details += f", options={opts}"
         self.log_action(email, 'Start Transcription', details)
 
     def log_view_analysis_page(self, email: str):
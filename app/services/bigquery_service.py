@@ -128,38 +128,34 @@ class BigQueryService:
             query += " AND Video_published_date <= @end_date"
             params.append(bigquery.ScalarQueryParameter("end_date", "DATE", end_date))
 
-        # If filtering by analysis status, fetch more videos to account for filtering
-        # This ensures we get enough results after filtering
-        fetch_limit = limit * 3 if has_analysis is not None else limit
+        if has_analysis is not None:
+            # Analysis results live in the local database, so filter on the
+            # analyzed IDs in the query and let LIMIT/OFFSET page over matches
+            analyzed_ids = self.local_db.list_analyzed_video_ids() if self.local_db else []
+            if has_analysis:
+                query += " AND v.video_id IN UNNEST(@analyzed_ids)"
+            else:
+                query += " AND v.video_id NOT IN UNNEST(@analyzed_ids)"
+            params.append(bigquery.ArrayQueryParameter("analyzed_ids", "STRING", analyzed_ids))
 
         query += " ORDER BY has_transcript DESC, v.Video_published_date DESC LIMIT @limit OFFSET @offset"
-        params.append(bigquery.ScalarQueryParameter("limit", "INT64", fetch_limit))
+        params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
         params.append(bigquery.ScalarQueryParameter("offset", "INT64", offset))
 
         job_config = bigquery.QueryJobConfig(query_parameters=params)
         query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
+        rows = list(query_job.result())
+
+        # Look up analysis status in the local database with one query for the page
+        analyzed = self.local_db.get_script_analysis_summary([row.video_id for row in rows]) if self.local_db else {}
 
         videos = []
-        for row in results:
+        for row in rows:
             # Construct YouTube URL if not present in database
             video_url = row.video_url if row.video_url else f"https://www.youtube.com/watch?v={row.video_id}"
 
-            # Check if video has analysis in local database
-            video_has_analysis = False
-            latest_analysis_date = None
-            if self.local_db:
-                script_analysis = self.local_db.get_script_analysis(row.video_id)
-                if script_analysis:
-                    video_has_analysis = True
-                    latest_analysis_date = script_analysis.analysis_timestamp
-
-            # Apply has_analysis filter if specified
-            if has_analysis is not None:
-                if has_analysis and not video_has_analysis:
-                    continue  # Skip videos without analysis when filtering for analyzed only
-                if not has_analysis and video_has_analysis:
-                    continue  # Skip analyzed videos when filtering for not analyzed
+            latest_analysis_date = analyzed.get(row.video_id)
+            video_has_analysis = latest_analysis_date is not None
 
             videos.append(Video(
                 video_id=row.video_id,
@@ -172,7 +168,7 @@ class BigQueryService:
                 latest_analysis_date=latest_analysis_date
             ))
 
-        logger.info(f"Fetched {len(videos)} videos from BigQuery (filtered to {len(videos)} after analysis status check)")
+        logger.info(f"Fetched {len(videos)} videos from BigQuery")
         return videos
 
     def get_video_by_id(self, video_id: str) -> Optional[Video]:
@@ -206,28 +202,81 @@ class BigQueryService:
         results = query_job.result()
 
         for row in results:
-            # Construct YouTube URL if not present in database
-            video_url = row.video_url if row.video_url else f"https://www.youtube.com/watch?v={row.video_id}"
-
             # Get description - try main table first, fallback to SERP table
             description = row.description
             if not description or (isinstance(description, str) and not description.strip()):
                 description = self._get_description_from_serp(video_id)
 
-            return Video(
-                video_id=row.video_id,
-                channel_code=row.channel_code,
-                title=row.title,
-                published_date=row.published_date,
-                video_url=video_url,
-                description=description,
-                has_analysis=False,
-                latest_analysis_date=None
-            )
+            return self._row_to_video(row, description)
 
         logger.warning(f"Video not found: {video_id}")
         return None
 
+    def get_videos_by_ids(self, video_ids: List[str]) -> Dict[str, Video]:
+        """
+        Fetch several videos by ID in one query (bulk get_video_by_id).
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dict mapping video_id -> Video for the videos found
+        """
+        if not video_ids:
+            return {}
+
+        query = """
+        SELECT
+            video_id,
+            Channel_Code as channel_code,
+            Video_Title as title,
+            Video_published_date as published_date,
+            Video_URL as video_url,
+            Video_description as description
+        FROM `company-wide-370010.1_Youtube_Metrics_Dump.YT_Video_Registration_V2`
+        WHERE video_id IN UNNEST(@video_ids)
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("video_ids", "STRING", video_ids)
+            ]
+        )
+        rows = {}
+        for row in self.client.query(query, job_config=job_config).result():
+            rows.setdefault(row.video_id, row)
+
+        # Fill missing descriptions from the SERP table in one query
+        missing = {
+            vid for vid, row in rows.items()
+            if not row.description or (isinstance(row.description, str) and not row.description.strip())
+        }
+        serp_descriptions = self._get_descriptions_from_serp(list(missing)) if missing else {}
+
+        videos = {
+            vid: self._row_to_video(row, serp_descriptions.get(vid) if vid in missing else row.description)
+            for vid, row in rows.items()
+        }
+        logger.info(f"Fetched {len(videos)}/{len(video_ids)} videos by ID")
+        return videos
+
+    @staticmethod
+    def _row_to_video(row, description: Optional[str]) -> Video:
+        """Build a Video from a YT_Video_Registration_V2 row."""
+        # Construct YouTube URL if not present in database
+        video_url = row.video_url if row.video_url else f"https://www.youtube.com/watch?v={row.video_id}"
+
+        return Video(
+            video_id=row.video_id,
+            channel_code=row.channel_code,
+            title=row.title,
+            published_date=row.published_date,
+            video_url=video_url,
+            description=description,
+            has_analysis=False,
+            latest_analysis_date=None
+        )
+
     def _get_description_from_serp(self, video_id: str) -> Optional[str]:
         """
         Fetch video description from SERP table as fallback.
@@ -271,6 +320,40 @@ class BigQueryService:
             logger.warning(f"Error fetching description from SERP table: {str(e)}")
             return None
 
+    def _get_descriptions_from_serp(self, video_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch the latest SERP description for several videos in one query.
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dict mapping video_id -> description for the videos found
+        """
+        try:
+            query = """
+            SELECT video_id, Description
+            FROM `company-wide-370010.1_YT_Serp_result.ALL_Time YT Serp`
+            WHERE video_id IN UNNEST(@video_ids)
+              AND Description IS NOT NULL
+              AND TRIM(Description) != ''
+              AND published_date IS NOT NULL
+              AND Scrape_date IS NOT NULL
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY video_id ORDER BY Scrape_date DESC) = 1
+            """
+
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ArrayQueryParameter("video_ids", "STRING", video_ids)
+                ]
+            )
+            results = self.client.query(query, job_config=job_config).result()
+            return {row.video_id: row.Description for row in results if row.Description}
+
+        except Exception as e:
+            logger.warning(f"Error fetching descriptions from SERP table: {str(e)}")
+            return {}
+
     def get_transcript(self, video_id: str) -> Optional[str]:
         """
         Fetch video transcript from BigQuery.
@@ -302,6 +385,34 @@ class BigQueryService:
         logger.warning(f"Transcript not found for video: {video_id}")
         return None
 
+    def get_transcripts_bulk(self, video_ids: List[str]) -> Dict[str, str]:
+        """
+        Fetch transcripts for several videos in one query (bulk get_transcript).
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Dict mapping video_id -> transcript for the videos found
+        """
+        if not video_ids:
+            return {}
+
+        query = """
+        SELECT video_id, ANY_VALUE(transcript) as transcript
+        FROM `company-wide-370010.1_misc.YT_Transcript`
+        WHERE video_id IN UNNEST(@video_ids)
+        GROUP BY video_id
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("video_ids", "STRING", video_ids)
+            ]
+        )
+        results = self.client.query(query, job_config=job_config).result()
+        return {row.video_id: row.transcript for row in results}
+
     def get_yt_analytics_by_source(self, video_id: str, days: int = 90) -> List[Dict]:
         """
         Fetch YouTube Analytics data by traffic source for the last N days.
@@ -426,46 +537,8 @@ class BigQueryService:
             query_job = self.client.query(query, job_config=job_config)
             results = query_job.result()
 
-            by_source = []
-            video_info = {}
-            total_views = 0
-            total_impressions = 0
-
-            for row in results:
-                by_source.append({
-                    'traffic_source': row.Traffic_source,
-                    'views': int(row.total_views) if row.total_views else 0,
-                    'impressions': int(row.total_impressions) if row.total_impressions else 0,
-                    'avg_ctr': float(row.avg_ctr) if row.avg_ctr else 0.0,
-                    'avg_view_percentage': float(row.avg_view_pct) if row.avg_view_pct else 0.0,
-                    'data_points': int(row.data_points) if row.data_points else 0
-                })
-                total_views += int(row.total_views) if row.total_views else 0
-                total_impressions += int(row.total_impressions) if row.total_impressions else 0
-
-                # Get video info from first row
-                if not video_info:
-                    video_info = {
-                        'video_title': row.video_title,
-                        'main_keyword': row.main_keyword,
-                        'silo': row.silo,
-                        'channel': row.channel
-                    }
-
-            # Calculate overall CTR
-            overall_ctr = (total_views / total_impressions * 100) if total_impressions > 0 else 0.0
-
-            summary = {
-                'video_id': video_id,
-                'days_analyzed': days,
-                'total_views': total_views,
-                'total_impressions': total_impressions,
-                'overall_ctr': round(overall_ctr, 2),
-                'by_traffic_source': by_source,
-                **video_info
-            }
-
-            logger.info(f"Generated YT Analytics summary for video: {video_id} ({len(by_source)} traffic sources)")
+            summary = self._summarize_yt_analytics(video_id, days, results)
+            logger.info(f"Generated YT Analytics summary for video: {video_id} ({len(summary['by_traffic_source'])} traffic sources)")
             return summary
 
         except Exception as e:
@@ -480,6 +553,123 @@ class BigQueryService:
                 'error': str(e)
             }
 
+    def get_yt_analytics_summary_bulk(self, video_ids: List[str], days: int = 90) -> Dict[str, Dict]:
+        """
+        Get YT Analytics summaries for several videos in one query
+        (bulk get_yt_analytics_summary).
+
+        Args:
+            video_ids: YouTube video IDs
+            days: Number of days to look back (default 90)
+
+        Returns:
+            Dict mapping every requested video_id -> summary dictionary
+        """
+        if not video_ids:
+            return {}
+
+        query = """
+        WITH source_metrics AS (
+            SELECT
+                yt.Video_ID as video_id,
+                yt.Traffic_source,
+                SUM(yt.views) as total_views,
+                SUM(yt.impression) as total_impressions,
+                AVG(yt.impression_CTR) as avg_ctr,
+                AVG(yt.average_view_percentage) as avg_view_pct,
+                COUNT(*) as data_points
+            FROM `company-wide-370010.Digibot.Digibot_YT_analytics` yt
+            WHERE yt.Video_ID IN UNNEST(@video_ids)
+              AND yt.Date >= DATE_SUB(CURRENT_DATE(), INTERVAL @days DAY)
+            GROUP BY yt.Video_ID, yt.Traffic_source
+        ),
+        video_info AS (
+            SELECT
+                gi.video_id,
+                gi.video_title,
+                gi.main_keyword,
+                gi.silo,
+                gi.presenter as channel
+            FROM `company-wide-370010.Digibot.Digibot_General_info` gi
+            WHERE gi.video_id IN UNNEST(@video_ids)
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY gi.video_id) = 1
+        )
+        SELECT
+            sm.video_id,
+            sm.Traffic_source,
+            sm.total_views,
+            sm.total_impressions,
+            ROUND(sm.avg_ctr, 2) as avg_ctr,
+            ROUND(sm.avg_view_pct, 2) as avg_view_pct,
+            sm.data_points,
+            vi.video_title,
+            vi.main_keyword,
+            vi.silo,
+            vi.channel
+        FROM source_metrics sm
+        JOIN video_info vi ON sm.video_id = vi.video_id
+        ORDER BY sm.video_id, sm.total_views DESC
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("video_ids", "STRING", video_ids),
+                bigquery.ScalarQueryParameter("days", "INT64", days)
+            ]
+        )
+        rows_by_video = {video_id: [] for video_id in video_ids}
+        for row in self.client.query(query, job_config=job_config).result():
+            rows_by_video[row.video_id].append(row)
+
+        return {
+            video_id: self._summarize_yt_analytics(video_id, days, rows)
+            for video_id, rows in rows_by_video.items()
+        }
+
+    @staticmethod
+    def _summarize_yt_analytics(video_id: str, days: int, rows) -> Dict:
+        """Build a YT Analytics summary from per-traffic-source rows (highest views first)."""
+        by_source = []
+        video_info = {}
+        total_views = 0
+        total_impressions = 0
+
+        for row in rows:
+            views = int(row.total_views) if row.total_views else 0
+            impressions = int(row.total_impressions) if row.total_impressions else 0
+            by_source.append({
+                'traffic_source': row.Traffic_source,
+                'views': views,
+                'impressions': impressions,
+                'avg_ctr': float(row.avg_ctr) if row.avg_ctr else 0.0,
+                'avg_view_percentage': float(row.avg_view_pct) if row.avg_view_pct else 0.0,
+                'data_points': int(row.data_points) if row.data_points else 0
+            })
+            total_views += views
+            total_impressions += impressions
+
+            # Get video info from first row
+            if not video_info:
+                video_info = {
+                    'video_title': row.video_title,
+                    'main_keyword': row.main_keyword,
+                    'silo': row.silo,
+                    'channel': row.channel
+                }
+
+        # Calculate overall CTR
+        overall_ctr = (total_views / total_impressions * 100) if total_impressions > 0 else 0.0
+
+        return {
+            'video_id': video_id,
+            'days_analyzed': days,
+            'total_views': total_views,
+            'total_impressions': total_impressions,
+            'overall_ctr': round(overall_ctr, 2),
+            'by_traffic_source': by_source,
+            **video_info
+        }
+
     def get_revenue_metrics(self, video_id: str) -> Optional[RevenueMetrics]:
         """
         Fetch aggregated revenue metrics for a video across all months.
@@ -554,35 +744,115 @@ class BigQueryService:
         results = query_job.result()
 
         for row in results:
-            revenue = float(row.total_revenue) if row.total_revenue else 0.0
-            clicks = int(row.total_clicks) if row.total_clicks else 0
-            sales = int(row.total_sales) if row.total_sales else 0
-            views = int(row.total_views) if row.total_views else 0
+            return self._row_to_revenue_metrics(row)
 
-            # Use BigQuery calculated metrics (more accurate)
-            conversion_rate = float(row.conversion_rate) if row.conversion_rate else 0.0
-            revenue_per_click = float(row.revenue_per_click) if row.revenue_per_click else 0.0
-            revenue_per_1k_views = (revenue / views * 1000) if views > 0 else 0.0
+        logger.warning(f"Revenue metrics not found for video: {video_id}")
+        return None
 
-            # Get CTR from YT Analytics (already in percentage format)
-            impression_ctr = float(row.avg_impression_ctr) if row.avg_impression_ctr else 0.0
+    def get_revenue_metrics_bulk(self, video_ids: List[str]) -> Dict[str, RevenueMetrics]:
+        """
+        Fetch revenue metrics for several videos in one query (bulk get_revenue_metrics).
 
-            return RevenueMetrics(
-                video_id=row.video_id,
-                channel=row.channel or "Unknown",
-                metrics_date=row.latest_month,
-                revenue=revenue,
-                clicks=clicks,
-                sales=sales,
-                organic_views=views,
-                conversion_rate=conversion_rate,
-                revenue_per_click=revenue_per_click,
-                revenue_per_1k_views=revenue_per_1k_views,
-                impression_ctr=impression_ctr
-            )
+        Args:
+            video_ids: YouTube video IDs
 
-        logger.warning(f"Revenue metrics not found for video: {video_id}")
-        return None
+        Returns:
+            Dict mapping video_id -> RevenueMetrics for the videos found
+        """
+        if not video_ids:
+            return {}
+
+        query = """
+        WITH monthly_metrics AS (
+            SELECT
+                m.video_id,
+                g.presenter as channel,
+                g.video_title,
+                g.main_keyword,
+                m.metrics_month_year,
+                m.revenue,
+                m.clicks,
+                m.sales,
+                m.organic_views
+            FROM `company-wide-370010.Digibot.Metrics_by_Month` m
+            LEFT JOIN `company-wide-370010.Digibot.Digibot_General_info` g
+              ON m.video_id = g.video_id
+            WHERE m.video_id IN UNNEST(@video_ids)
+        ),
+        yt_analytics AS (
+            SELECT
+                y.Video_ID,
+                AVG(y.impression_CTR) as avg_impression_ctr
+            FROM `company-wide-370010.Digibot.Digibot_YT_analytics` y
+            WHERE y.Video_ID IN UNNEST(@video_ids)
+            GROUP BY y.Video_ID
+        ),
+        totals AS (
+            SELECT
+                mm.video_id,
+                MAX(mm.channel) as channel,
+                MAX(mm.metrics_month_year) as latest_month,
+                SUM(mm.revenue) as total_revenue,
+                SUM(mm.clicks) as total_clicks,
+                SUM(mm.sales) as total_sales,
+                SUM(mm.organic_views) as total_views,
+                SAFE_DIVIDE(SUM(mm.sales), SUM(mm.organic_views)) * 100 as conversion_rate,
+                SAFE_DIVIDE(SUM(mm.revenue), SUM(mm.clicks)) as revenue_per_click
+            FROM monthly_metrics mm
+            GROUP BY mm.video_id
+        )
+        SELECT
+            t.video_id,
+            t.channel,
+            t.latest_month,
+            t.total_revenue,
+            t.total_clicks,
+            t.total_sales,
+            t.total_views,
+            ROUND(t.conversion_rate, 3) as conversion_rate,
+            ROUND(t.revenue_per_click, 2) as revenue_per_click,
+            ROUND(y.avg_impression_ctr, 2) as avg_impression_ctr
+        FROM totals t
+        LEFT JOIN yt_analytics y ON t.video_id = y.Video_ID
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("video_ids", "STRING", video_ids)
+            ]
+        )
+        results = self.client.query(query, job_config=job_config).result()
+        return {row.video_id: self._row_to_revenue_metrics(row) for row in results}
+
+    @staticmethod
+    def _row_to_revenue_metrics(row) -> RevenueMetrics:
+        """Build RevenueMetrics from a revenue totals row."""
+        revenue = float(row.total_revenue) if row.total_revenue else 0.0
+        clicks = int(row.total_clicks) if row.total_clicks else 0
+        sales = int(row.total_sales) if row.total_sales else 0
+        views = int(row.total_views) if row.total_views else 0
+
+        # Use BigQuery calculated metrics (more accurate)
+        conversion_rate = float(row.conversion_rate) if row.conversion_rate else 0.0
+        revenue_per_click = float(row.revenue_per_click) if row.revenue_per_click else 0.0
+        revenue_per_1k_views = (revenue / views * 1000) if views > 0 else 0.0
+
+        # Get CTR from YT Analytics (already in percentage format)
+        impression_ctr = float(row.avg_impression_ctr) if row.avg_impression_ctr else 0.0
+
+        return RevenueMetrics(
+            video_id=row.video_id,
+            channel=row.channel or "Unknown",
+            metrics_date=row.latest_month,
+            revenue=revenue,
+            clicks=clicks,
+            sales=sales,
+            organic_views=views,
+            conversion_rate=conversion_rate,
+            revenue_per_click=revenue_per_click,
+            revenue_per_1k_views=revenue_per_1k_views,
+            impression_ctr=impression_ctr
+        )
 
     def get_affiliate_performance(self, video_id: str) -> list:
         """
@@ -714,6 +984,30 @@ class BigQueryService:
             logger.warning("No local database configured, cannot store conversion analysis")
             return False
 
+    def store_analysis_batch(
+        self,
+        script_analyses: List[ScriptAnalysis] = (),
+        description_analyses: List[DescriptionAnalysis] = (),
+        conversion_analyses: List[ConversionAnalysis] = (),
+        affiliate_recommendations: List[AffiliateRecommendation] = ()
+    ) -> bool:
+        """
+        Store many analysis results to local database in one transaction (not BigQuery).
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.local_db:
+            return self.local_db.store_analysis_batch(
+                script_analyses=script_analyses,
+                description_analyses=description_analyses,
+                conversion_analyses=conversion_analyses,
+                affiliate_recommendations=affiliate_recommendations
+            )
+        else:
+            logger.warning("No local database configured, cannot store analysis batch")
+            return False
+
     # ============================================================================
     # READ OPERATIONS - Analysis Results
     # ============================================================================
@@ -1254,50 +1548,45 @@ class BigQueryService:
             logger.error(f"Error getting affiliates: {str(e)}")
             return []
 
-    def get_all_silos(self) -> List[str]:
-        """Get all distinct silo values from BigQuery."""
-        try:
-            query = """
-            SELECT DISTINCT silo
-            FROM `company-wide-370010.Digibot.Digibot_General_info`
-            WHERE silo IS NOT NULL AND TRIM(silo) != ''
-            ORDER BY silo
-            """
-            query_job = self.client.query(query)
-            results = query_job.result()
-            silos = [row.silo for row in results]
-            logger.info(f"Fetched {len(silos)} distinct silos from BigQuery")
-            return silos
-
-        except Exception as e:
-            logger.error(f"Error getting silos: {str(e)}")
-            return []
-
-    def get_all_channels(self) -> List[str]:
+    def get_dropdown_values(self) -> Dict[str, List[str]]:
         """
-        Get all distinct channel codes from BigQuery.
+        Get distinct channel codes and silos for filter dropdowns in one query.
 
         Returns:
-            List of channel codes sorted alphabetically
+            Dict with 'channels' and 'silos' lists, each sorted alphabetically
         """
         try:
             query = """
-            SELECT DISTINCT Channel_Code
+            SELECT 'channel' AS kind, Channel_Code AS value
             FROM `company-wide-370010.1_Youtube_Metrics_Dump.YT_Video_Registration_V2`
             WHERE Channel_Code IS NOT NULL
-            ORDER BY Channel_Code
+            GROUP BY Channel_Code
+            UNION ALL
+            SELECT 'silo' AS kind, silo AS value
+            FROM `company-wide-370010.Digibot.Digibot_General_info`
+            WHERE silo IS NOT NULL AND TRIM(silo) != ''
+            GROUP BY silo
             """
 
             query_job = self.client.query(query)
             results = query_job.result()
 
-            channels = [row.Channel_Code for row in results]
-            logger.info(f"Fetched {len(channels)} distinct channels from BigQuery")
-            return channels
+            channels = []
+            silos = []
+            for row in results:
+                if row.kind == 'channel':
+                    channels.append(row.value)
+                else:
+                    silos.append(row.value)
+
+            channels.sort()
+            silos.sort()
+            logger.info(f"Fetched {len(channels)} channels and {len(silos)} silos from BigQuery")
+            return {'channels': channels, 'silos': silos}
 
         except Exception as e:
-            logger.error(f"Error getting channels: {str(e)}")
-            return []
+            logger.error(f"Error getting dropdown values: {str(e)}")
+            return {'channels': [], 'silos': []}
 
     # ========== Script Scoring Helpers ==========
 
@@ -1433,7 +1722,7 @@ class BigQueryService:
             logger.error(f"Error getting sibling videos: {str(e)}")
             return []
 
-    def get_video_metadata_batch(self, video_ids: List[str]) -> Dict[str, Dict]:
+    def get_video_metadata_batch(self, video_ids: List[str], raise_errors: bool = False) -> Dict[str, Dict]:
         """Get video metadata + 90d avg revenue + keyword-group max revenue for multiple videos.
 
         Used by Library View and Optimization Opportunity formula.
@@ -1442,6 +1731,7 @@ class BigQueryService:
 
         Args:
             video_ids: List of video IDs to fetch metadata for
+            raise_errors: Re-raise query errors instead of returning an empty dict
 
         Returns:
             Dict mapping video_id -> {title, channel, main_keyword, silo,
@@ -1528,4 +1818,6 @@ class BigQueryService:
 
         except Exception as e:
             logger.error(f"Error getting video metadata batch: {str(e)}")
+            if raise_errors:
+                raise
             return {}
@@ -8,8 +8,41 @@ import json
 from typing import Dict, Optional
 import logging
 
+from app.services.conversion_analyzer import (
+    FOCUS_AREAS as CONVERSION_FOCUS_AREAS,
+    RESPONSE_FORMAT as CONVERSION_RESPONSE_FORMAT,
+    performance_metrics_context,
+)
+from app.services.description_analyzer import AI_RESPONSE_FORMAT as DESCRIPTION_AI_RESPONSE_FORMAT, yt_analytics_context
+
 logger = logging.getLogger(__name__)
 
+# Appended to the script prompt for analyze_script_and_description()
+_COMBINED_DESCRIPTION_SECTION = """
+
+**ALSO** analyze the DESCRIPTION above for effectiveness.
+{yt_context}
+Description analysis format:
+
+{description_format}
+
+Return ONLY a JSON object of the form {{"script": <script analysis>, "description": <description analysis>}}, no other text or markdown formatting.
+"""
+
+# Appended to the script prompt for analyze_script_and_conversion()
+_COMBINED_CONVERSION_SECTION = """
+
+**ALSO** analyze this video's conversion performance and identify what drives (or hinders) affiliate sales, taking your script and CTA scores into account.
+
+{metrics}
+Conversion analysis format:
+
+{conversion_format}
+
+{focus_areas}
+Return ONLY a JSON object of the form {{"script": <script analysis>, "conversion": <conversion analysis>}}, no other text or markdown formatting.
+"""
+
 
 class ContentAnalyzer:
     """
@@ -25,15 +58,17 @@ class ContentAnalyzer:
     - Key strengths and improvement areas
     """
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514",
+                 client: Optional[Anthropic] = None):
         """
         Initialize content analyzer.
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use (default: Sonnet 4 for speed/cost)
+            client: Shared Anthropic client to reuse instead of creating one
         """
-        self.client = Anthropic(api_key=api_key)
+        self.client = client or Anthropic(api_key=api_key)
         self.model = model
         logger.info(f"Content analyzer initialized with model: {model}")
 
@@ -54,43 +89,206 @@ class ContentAnalyzer:
         Returns:
             Dictionary with analysis scores and insights
         """
-        prompt = self._build_script_analysis_prompt(transcript, title, description)
-
         try:
             logger.info("Analyzing script quality...")
             message = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.3,  # Lower temperature for more consistent scoring
-                messages=[{"role": "user", "content": prompt}]
+                **self.script_quality_request(transcript, title, description)
             )
+            return self.parse_script_quality(message.content[0].text)
 
-            # Parse JSON response
-            response_text = message.content[0].text
+        except Exception as e:
+            logger.error(f"Error analyzing script: {e}")
+            return None
 
-            # Strip markdown code blocks if present
-            response_text = response_text.strip()
-            if response_text.startswith('```'):
-                # Remove opening ```json or ```
-                response_text = response_text.split('\n', 1)[1] if '\n' in response_text else response_text[3:]
-                # Remove closing ```
-                if response_text.endswith('```'):
-                    response_text = response_text.rsplit('```', 1)[0]
-                response_text = response_text.strip()
+    def script_quality_request(self, transcript: str, title: str, description: str) -> Dict:
+        """Messages API parameters for analyze_script_quality()."""
+        return {
+            'model': self.model,
+            'max_tokens': 2000,
+            'temperature': 0.3,  # Lower temperature for more consistent scoring
+            'messages': [{"role": "user", "content": self._build_script_analysis_prompt(transcript, title, description)}]
+        }
+
+    def parse_script_quality(self, response_text: str) -> Optional[Dict]:
+        """
+        Parse a script analysis response.
 
+        Returns:
+            Dictionary with analysis scores and insights, or None if invalid
+        """
+        response_text = self._strip_code_fence(response_text)
+        try:
             analysis = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse Claude response as JSON: {e}")
+            logger.error(f"Response text: {response_text}")
+            return None
+
+        logger.info(f"Script analysis complete. Quality score: {analysis.get('script_quality_score', 'N/A')}")
+        return analysis
+
+    def analyze_script_and_description(
+        self,
+        transcript: str,
+        title: str,
+        description: str,
+        yt_analytics: Dict = None
+    ) -> Optional[Dict]:
+        """
+        Script quality analysis and AI description scores in one request.
 
-            logger.info(f"Script analysis complete. Quality score: {analysis.get('script_quality_score', 'N/A')}")
-            return analysis
+        Used when both analyses are requested for a video: the title,
+        description and transcript are sent once and the call counts once
+        against the rate limit.
+
+        Args:
+            transcript: Full video transcript
+            title: Video title
+            description: Video description
+            yt_analytics: YT Analytics data from BigQuery (optional)
+
+        Returns:
+            {'script': <analyze_script_quality() result>,
+             'description': <DescriptionAnalyzer AI scores>}, or None if error
+        """
+        try:
+            logger.info("Analyzing script quality and description...")
+            message = self.client.messages.create(
+                **self.script_and_description_request(transcript, title, description, yt_analytics)
+            )
+            return self.parse_script_and_description(message.content[0].text)
 
+        except Exception as e:
+            logger.error(f"Error in combined script/description analysis: {e}")
+            return None
+
+    def script_and_description_request(self, transcript: str, title: str, description: str,
+                                       yt_analytics: Dict = None) -> Dict:
+        """Messages API parameters for analyze_script_and_description()."""
+        prompt = self._build_script_analysis_prompt(transcript, title, description).rstrip()
+        prompt += _COMBINED_DESCRIPTION_SECTION.format(
+            yt_context=yt_analytics_context(yt_analytics),
+            description_format=DESCRIPTION_AI_RESPONSE_FORMAT
+        )
+        return {
+            'model': self.model,
+            'max_tokens': 2800,
+            'temperature': 0.3,
+            'messages': [{"role": "user", "content": prompt}]
+        }
+
+    def parse_script_and_description(self, response_text: str) -> Optional[Dict]:
+        """
+        Parse a combined script + description response.
+
+        Returns:
+            {'script': ..., 'description': ...}, or None if invalid
+        """
+        response_text = self._strip_code_fence(response_text)
+        try:
+            analysis = json.loads(response_text)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse Claude response as JSON: {e}")
             logger.error(f"Response text: {response_text}")
             return None
+
+        if not isinstance(analysis.get('script'), dict) or not isinstance(analysis.get('description'), dict):
+            logger.error("Combined analysis response is missing the script or description scores")
+            return None
+        return analysis
+
+    def analyze_script_and_conversion(
+        self,
+        transcript: str,
+        title: str,
+        description: str,
+        revenue: float,
+        clicks: int,
+        sales: int,
+        views: int
+    ) -> Optional[Dict]:
+        """
+        Script quality analysis and conversion analysis in one request.
+
+        Used when both analyses are requested for a video with affiliate
+        clicks: the transcript is sent once and the conversion analysis no
+        longer waits for the script scores from a separate request.
+
+        Args:
+            transcript: Full video transcript
+            title: Video title
+            description: Video description
+            revenue: Total revenue
+            clicks: Total affiliate clicks
+            sales: Total sales
+            views: Total views
+
+        Returns:
+            {'script': <analyze_script_quality() result>,
+             'conversion': <ConversionAnalyzer.analyze_conversion_drivers() result>},
+            or None if error
+        """
+        try:
+            logger.info("Analyzing script quality and conversion...")
+            message = self.client.messages.create(
+                **self.script_and_conversion_request(transcript, title, description,
+                                                     revenue, clicks, sales, views)
+            )
+            return self.parse_script_and_conversion(message.content[0].text)
+
         except Exception as e:
-            logger.error(f"Error analyzing script: {e}")
+            logger.error(f"Error in combined script/conversion analysis: {e}")
+            return None
+
+    def script_and_conversion_request(self, transcript: str, title: str, description: str,
+                                      revenue: float, clicks: int, sales: int, views: int) -> Dict:
+        """Messages API parameters for analyze_script_and_conversion()."""
+        prompt = self._build_script_analysis_prompt(transcript, title, description).rstrip()
+        prompt += _COMBINED_CONVERSION_SECTION.format(
+            metrics=performance_metrics_context(revenue, clicks, sales, views),
+            conversion_format=CONVERSION_RESPONSE_FORMAT,
+            focus_areas=CONVERSION_FOCUS_AREAS
+        )
+        return {
+            'model': self.model,
+            'max_tokens': 3500,
+            'temperature': 0.3,
+            'messages': [{"role": "user", "content": prompt}]
+        }
+
+    def parse_script_and_conversion(self, response_text: str) -> Optional[Dict]:
+        """
+        Parse a combined script + conversion response.
+
+        Returns:
+            {'script': ..., 'conversion': ...}, or None if invalid
+        """
+        response_text = self._strip_code_fence(response_text)
+        try:
+            analysis = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse Claude response as JSON: {e}")
+            logger.error(f"Response text: {response_text}")
             return None
 
+        if not isinstance(analysis.get('script'), dict) or not isinstance(analysis.get('conversion'), dict):
+            logger.error("Combined analysis response is missing the script or conversion analysis")
+            return None
+        return analysis
+
+    @staticmethod
+    def _strip_code_fence(response_text: str) -> str:
+        """Strip a markdown code block wrapped around a JSON response."""
+        response_text = response_text.strip()
+        if response_text.startswith('```'):
+            # Remove opening ```json or ```
+            response_text = response_text.split('\n', 1)[1] if '\n' in response_text else response_text[3:]
+            # Remove closing ```
+            if response_text.endswith('```'):
+                response_text = response_text.rsplit('```', 1)[0]
+            response_text = response_text.strip()
+        return response_text
+
     def _build_script_analysis_prompt(self, transcript: str, title: str, description: str) -> str:
         """Build prompt for script analysis."""
         # Truncate transcript if too long (to stay within token limits)
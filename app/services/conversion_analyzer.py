@@ -7,13 +7,55 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# JSON format and guidance for conversion analysis (shared with
+# ContentAnalyzer.analyze_script_and_conversion())
+RESPONSE_FORMAT = """{
+    "conversion_drivers": [
+        "<3-5 specific elements that drive conversions>"
+    ],
+    "underperformance_reasons": [
+        "<3-5 reasons why conversion might be low, if applicable>"
+    ],
+    "recommendations": [
+        "<3-5 actionable recommendations to improve conversion>"
+    ],
+    "performance_assessment": "<overall assessment: excellent/good/average/poor>",
+    "key_insight": "<one sentence key insight about this video's conversion performance>"
+}"""
+
+FOCUS_AREAS = """Focus on:
+1. How the script builds trust and urgency
+2. Quality and placement of CTAs
+3. Product-market fit and relevance
+4. Viewer intent alignment
+5. Comparison to typical benchmarks (good conversion: >10%, excellent: >20%)
+"""
+
+
+def performance_metrics_context(revenue: float, clicks: int, sales: int, views: int) -> str:
+    """Format a video's affiliate performance metrics for a conversion prompt."""
+    conversion_rate = (sales / clicks * 100) if clicks > 0 else 0.0
+    revenue_per_click = (revenue / clicks) if clicks > 0 else 0.0
+    click_through_rate = (clicks / views * 100) if views > 0 else 0.0
+
+    return f"""Performance Metrics:
+- Total Revenue: ${revenue:,.2f}
+- Total Clicks: {clicks:,}
+- Total Sales: {sales}
+- Total Views: {views:,}
+- Conversion Rate: {conversion_rate:.2f}% (sales/clicks)
+- Revenue per Click: ${revenue_per_click:.2f}
+- Click-Through Rate: {click_through_rate:.2f}% (clicks/views)
+"""
+
 
 class ConversionAnalyzer:
     """Analyze conversion performance using Claude AI."""
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
-        """Initialize conversion analyzer with Claude API."""
-        self.client = Anthropic(api_key=api_key)
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514",
+                 client: Optional[Anthropic] = None):
+        """Initialize conversion analyzer with Claude API (or a shared client)."""
+        self.client = client or Anthropic(api_key=api_key)
         self.model = model
         logger.info(f"ConversionAnalyzer initialized with model: {model}")
 
@@ -47,11 +89,6 @@ class ConversionAnalyzer:
             Dictionary with conversion analysis
         """
         try:
-            # Calculate metrics
-            conversion_rate = (sales / clicks * 100) if clicks > 0 else 0.0
-            revenue_per_click = (revenue / clicks) if clicks > 0 else 0.0
-            click_through_rate = (clicks / views * 100) if views > 0 else 0.0
-
             # Build context for Claude
             desc_text = (description[:300] + '...') if description else 'No description available'
             transcript_text = (transcript[:2000] + '...') if transcript else 'No transcript available'
@@ -61,15 +98,7 @@ Video Title: {title or 'Unknown'}
 Description: {desc_text}
 Transcript: {transcript_text}
 
-Performance Metrics:
-- Total Revenue: ${revenue:,.2f}
-- Total Clicks: {clicks:,}
-- Total Sales: {sales}
-- Total Views: {views:,}
-- Conversion Rate: {conversion_rate:.2f}% (sales/clicks)
-- Revenue per Click: ${revenue_per_click:.2f}
-- Click-Through Rate: {click_through_rate:.2f}% (clicks/views)
-"""
+{performance_metrics_context(revenue, clicks, sales, views)}"""
 
             if script_quality_score:
                 context += f"- Script Quality Score: {script_quality_score}/10\n"
@@ -81,27 +110,9 @@ Performance Metrics:
 {context}
 
 Provide analysis in JSON format:
-{{
-    "conversion_drivers": [
-        "<3-5 specific elements that drive conversions>"
-    ],
-    "underperformance_reasons": [
-        "<3-5 reasons why conversion might be low, if applicable>"
-    ],
-    "recommendations": [
-        "<3-5 actionable recommendations to improve conversion>"
-    ],
-    "performance_assessment": "<overall assessment: excellent/good/average/poor>",
-    "key_insight": "<one sentence key insight about this video's conversion performance>"
-}}
+{RESPONSE_FORMAT}
 
-Focus on:
-1. How the script builds trust and urgency
-2. Quality and placement of CTAs
-3. Product-market fit and relevance
-4. Viewer intent alignment
-5. Comparison to typical benchmarks (good conversion: >10%, excellent: >20%)
-"""
+{FOCUS_AREAS}"""
 
             # Call Claude API
             response = self.client.messages.create(
@@ -144,9 +155,7 @@ Focus on:
                 "key_insight": "Response parsing error - the AI response was not valid JSON"
             }
         except Exception as e:
-            logger.error(f"Error in conversion analysis: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error in conversion analysis: {str(e)}")
             return {
                 "conversion_drivers": [f"Analysis error: {str(e)[:100]}"],
                 "underperformance_reasons": [],
@@ -11,6 +11,65 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Expected JSON and scoring criteria for the AI description scores (shared
+# with ContentAnalyzer's combined script + description request)
+AI_RESPONSE_FORMAT = """{
+  "cta_effectiveness_score": <float 1-10>,
+  "description_quality_score": <float 1-10>,
+  "seo_score": <float 1-10>,
+  "optimization_suggestions": [<array of 3-5 specific suggestions>],
+  "missing_elements": [<array of missing important elements>],
+  "strengths": [<array of what's done well>]
+}
+
+**Scoring criteria:**
+
+**cta_effectiveness_score** (1-10):
+- Are CTAs clear and compelling?
+- Are they action-oriented?
+- Are they placed strategically?
+- Consider the traffic source CTR data if available
+
+**description_quality_score** (1-10):
+- Is it informative and engaging?
+- Does it provide value beyond the video?
+- Is it well-structured?
+- Consider average view percentage if available
+
+**seo_score** (1-10):
+- Keywords present (especially the main keyword)?
+- Good for search discovery?
+- Proper formatting?
+- Consider if the main keyword appears in the description"""
+
+
+def yt_analytics_context(yt_analytics: Optional[Dict]) -> str:
+    """
+    Format YT Analytics data as a prompt section.
+
+    Args:
+        yt_analytics: YT Analytics summary from BigQuery (optional)
+
+    Returns:
+        Prompt section, or an empty string when there is no view data
+    """
+    if not yt_analytics or yt_analytics.get('total_views', 0) <= 0:
+        return ""
+
+    yt_context = f"""
+**YOUTUBE ANALYTICS (Last 90 days):**
+- Total Views: {yt_analytics.get('total_views', 0):,}
+- Total Impressions: {yt_analytics.get('total_impressions', 0):,}
+- Overall CTR: {yt_analytics.get('overall_ctr', 0):.2f}%
+- Main Keyword: {yt_analytics.get('main_keyword', 'N/A')}
+- Silo/Category: {yt_analytics.get('silo', 'N/A')}
+
+**Traffic Sources Performance:**
+"""
+    for source in yt_analytics.get('by_traffic_source', [])[:5]:
+        yt_context += f"- {source['traffic_source']}: {source['views']:,} views, {source['avg_ctr']:.2f}% CTR, {source['avg_view_percentage']:.1f}% avg watch\n"
+    return yt_context
+
 
 class DescriptionAnalyzer:
     """
@@ -25,25 +84,28 @@ class DescriptionAnalyzer:
     - Optimization opportunities
     """
 
-    def __init__(self, anthropic_api_key: Optional[str] = None, model: str = "claude-sonnet-4-20250514"):
+    def __init__(self, anthropic_api_key: Optional[str] = None, model: str = "claude-sonnet-4-20250514",
+                 client: Optional[Anthropic] = None):
         """
         Initialize description analyzer.
 
         Args:
             anthropic_api_key: Optional Anthropic API key for AI analysis
             model: Claude model to use for AI analysis
+            client: Shared Anthropic client to reuse instead of creating one
         """
         self.anthropic_api_key = anthropic_api_key
         self.model = model
 
         if anthropic_api_key:
-            self.client = Anthropic(api_key=anthropic_api_key)
+            self.client = client or Anthropic(api_key=anthropic_api_key)
             logger.info("Description analyzer initialized with AI capabilities")
         else:
             self.client = None
             logger.info("Description analyzer initialized (basic analysis only)")
 
-    def analyze(self, description: str, title: str = "", yt_analytics: Dict = None) -> Dict:
+    def analyze(self, description: str, title: str = "", yt_analytics: Dict = None,
+                ai_analysis: Optional[Dict] = None) -> Dict:
         """
         Comprehensive description analysis.
 
@@ -51,6 +113,9 @@ class DescriptionAnalyzer:
             description: Video description text
             title: Video title (optional, for context)
             yt_analytics: YT Analytics data from BigQuery (optional)
+            ai_analysis: AI scores already produced elsewhere (e.g. by a
+                         combined script + description request); skips the
+                         Claude call
 
         Returns:
             Dictionary with analysis results
@@ -107,10 +172,10 @@ class DescriptionAnalyzer:
         }
 
         # AI-powered analysis (if API key provided)
-        if self.client:
+        if ai_analysis is None and self.client:
             ai_analysis = self._ai_analyze_description(description, title, yt_analytics)
-            if ai_analysis:
-                result.update(ai_analysis)
+        if ai_analysis:
+            result.update(ai_analysis)
 
         logger.info(f"Description analysis complete: {result['total_links']} links, "
                    f"{result['word_count']} words")
@@ -284,21 +349,19 @@ class DescriptionAnalyzer:
         if not self.client:
             return None
 
-        # Build YT Analytics context if available
-        yt_context = ""
-        if yt_analytics and yt_analytics.get('total_views', 0) > 0:
-            yt_context = f"""
-**YOUTUBE ANALYTICS (Last 90 days):**
-- Total Views: {yt_analytics.get('total_views', 0):,}
-- Total Impressions: {yt_analytics.get('total_impressions', 0):,}
-- Overall CTR: {yt_analytics.get('overall_ctr', 0):.2f}%
-- Main Keyword: {yt_analytics.get('main_keyword', 'N/A')}
-- Silo/Category: {yt_analytics.get('silo', 'N/A')}
+        try:
+            message = self.client.messages.create(
+                **self.ai_description_request(description, title, yt_analytics)
+            )
+            return self.parse_ai_description(message.content[0].text)
 
-**Traffic Sources Performance:**
-"""
-            for source in yt_analytics.get('by_traffic_source', [])[:5]:
-                yt_context += f"- {source['traffic_source']}: {source['views']:,} views, {source['avg_ctr']:.2f}% CTR, {source['avg_view_percentage']:.1f}% avg watch\n"
+        except Exception as e:
+            logger.error(f"Error in AI description analysis: {e}")
+            return None
+
+    def ai_description_request(self, description: str, title: str, yt_analytics: Dict = None) -> Dict:
+        """Messages API parameters for the AI description analysis."""
+        yt_context = yt_analytics_context(yt_analytics)
 
         prompt = f"""
 Analyze this YouTube video description for effectiveness (Tech/Software niche):
@@ -310,65 +373,39 @@ Analyze this YouTube video description for effectiveness (Tech/Software niche):
 {yt_context}
 Provide analysis in JSON format:
 
-{{
-  "cta_effectiveness_score": <float 1-10>,
-  "description_quality_score": <float 1-10>,
-  "seo_score": <float 1-10>,
-  "optimization_suggestions": [<array of 3-5 specific suggestions>],
-  "missing_elements": [<array of missing important elements>],
-  "strengths": [<array of what's done well>]
-}}
-
-**Scoring criteria:**
-
-**cta_effectiveness_score** (1-10):
-- Are CTAs clear and compelling?
-- Are they action-oriented?
-- Are they placed strategically?
-- Consider the traffic source CTR data if available
-
-**description_quality_score** (1-10):
-- Is it informative and engaging?
-- Does it provide value beyond the video?
-- Is it well-structured?
-- Consider average view percentage if available
-
-**seo_score** (1-10):
-- Keywords present (especially the main keyword)?
-- Good for search discovery?
-- Proper formatting?
-- Consider if the main keyword appears in the description
+{AI_RESPONSE_FORMAT}
 
 Return ONLY valid JSON, no other text.
 """
+        return {
+            'model': self.model,
+            'max_tokens': 800,
+            'temperature': 0.3,
+            'messages': [{"role": "user", "content": prompt}]
+        }
 
-        try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=800,
-                temperature=0.3,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = message.content[0].text
+    @staticmethod
+    def parse_ai_description(response_text: str) -> Optional[Dict]:
+        """
+        Parse an AI description analysis response.
 
-            # Strip markdown code blocks if present
+        Returns:
+            AI analysis results, or None if invalid
+        """
+        # Strip markdown code blocks if present
+        response_text = response_text.strip()
+        if response_text.startswith('```'):
+            response_text = response_text.split('\n', 1)[1] if '\n' in response_text else response_text[3:]
+            if response_text.endswith('```'):
+                response_text = response_text.rsplit('```', 1)[0]
             response_text = response_text.strip()
-            if response_text.startswith('```'):
-                response_text = response_text.split('\n', 1)[1] if '\n' in response_text else response_text[3:]
-                if response_text.endswith('```'):
-                    response_text = response_text.rsplit('```', 1)[0]
-                response_text = response_text.strip()
 
+        try:
             return json.loads(response_text)
-
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse AI description analysis JSON: {e}")
             logger.error(f"Response text: {response_text}")
             return None
-        except Exception as e:
-            logger.error(f"Error in AI description analysis: {e}")
-            return None
 
     def _is_affiliate_link(self, url: str) -> bool:
         """Check if URL is likely an affiliate link."""
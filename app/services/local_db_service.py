@@ -1,7 +1,7 @@
 """Local database service for storing AI analysis results using SQLite or PostgreSQL."""
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 import json
 import os
 
@@ -407,76 +407,83 @@ class LocalDBService:
         finally:
             conn.close()
 
+    def _script_analysis_query(self) -> str:
+        """Upsert statement for one script_analysis row."""
+        p = self._get_placeholder()
+
+        # For PostgreSQL, use ON CONFLICT; for SQLite, use OR REPLACE
+        if self.use_postgres:
+            return f"""
+            INSERT INTO script_analysis (
+                video_id, channel_code, analysis_timestamp,
+                script_quality_score, hook_effectiveness_score, call_to_action_score,
+                persuasion_effectiveness_score, user_intent_match_score,
+                persuasion_techniques, key_strengths, improvement_areas,
+                target_audience, content_value_score, identified_intent,
+                has_clear_intro, has_clear_cta, problem_solution_structure,
+                readability_score
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+            ON CONFLICT (video_id, analysis_timestamp) DO UPDATE SET
+                channel_code = EXCLUDED.channel_code,
+                script_quality_score = EXCLUDED.script_quality_score,
+                hook_effectiveness_score = EXCLUDED.hook_effectiveness_score,
+                call_to_action_score = EXCLUDED.call_to_action_score,
+                persuasion_effectiveness_score = EXCLUDED.persuasion_effectiveness_score,
+                user_intent_match_score = EXCLUDED.user_intent_match_score,
+                persuasion_techniques = EXCLUDED.persuasion_techniques,
+                key_strengths = EXCLUDED.key_strengths,
+                improvement_areas = EXCLUDED.improvement_areas,
+                target_audience = EXCLUDED.target_audience,
+                content_value_score = EXCLUDED.content_value_score,
+                identified_intent = EXCLUDED.identified_intent,
+                has_clear_intro = EXCLUDED.has_clear_intro,
+                has_clear_cta = EXCLUDED.has_clear_cta,
+                problem_solution_structure = EXCLUDED.problem_solution_structure,
+                readability_score = EXCLUDED.readability_score
+            """
+        else:
+            return f"""
+            INSERT OR REPLACE INTO script_analysis (
+                video_id, channel_code, analysis_timestamp,
+                script_quality_score, hook_effectiveness_score, call_to_action_score,
+                persuasion_effectiveness_score, user_intent_match_score,
+                persuasion_techniques, key_strengths, improvement_areas,
+                target_audience, content_value_score, identified_intent,
+                has_clear_intro, has_clear_cta, problem_solution_structure,
+                readability_score
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+            """
+
+    @staticmethod
+    def _script_analysis_params(analysis: ScriptAnalysis) -> tuple:
+        """Query parameters for _script_analysis_query()."""
+        return (
+            analysis.video_id,
+            analysis.channel_code,
+            analysis.analysis_timestamp.isoformat(),
+            analysis.script_quality_score,
+            analysis.hook_effectiveness_score,
+            analysis.call_to_action_score,
+            analysis.persuasion_effectiveness_score,
+            analysis.user_intent_match_score,
+            json.dumps(analysis.persuasion_techniques),
+            json.dumps(analysis.key_strengths),
+            json.dumps(analysis.improvement_areas),
+            analysis.target_audience,
+            analysis.content_value_score,
+            analysis.identified_intent,
+            1 if analysis.has_clear_intro else 0,
+            1 if analysis.has_clear_cta else 0,
+            1 if analysis.problem_solution_structure else 0,
+            analysis.readability_score
+        )
+
     def store_script_analysis(self, analysis: ScriptAnalysis) -> bool:
         """Store script analysis results to local database."""
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
-            p = self._get_placeholder()
-
-            # For PostgreSQL, use ON CONFLICT; for SQLite, use OR REPLACE
-            if self.use_postgres:
-                query = f"""
-                INSERT INTO script_analysis (
-                    video_id, channel_code, analysis_timestamp,
-                    script_quality_score, hook_effectiveness_score, call_to_action_score,
-                    persuasion_effectiveness_score, user_intent_match_score,
-                    persuasion_techniques, key_strengths, improvement_areas,
-                    target_audience, content_value_score, identified_intent,
-                    has_clear_intro, has_clear_cta, problem_solution_structure,
-                    readability_score
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                ON CONFLICT (video_id, analysis_timestamp) DO UPDATE SET
-                    channel_code = EXCLUDED.channel_code,
-                    script_quality_score = EXCLUDED.script_quality_score,
-                    hook_effectiveness_score = EXCLUDED.hook_effectiveness_score,
-                    call_to_action_score = EXCLUDED.call_to_action_score,
-                    persuasion_effectiveness_score = EXCLUDED.persuasion_effectiveness_score,
-                    user_intent_match_score = EXCLUDED.user_intent_match_score,
-                    persuasion_techniques = EXCLUDED.persuasion_techniques,
-                    key_strengths = EXCLUDED.key_strengths,
-                    improvement_areas = EXCLUDED.improvement_areas,
-                    target_audience = EXCLUDED.target_audience,
-                    content_value_score = EXCLUDED.content_value_score,
-                    identified_intent = EXCLUDED.identified_intent,
-                    has_clear_intro = EXCLUDED.has_clear_intro,
-                    has_clear_cta = EXCLUDED.has_clear_cta,
-                    problem_solution_structure = EXCLUDED.problem_solution_structure,
-                    readability_score = EXCLUDED.readability_score
-                """
-            else:
-                query = f"""
-                INSERT OR REPLACE INTO script_analysis (
-                    video_id, channel_code, analysis_timestamp,
-                    script_quality_score, hook_effectiveness_score, call_to_action_score,
-                    persuasion_effectiveness_score, user_intent_match_score,
-                    persuasion_techniques, key_strengths, improvement_areas,
-                    target_audience, content_value_score, identified_intent,
-                    has_clear_intro, has_clear_cta, problem_solution_structure,
-                    readability_score
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                """
-
-            cursor.execute(query, (
-                analysis.video_id,
-                analysis.channel_code,
-                analysis.analysis_timestamp.isoformat(),
-                analysis.script_quality_score,
-                analysis.hook_effectiveness_score,
-                analysis.call_to_action_score,
-                analysis.persuasion_effectiveness_score,
-                analysis.user_intent_match_score,
-                json.dumps(analysis.persuasion_techniques),
-                json.dumps(analysis.key_strengths),
-                json.dumps(analysis.improvement_areas),
-                analysis.target_audience,
-                analysis.content_value_score,
-                analysis.identified_intent,
-                1 if analysis.has_clear_intro else 0,
-                1 if analysis.has_clear_cta else 0,
-                1 if analysis.problem_solution_structure else 0,
-                analysis.readability_score
-            ))
+            cursor.execute(self._script_analysis_query(), self._script_analysis_params(analysis))
 
             conn.commit()
             conn.close()
@@ -487,6 +494,36 @@ class LocalDBService:
             logger.error(f"Error storing script analysis: {str(e)}")
             return False
 
+    def _affiliate_recommendation_query(self) -> str:
+        """Insert statement for one affiliate_recommendations row."""
+        p = self._get_placeholder()
+        return f"""
+        INSERT INTO affiliate_recommendations (
+            video_id, recommendation_timestamp, product_rank,
+            product_name, product_category, relevance_score,
+            conversion_probability, recommendation_reasoning,
+            where_to_mention, mentioned_in_video, amazon_asin, price_range
+        ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+        """
+
+    @staticmethod
+    def _affiliate_recommendation_params(rec: AffiliateRecommendation) -> tuple:
+        """Query parameters for _affiliate_recommendation_query()."""
+        return (
+            rec.video_id,
+            rec.recommendation_timestamp.isoformat(),
+            rec.product_rank,
+            rec.product_name,
+            rec.product_category,
+            rec.relevance_score,
+            rec.conversion_probability,
+            rec.recommendation_reasoning,
+            rec.where_to_mention,
+            1 if rec.mentioned_in_video else 0,
+            rec.amazon_asin,
+            rec.price_range
+        )
+
     def store_affiliate_recommendations(self, recommendations: List[AffiliateRecommendation]) -> bool:
         """Store affiliate recommendations to local database."""
         try:
@@ -502,28 +539,10 @@ class LocalDBService:
                 )
 
             # Insert new recommendations
-            for rec in recommendations:
-                cursor.execute(f"""
-                INSERT INTO affiliate_recommendations (
-                    video_id, recommendation_timestamp, product_rank,
-                    product_name, product_category, relevance_score,
-                    conversion_probability, recommendation_reasoning,
-                    where_to_mention, mentioned_in_video, amazon_asin, price_range
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                """, (
-                    rec.video_id,
-                    rec.recommendation_timestamp.isoformat(),
-                    rec.product_rank,
-                    rec.product_name,
-                    rec.product_category,
-                    rec.relevance_score,
-                    rec.conversion_probability,
-                    rec.recommendation_reasoning,
-                    rec.where_to_mention,
-                    1 if rec.mentioned_in_video else 0,
-                    rec.amazon_asin,
-                    rec.price_range
-                ))
+            cursor.executemany(
+                self._affiliate_recommendation_query(),
+                [self._affiliate_recommendation_params(rec) for rec in recommendations]
+            )
 
             conn.commit()
             conn.close()
@@ -534,73 +553,152 @@ class LocalDBService:
             logger.error(f"Error storing affiliate recommendations: {str(e)}")
             return False
 
+    def store_analysis_batch(
+        self,
+        script_analyses: List[ScriptAnalysis] = (),
+        description_analyses: List[DescriptionAnalysis] = (),
+        conversion_analyses: List[ConversionAnalysis] = (),
+        affiliate_recommendations: List[AffiliateRecommendation] = ()
+    ) -> bool:
+        """
+        Store many analysis results in one connection and transaction.
+
+        Each video's affiliate recommendations replace its previous ones, as
+        in store_affiliate_recommendations().
+
+        Args:
+            script_analyses: ScriptAnalysis rows to upsert
+            description_analyses: DescriptionAnalysis rows to upsert
+            conversion_analyses: ConversionAnalysis rows to upsert
+            affiliate_recommendations: Recommendations for any number of videos
+
+        Returns:
+            True if everything was stored, False otherwise (nothing is stored)
+        """
+        if not (script_analyses or description_analyses or conversion_analyses or affiliate_recommendations):
+            return True
+
+        try:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                p = self._get_placeholder()
+
+                if script_analyses:
+                    cursor.executemany(
+                        self._script_analysis_query(),
+                        [self._script_analysis_params(a) for a in script_analyses]
+                    )
+                if description_analyses:
+                    cursor.executemany(
+                        self._description_analysis_query(),
+                        [self._description_analysis_params(a) for a in description_analyses]
+                    )
+                if conversion_analyses:
+                    cursor.executemany(
+                        self._conversion_analysis_query(),
+                        [self._conversion_analysis_params(a) for a in conversion_analyses]
+                    )
+                if affiliate_recommendations:
+                    video_ids = dict.fromkeys(rec.video_id for rec in affiliate_recommendations)
+                    cursor.executemany(
+                        f"DELETE FROM affiliate_recommendations WHERE video_id = {p}",
+                        [(video_id,) for video_id in video_ids]
+                    )
+                    cursor.executemany(
+                        self._affiliate_recommendation_query(),
+                        [self._affiliate_recommendation_params(rec) for rec in affiliate_recommendations]
+                    )
+
+                conn.commit()
+            finally:
+                conn.close()
+
+            logger.info(
+                f"Stored analysis batch: {len(script_analyses)} script, "
+                f"{len(description_analyses)} description, {len(conversion_analyses)} conversion, "
+                f"{len(affiliate_recommendations)} affiliate rows"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error storing analysis batch: {str(e)}")
+            return False
+
+    def _description_analysis_query(self) -> str:
+        """Upsert statement for one description_analysis row."""
+        p = self._get_placeholder()
+
+        if self.use_postgres:
+            return f"""
+            INSERT INTO description_analysis (
+                video_id, analysis_timestamp, cta_effectiveness_score,
+                description_quality_score, seo_score, total_links,
+                affiliate_links, link_positioning_score, has_clear_cta,
+                optimization_suggestions, missing_elements, strengths,
+                yt_total_views, yt_total_impressions, yt_overall_ctr,
+                yt_by_traffic_source, main_keyword, silo
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+            ON CONFLICT (video_id, analysis_timestamp) DO UPDATE SET
+                cta_effectiveness_score = EXCLUDED.cta_effectiveness_score,
+                description_quality_score = EXCLUDED.description_quality_score,
+                seo_score = EXCLUDED.seo_score,
+                total_links = EXCLUDED.total_links,
+                affiliate_links = EXCLUDED.affiliate_links,
+                link_positioning_score = EXCLUDED.link_positioning_score,
+                has_clear_cta = EXCLUDED.has_clear_cta,
+                optimization_suggestions = EXCLUDED.optimization_suggestions,
+                missing_elements = EXCLUDED.missing_elements,
+                strengths = EXCLUDED.strengths,
+                yt_total_views = EXCLUDED.yt_total_views,
+                yt_total_impressions = EXCLUDED.yt_total_impressions,
+                yt_overall_ctr = EXCLUDED.yt_overall_ctr,
+                yt_by_traffic_source = EXCLUDED.yt_by_traffic_source,
+                main_keyword = EXCLUDED.main_keyword,
+                silo = EXCLUDED.silo
+            """
+        else:
+            return f"""
+            INSERT OR REPLACE INTO description_analysis (
+                video_id, analysis_timestamp, cta_effectiveness_score,
+                description_quality_score, seo_score, total_links,
+                affiliate_links, link_positioning_score, has_clear_cta,
+                optimization_suggestions, missing_elements, strengths,
+                yt_total_views, yt_total_impressions, yt_overall_ctr,
+                yt_by_traffic_source, main_keyword, silo
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+            """
+
+    @staticmethod
+    def _description_analysis_params(analysis: DescriptionAnalysis) -> tuple:
+        """Query parameters for _description_analysis_query()."""
+        return (
+            analysis.video_id,
+            analysis.analysis_timestamp.isoformat(),
+            analysis.cta_effectiveness_score,
+            analysis.description_quality_score,
+            analysis.seo_score,
+            analysis.total_links,
+            analysis.affiliate_links,
+            analysis.link_positioning_score,
+            1 if analysis.has_clear_cta else 0,
+            json.dumps(analysis.optimization_suggestions),
+            json.dumps(analysis.missing_elements),
+            json.dumps(analysis.strengths),
+            analysis.yt_total_views,
+            analysis.yt_total_impressions,
+            analysis.yt_overall_ctr,
+            json.dumps(analysis.yt_by_traffic_source),
+            analysis.main_keyword,
+            analysis.silo
+        )
+
     def store_description_analysis(self, analysis: DescriptionAnalysis) -> bool:
         """Store description analysis to local database."""
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
-            p = self._get_placeholder()
-
-            if self.use_postgres:
-                query = f"""
-                INSERT INTO description_analysis (
-                    video_id, analysis_timestamp, cta_effectiveness_score,
-                    description_quality_score, seo_score, total_links,
-                    affiliate_links, link_positioning_score, has_clear_cta,
-                    optimization_suggestions, missing_elements, strengths,
-                    yt_total_views, yt_total_impressions, yt_overall_ctr,
-                    yt_by_traffic_source, main_keyword, silo
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                ON CONFLICT (video_id, analysis_timestamp) DO UPDATE SET
-                    cta_effectiveness_score = EXCLUDED.cta_effectiveness_score,
-                    description_quality_score = EXCLUDED.description_quality_score,
-                    seo_score = EXCLUDED.seo_score,
-                    total_links = EXCLUDED.total_links,
-                    affiliate_links = EXCLUDED.affiliate_links,
-                    link_positioning_score = EXCLUDED.link_positioning_score,
-                    has_clear_cta = EXCLUDED.has_clear_cta,
-                    optimization_suggestions = EXCLUDED.optimization_suggestions,
-                    missing_elements = EXCLUDED.missing_elements,
-                    strengths = EXCLUDED.strengths,
-                    yt_total_views = EXCLUDED.yt_total_views,
-                    yt_total_impressions = EXCLUDED.yt_total_impressions,
-                    yt_overall_ctr = EXCLUDED.yt_overall_ctr,
-                    yt_by_traffic_source = EXCLUDED.yt_by_traffic_source,
-                    main_keyword = EXCLUDED.main_keyword,
-                    silo = EXCLUDED.silo
-                """
-            else:
-                query = f"""
-                INSERT OR REPLACE INTO description_analysis (
-                    video_id, analysis_timestamp, cta_effectiveness_score,
-                    description_quality_score, seo_score, total_links,
-                    affiliate_links, link_positioning_score, has_clear_cta,
-                    optimization_suggestions, missing_elements, strengths,
-                    yt_total_views, yt_total_impressions, yt_overall_ctr,
-                    yt_by_traffic_source, main_keyword, silo
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                """
-
-            cursor.execute(query, (
-                analysis.video_id,
-                analysis.analysis_timestamp.isoformat(),
-                analysis.cta_effectiveness_score,
-                analysis.description_quality_score,
-                analysis.seo_score,
-                analysis.total_links,
-                analysis.affiliate_links,
-                analysis.link_positioning_score,
-                1 if analysis.has_clear_cta else 0,
-                json.dumps(analysis.optimization_suggestions),
-                json.dumps(analysis.missing_elements),
-                json.dumps(analysis.strengths),
-                analysis.yt_total_views,
-                analysis.yt_total_impressions,
-                analysis.yt_overall_ctr,
-                json.dumps(analysis.yt_by_traffic_source),
-                analysis.main_keyword,
-                analysis.silo
-            ))
+            cursor.execute(self._description_analysis_query(), self._description_analysis_params(analysis))
 
             conn.commit()
             conn.close()
@@ -611,59 +709,66 @@ class LocalDBService:
             logger.error(f"Error storing description analysis: {str(e)}")
             return False
 
+    def _conversion_analysis_query(self) -> str:
+        """Upsert statement for one conversion_analysis row."""
+        p = self._get_placeholder()
+
+        if self.use_postgres:
+            return f"""
+            INSERT INTO conversion_analysis (
+                video_id, analysis_timestamp, metrics_date,
+                revenue, clicks, sales, views,
+                conversion_rate, revenue_per_click, revenue_per_1k_views,
+                conversion_drivers, underperformance_reasons, recommendations
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+            ON CONFLICT (video_id, analysis_timestamp) DO UPDATE SET
+                metrics_date = EXCLUDED.metrics_date,
+                revenue = EXCLUDED.revenue,
+                clicks = EXCLUDED.clicks,
+                sales = EXCLUDED.sales,
+                views = EXCLUDED.views,
+                conversion_rate = EXCLUDED.conversion_rate,
+                revenue_per_click = EXCLUDED.revenue_per_click,
+                revenue_per_1k_views = EXCLUDED.revenue_per_1k_views,
+                conversion_drivers = EXCLUDED.conversion_drivers,
+                underperformance_reasons = EXCLUDED.underperformance_reasons,
+                recommendations = EXCLUDED.recommendations
+            """
+        else:
+            return f"""
+            INSERT OR REPLACE INTO conversion_analysis (
+                video_id, analysis_timestamp, metrics_date,
+                revenue, clicks, sales, views,
+                conversion_rate, revenue_per_click, revenue_per_1k_views,
+                conversion_drivers, underperformance_reasons, recommendations
+            ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
+            """
+
+    @staticmethod
+    def _conversion_analysis_params(analysis: ConversionAnalysis) -> tuple:
+        """Query parameters for _conversion_analysis_query()."""
+        return (
+            analysis.video_id,
+            analysis.analysis_timestamp.isoformat(),
+            analysis.metrics_date.isoformat() if analysis.metrics_date else None,
+            analysis.revenue,
+            analysis.clicks,
+            analysis.sales,
+            analysis.views,
+            analysis.conversion_rate,
+            analysis.revenue_per_click,
+            analysis.revenue_per_1k_views,
+            json.dumps(analysis.conversion_drivers),
+            json.dumps(analysis.underperformance_reasons),
+            json.dumps(analysis.recommendations)
+        )
+
     def store_conversion_analysis(self, analysis: ConversionAnalysis) -> bool:
         """Store conversion analysis to local database."""
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
-            p = self._get_placeholder()
-
-            if self.use_postgres:
-                query = f"""
-                INSERT INTO conversion_analysis (
-                    video_id, analysis_timestamp, metrics_date,
-                    revenue, clicks, sales, views,
-                    conversion_rate, revenue_per_click, revenue_per_1k_views,
-                    conversion_drivers, underperformance_reasons, recommendations
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                ON CONFLICT (video_id, analysis_timestamp) DO UPDATE SET
-                    metrics_date = EXCLUDED.metrics_date,
-                    revenue = EXCLUDED.revenue,
-                    clicks = EXCLUDED.clicks,
-                    sales = EXCLUDED.sales,
-                    views = EXCLUDED.views,
-                    conversion_rate = EXCLUDED.conversion_rate,
-                    revenue_per_click = EXCLUDED.revenue_per_click,
-                    revenue_per_1k_views = EXCLUDED.revenue_per_1k_views,
-                    conversion_drivers = EXCLUDED.conversion_drivers,
-                    underperformance_reasons = EXCLUDED.underperformance_reasons,
-                    recommendations = EXCLUDED.recommendations
-                """
-            else:
-                query = f"""
-                INSERT OR REPLACE INTO conversion_analysis (
-                    video_id, analysis_timestamp, metrics_date,
-                    revenue, clicks, sales, views,
-                    conversion_rate, revenue_per_click, revenue_per_1k_views,
-                    conversion_drivers, underperformance_reasons, recommendations
-                ) VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p}, {p})
-                """
-
-            cursor.execute(query, (
-                analysis.video_id,
-                analysis.analysis_timestamp.isoformat(),
-                analysis.metrics_date.isoformat() if analysis.metrics_date else None,
-                analysis.revenue,
-                analysis.clicks,
-                analysis.sales,
-                analysis.views,
-                analysis.conversion_rate,
-                analysis.revenue_per_click,
-                analysis.revenue_per_1k_views,
-                json.dumps(analysis.conversion_drivers),
-                json.dumps(analysis.underperformance_reasons),
-                json.dumps(analysis.recommendations)
-            ))
+            cursor.execute(self._conversion_analysis_query(), self._conversion_analysis_params(analysis))
 
             conn.commit()
             conn.close()
@@ -846,6 +951,45 @@ class LocalDBService:
             logger.error(f"Error checking analysis: {str(e)}")
             return False
 
+    def list_analyzed_video_ids(self) -> List[str]:
+        """Get the IDs of all videos with at least one script analysis."""
+        try:
+            rows = self._execute_query(
+                "SELECT DISTINCT video_id FROM script_analysis", fetch='all'
+            )
+            return [row['video_id'] for row in (rows or [])]
+
+        except Exception as e:
+            logger.error(f"Error listing analyzed videos: {str(e)}")
+            return []
+
+    def get_script_analysis_summary(self, video_ids: list) -> Dict[str, datetime]:
+        """Get the latest script analysis time for multiple videos in one query.
+
+        Returns:
+            Dict mapping video_id -> latest analysis_timestamp
+            (videos without a script analysis are omitted)
+        """
+        if not video_ids:
+            return {}
+        try:
+            placeholders = ','.join(['?' for _ in video_ids])
+            rows = self._execute_query(f"""
+            SELECT video_id, MAX(analysis_timestamp) AS latest_analysis
+            FROM script_analysis
+            WHERE video_id IN ({placeholders})
+            GROUP BY video_id
+            """, tuple(video_ids), fetch='all')
+
+            return {
+                row['video_id']: datetime.fromisoformat(row['latest_analysis'])
+                for row in (rows or [])
+            }
+
+        except Exception as e:
+            logger.error(f"Error fetching script analysis summary: {str(e)}")
+            return {}
+
     # ==================== TRANSCRIPT METHODS ====================
 
     def store_transcript(self, video_id: str, title: str, channel: str,
@@ -1007,6 +1151,37 @@ class LocalDBService:
             logger.error(f"Error checking transcript: {str(e)}")
             return False
 
+    def get_transcripts_summary_batch(self, video_ids: list) -> dict:
+        """Get lightweight transcript info for multiple videos in one query.
+
+        Returns:
+            Dict mapping video_id -> {has_transcript, provider, duration_seconds, word_count}
+            (videos without a stored transcript are omitted)
+        """
+        if not video_ids:
+            return {}
+        try:
+            placeholders = ','.join(['?' for _ in video_ids])
+            rows = self._execute_query(f"""
+            SELECT video_id, provider, duration_seconds, word_count
+            FROM video_transcripts
+            WHERE video_id IN ({placeholders})
+            """, tuple(video_ids), fetch='all')
+
+            result = {}
+            for row in (rows or []):
+                result[row['video_id']] = {
+                    'has_transcript': True,
+                    'provider': row['provider'],
+                    'duration_seconds': row['duration_seconds'],
+                    'word_count': row['word_count'],
+                }
+            return result
+
+        except Exception as e:
+            logger.error(f"Error fetching transcripts summary: {str(e)}")
+            return {}
+
     def delete_transcript(self, video_id: str) -> bool:
         """Delete transcript for a video (for re-transcription)."""
         try:
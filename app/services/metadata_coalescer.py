@@ -0,0 +1,122 @@
+"""Request coalescing for per-video BigQuery metadata lookups."""
+import logging
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCoalescer:
+    """
+    Collapse concurrent single-video metadata lookups into one batched query.
+
+    Detail page views each need metadata for one video. Instead of issuing a
+    BigQuery query per view, lookups arriving within a short window are
+    collected and fetched together with get_video_metadata_batch(). Results
+    are also kept in a small in-process TTL cache so repeated views of the
+    same video skip BigQuery entirely.
+    """
+
+    def __init__(self, bigquery_service, window_seconds: float = 0.05,
+                 ttl_seconds: int = 60, wait_timeout: float = 30.0,
+                 on_fetched: Optional[Callable[[Dict[str, Dict]], None]] = None):
+        """
+        Initialize the coalescer and start its flusher thread.
+
+        Args:
+            bigquery_service: BigQueryService used for batched lookups
+            window_seconds: How long to collect video IDs before querying
+            ttl_seconds: How long fetched metadata is reused
+            wait_timeout: Max seconds a caller waits before querying on its own
+            on_fetched: Optional callback receiving each non-empty batch result
+                        (e.g. to warm a shared cache)
+        """
+        self.bigquery = bigquery_service
+        self.window_seconds = window_seconds
+        self.ttl_seconds = ttl_seconds
+        self.wait_timeout = wait_timeout
+        self.on_fetched = on_fetched
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        self._wakeup = threading.Event()
+
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name='metadata-coalescer', daemon=True
+        )
+        self._flusher.start()
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        Get metadata for one video (see BigQueryService.get_video_metadata_batch).
+
+        Returns:
+            Metadata dict, or None if the video wasn't found
+
+        Raises:
+            Whatever the batched BigQuery query raised, so callers can tell a
+            failed lookup from a missing video
+        """
+        with self._lock:
+            hit = self._cache.get(video_id)
+            if hit and hit[0] > time.monotonic():
+                return hit[1]
+
+            future = self._pending.get(video_id)
+            if future is None:
+                future = Future()
+                self._pending[video_id] = future
+                self._wakeup.set()
+
+        try:
+            return future.result(timeout=self.wait_timeout)
+        except FutureTimeoutError:
+            logger.warning(f"Coalesced metadata lookup timed out for {video_id}, querying directly")
+            return self.bigquery.get_video_metadata_batch([video_id], raise_errors=True).get(video_id)
+
+    def _flush_loop(self):
+        """Background loop: batch pending lookups into one query per window."""
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.window_seconds)
+
+            with self._lock:
+                pending = self._pending
+                self._pending = {}
+                self._wakeup.clear()
+
+            if not pending:
+                continue
+
+            try:
+                metadata = self.bigquery.get_video_metadata_batch(list(pending), raise_errors=True)
+            except Exception as e:
+                for future in pending.values():
+                    future.set_exception(e)
+                continue
+
+            # Failed queries raised above, so missing videos are cached as None
+            expires_at = time.monotonic() + self.ttl_seconds
+            with self._lock:
+                self._prune_expired()
+                for video_id in pending:
+                    self._cache[video_id] = (expires_at, metadata.get(video_id))
+
+            for video_id, future in pending.items():
+                future.set_result(metadata.get(video_id))
+
+            if metadata and self.on_fetched:
+                try:
+                    self.on_fetched(metadata)
+                except Exception as e:
+                    logger.warning(f"Metadata on_fetched callback failed: {str(e)}")
+
+    def _prune_expired(self):
+        """Drop expired cache entries (caller holds the lock)."""
+        now = time.monotonic()
+        expired = [vid for vid, (expires_at, _) in self._cache.items() if expires_at <= now]
+        for vid in expired:
+            del self._cache[vid]
@@ -13,6 +13,7 @@ Final Output = Quality Score x Context Multiplier
 from anthropic import Anthropic
 import json
 import math
+from contextlib import nullcontext
 import re
 import statistics
 from datetime import datetime
@@ -63,8 +64,11 @@ class ScriptScoringService:
 
     def __init__(self, api_key: str, local_db, bigquery_service,
                  model: str = "claude-sonnet-4-20250514",
-                 prompt_version: str = "1.0"):
-        self.client = Anthropic(api_key=api_key)
+                 prompt_version: str = "1.0", client: Optional[Anthropic] = None,
+                 request_gate=None):
+        self.client = client or Anthropic(api_key=api_key)
+        # Entered around each Claude request with its prompt (e.g. a rate limiter)
+        self.request_gate = request_gate or (lambda *texts: nullcontext())
         self.model = model
         self.local_db = local_db
         self.bigquery = bigquery_service
@@ -328,12 +332,13 @@ Return ONLY valid JSON:
 }}"""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1500,
-                temperature=0.2,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with self.request_gate(prompt):
+                message = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=1500,
+                    temperature=0.2,
+                    messages=[{"role": "user", "content": prompt}]
+                )
 
             response_text = self._parse_json_response(message.content[0].text)
             data = json.loads(response_text)
@@ -535,12 +540,13 @@ Return ONLY valid JSON:
 
         try:
             logger.info(f"Scoring quality dimensions (transcript: {len(transcript)} chars)...")
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                temperature=0.3,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with self.request_gate(prompt):
+                message = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=3000,
+                    temperature=0.3,
+                    messages=[{"role": "user", "content": prompt}]
+                )
 
             response_text = self._parse_json_response(message.content[0].text)
             data = json.loads(response_text)
@@ -1030,12 +1036,13 @@ Return ONLY valid JSON:
 }}"""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                temperature=0.2,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with self.request_gate(prompt):
+                message = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=1000,
+                    temperature=0.2,
+                    messages=[{"role": "user", "content": prompt}]
+                )
             response_text = self._parse_json_response(message.content[0].text)
             data = json.loads(response_text)
 
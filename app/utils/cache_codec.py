@@ -0,0 +1,106 @@
+"""Compact cache serialization for model objects.
+
+Flask-Caching pickles whatever is stored, which is slow and bulky for large
+dataclass graphs. These helpers store models as JSON bytes built from their
+to_dict() output and rebuild them with from_dict() on read.
+
+Keys written here carry a version suffix (e.g. video_detail_v2_) so they never
+collide with the pickled objects older releases stored; anything unreadable is
+still treated as a miss.
+"""
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.extensions import cache
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+    import json
+
+logger = logging.getLogger(__name__)
+
+
+def _default(value):
+    """Encode types the JSON encoder doesn't handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(obj) -> bytes:
+    """Serialize plain data to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+def loads(raw):
+    """Deserialize JSON bytes produced by dumps()."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def fast_cache_set(key: str, obj, timeout: int = None):
+    """
+    Cache a model, or a list of models, as JSON bytes.
+
+    Args:
+        key: Cache key
+        obj: Object (or list of objects) with a to_dict() method
+        timeout: Cache timeout in seconds
+    """
+    if isinstance(obj, list):
+        payload = [item.to_dict() for item in obj]
+    else:
+        payload = obj.to_dict()
+    cache.set(key, dumps(payload), timeout=timeout)
+
+
+def decode_cached(raw, cls, key: str = None):
+    """
+    Rebuild a model, or a list of models, from a raw fast_cache_set() payload.
+
+    Useful when the payload was fetched alongside other keys with get_many().
+    A payload that can't be decoded (corrupt, or an object pickled by an
+    older release) is logged and treated as a miss.
+
+    Args:
+        raw: Cached JSON bytes (or None)
+        cls: Model class with a from_dict() classmethod
+        key: Cache key the payload came from; deleted if it can't be decoded
+
+    Returns:
+        Rebuilt object or list, or None if raw is None or unreadable
+    """
+    if raw is None:
+        return None
+    try:
+        data = loads(raw)
+        if isinstance(data, list):
+            return [cls.from_dict(item) for item in data]
+        return cls.from_dict(data)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Discarding unreadable cached {cls.__name__} ({key or 'unknown key'}): {str(e)}")
+        if key:
+            cache.delete(key)
+        return None
+
+
+def fast_cache_get(key: str, cls):
+    """
+    Read a model, or a list of models, stored with fast_cache_set().
+
+    Args:
+        key: Cache key
+        cls: Model class with a from_dict() classmethod
+
+    Returns:
+        Rebuilt object or list, or None on cache miss
+    """
+    return decode_cached(cache.get(key), cls, key)
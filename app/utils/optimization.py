@@ -0,0 +1,43 @@
+"""Optimization opportunity scoring.
+
+Optimization opportunity = (Revenue Potential - Current Revenue) x (100 - Quality Score) / 100,
+with the revenue gap floored at zero and missing values treated as zero.
+"""
+import numpy as np
+
+
+def compute_optimization_opportunity(revenue_potential, current_revenue, quality_score):
+    """
+    Compute the optimization opportunity for a single video.
+
+    Args:
+        revenue_potential: Revenue potential for the video's keyword
+        current_revenue: Current average monthly revenue
+        quality_score: Script quality score (0-100)
+
+    Returns:
+        Opportunity in dollars, rounded to cents
+    """
+    gap = max((revenue_potential or 0) - (current_revenue or 0), 0)
+    return round(gap * (100 - (quality_score or 0)) / 100, 2)
+
+
+def compute_optimization_opportunities(revenue_potentials, current_revenues, quality_scores):
+    """
+    Vectorized compute_optimization_opportunity() for many videos at once.
+
+    Args:
+        revenue_potentials: Sequence of revenue potentials (None allowed)
+        current_revenues: Sequence of current monthly revenues (None allowed)
+        quality_scores: Sequence of script quality scores (None allowed)
+
+    Returns:
+        List of opportunities (floats rounded to cents), in input order
+    """
+    rp = np.nan_to_num(np.array(revenue_potentials, dtype=np.float64))
+    cr = np.nan_to_num(np.array(current_revenues, dtype=np.float64))
+    q = np.nan_to_num(np.array(quality_scores, dtype=np.float64))
+    gap = np.maximum(rp - cr, 0)
+    # Round the Python floats with built-in round(), like the scalar version
+    # (np.round differs on some ties)
+    return [round(value, 2) for value in (gap * (100 - q) / 100).tolist()]
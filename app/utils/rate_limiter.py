@@ -0,0 +1,45 @@
+"""Thread-safe token bucket for pacing outbound API requests."""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Allow up to `rate_per_minute` requests (or other units, e.g. prompt
+    tokens) per minute, with bursts.
+
+    acquire() only blocks when the bucket is empty, and then only until the
+    next token is due, so callers never wait longer than the limit requires.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate_per_minute: Sustained requests allowed per minute
+            capacity: Max burst size (defaults to one minute's worth)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, float(rate_per_minute))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1):
+        """
+        Take `amount` tokens, sleeping until they are available.
+
+        Args:
+            amount: Tokens to take (capped at the bucket capacity)
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
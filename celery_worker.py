@@ -0,0 +1,19 @@
+"""Celery worker entry point.
+
+Run with: celery -A celery_worker worker --loglevel=info
+Requires CELERY_BROKER_URL to be set.
+"""
+import os
+
+# The web process keeps the dashboard cache warm; workers don't need their
+# own copy of the refresh scheduler
+os.environ['DASHBOARD_REFRESH_ENABLED'] = 'false'
+
+from app import create_app
+
+# Get configuration from environment or default to development
+config_name = os.getenv('FLASK_ENV', 'development')
+
+# Create Flask application (also configures Celery and registers tasks)
+app = create_app(config_name)
+celery = app.extensions['celery']
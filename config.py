@@ -31,12 +31,58 @@ class Config:
     CACHE_TYPE = os.getenv('CACHE_TYPE', 'simple')
     CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300))
 
+    # Dashboard overview refresh (background job)
+    DASHBOARD_REFRESH_MINUTES = int(os.getenv('DASHBOARD_REFRESH_MINUTES', 5))
+    DASHBOARD_CACHE_TIMEOUT = int(os.getenv('DASHBOARD_CACHE_TIMEOUT', 600))
+    # Only the web process should run the refresh scheduler; workers and
+    # scripts that create the app turn it off
+    DASHBOARD_REFRESH_ENABLED = os.getenv('DASHBOARD_REFRESH_ENABLED', 'true').lower() == 'true'
+    # Web workers race for this file lock; only the winner runs the refresh
+    # (defaults to a file in the system temp directory)
+    DASHBOARD_REFRESH_LOCK_FILE = os.getenv('DASHBOARD_REFRESH_LOCK_FILE')
+
+    # Per-video BigQuery metadata (detail page) cache lifetime in seconds
+    VIDEO_META_CACHE_TIMEOUT = int(os.getenv('VIDEO_META_CACHE_TIMEOUT', 300))
+
+    # Per-video BigQuery reads (video, transcript, revenue, YT Analytics)
+    # reused when a video is re-analyzed, in seconds
+    ANALYSIS_FETCH_CACHE_TIMEOUT = int(os.getenv('ANALYSIS_FETCH_CACHE_TIMEOUT', 300))
+
+    # AI results (affiliate recommendations, script/description/conversion
+    # analyses) are reused while their inputs are unchanged
+    RECOMMENDATION_CACHE_TIMEOUT = int(os.getenv('RECOMMENDATION_CACHE_TIMEOUT', 86400))
+
     # Pagination
     VIDEOS_PER_PAGE = int(os.getenv('VIDEOS_PER_PAGE', 25))
 
     # Analysis settings
     MAX_CONCURRENT_ANALYSES = int(os.getenv('MAX_CONCURRENT_ANALYSES', 5))
-    ANALYSIS_RATE_LIMIT_SECONDS = int(os.getenv('ANALYSIS_RATE_LIMIT_SECONDS', 2))
+    ANALYSIS_QUEUE_SIZE = int(os.getenv('ANALYSIS_QUEUE_SIZE', 20))  # Waiting jobs beyond the running ones
+    # The Claude limits below are per process (each gunicorn worker and the
+    # Celery worker keeps its own). Divide the Anthropic tier limits by the
+    # number of processes that run analyses.
+    # Claude requests in flight at once across this process's analyses
+    # (steps of one video run concurrently)
+    ANTHROPIC_MAX_CONCURRENT_REQUESTS = int(os.getenv('ANTHROPIC_MAX_CONCURRENT_REQUESTS', 4))
+    # Claude analyzer calls per minute in this process (token bucket)
+    ANTHROPIC_REQUESTS_PER_MINUTE = int(os.getenv('ANTHROPIC_REQUESTS_PER_MINUTE', 50))
+    # Estimated prompt tokens per minute in this process (second token
+    # bucket for the input-tokens rate limit; 0 disables it)
+    ANTHROPIC_INPUT_TOKENS_PER_MINUTE = int(os.getenv('ANTHROPIC_INPUT_TOKENS_PER_MINUTE', 0))
+    # Retries (exponential backoff with jitter) for rate-limited, overloaded
+    # or failed Claude requests
+    ANTHROPIC_MAX_RETRIES = int(os.getenv('ANTHROPIC_MAX_RETRIES', 4))
+    # Score script and description in one Claude request when both are
+    # requested (halves those requests against the rate limit)
+    ANALYSIS_COMBINE_SCRIPT_DESCRIPTION = os.getenv('ANALYSIS_COMBINE_SCRIPT_DESCRIPTION', 'false').lower() == 'true'
+    # Likewise for script and conversion analysis (used when the script isn't
+    # already combined with the description)
+    ANALYSIS_COMBINE_SCRIPT_CONVERSION = os.getenv('ANALYSIS_COMBINE_SCRIPT_CONVERSION', 'false').lower() == 'true'
+
+    # Celery broker for background analyses (e.g. redis://...). When unset,
+    # analyses run on the in-process thread pool instead. Workers share
+    # progress flags through the cache, so use a shared cache (Redis) with it.
+    CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
 
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -80,6 +126,7 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     CACHE_TYPE = 'simple'
+    DASHBOARD_REFRESH_ENABLED = False
 
 
 # Configuration dictionary